@@ -3,42 +3,245 @@ AI Backend - 複数のAIバックエンドに対応
 """
 
 import os
-import json
+import atexit
+import asyncio
+import hashlib
+import datetime
+import time
+import tempfile
+import contextlib
+import threading
 import subprocess
 from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
 from dotenv import load_dotenv
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 # 環境変数読み込み
 load_dotenv()
 
 
+# レート制限（HTTP 429）を受けたときの再試行回数と、Retry-After がない場合の待ち時間の基準（秒）
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 1.0
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """レート制限（HTTP 429）による例外か（anthropic は status_code、google は code に入る）"""
+    return getattr(error, 'status_code', None) == 429 or getattr(error, 'code', None) == 429
+
+
+def _is_not_found_error(error: Exception) -> bool:
+    """対象が見つからない（HTTP 404）ことによる例外か（期限切れのコンテキストキャッシュなど）"""
+    return getattr(error, 'code', None) == 404 or getattr(error, 'status_code', None) == 404
+
+
+def _rate_limit_delay(error: Exception, attempt: int) -> float:
+    """再試行までの待ち時間（Retry-After ヘッダーがあればそれに従う）"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return RATE_LIMIT_BACKOFF * (2 ** attempt)
+
+
+class _AdaptiveLimiter:
+    """AIMD で同時実行数を調整するセマフォ（429 で半減、成功で +0.5）"""
+
+    class _Slot:
+        rate_limited = False
+
+    def __init__(self, limit: int):
+        self.max_limit = max(1, limit)
+        self.limit = float(self.max_limit)
+        self.active = 0
+        self._condition = asyncio.Condition()
+
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < int(self.limit))
+            self.active += 1
+        slot = self._Slot()
+        succeeded = False
+        try:
+            yield slot
+            succeeded = not slot.rate_limited
+        finally:
+            async with self._condition:
+                self.active -= 1
+                if slot.rate_limited:
+                    self.limit = max(1.0, self.limit / 2)
+                elif succeeded:
+                    self.limit = min(float(self.max_limit), self.limit + 0.5)
+                self._condition.notify_all()
+
+
 class AIBackend(ABC):
     """AI バックエンドの抽象基底クラス"""
 
     @abstractmethod
-    def generate(self, prompt: str) -> str:
-        """テキスト生成"""
+    def generate(self, prompt: str, cached_prefix: str = None) -> str:
+        """
+        テキスト生成
+
+        Args:
+            prompt: 生成プロンプト（呼び出しごとに変わる部分）
+            cached_prefix: 複数回の呼び出しで共通の前置き（Few-Shot例・指示など）
+                           キャッシュに対応したバックエンドではキャッシュ対象として送信する
+        """
         pass
 
-    def generate_json(self, prompt: str) -> dict:
+    async def generate_async(self, prompt: str, cached_prefix: str = None) -> str:
+        """非同期テキスト生成（非同期APIを持たないバックエンドはスレッドで実行）"""
+        return await asyncio.to_thread(self.generate, prompt, cached_prefix)
+
+    def generate_many(
+        self,
+        prompts: List[str],
+        concurrency: int = 8,
+        cached_prefix: str = None,
+    ) -> List[Union[str, Exception]]:
+        """
+        複数プロンプトを同時実行数を制限しながら並列に生成
+
+        Args:
+            prompts: 生成プロンプトのリスト
+            concurrency: 同時に実行するリクエスト数の上限
+            cached_prefix: 全プロンプト共通の前置き
+
+        Returns:
+            prompts と同じ順序の結果リスト（失敗した要素には例外オブジェクトが入る）
+        """
+        return self._run_many(self.generate_async, prompts, concurrency, cached_prefix)
+
+    def _run_many(self, generate_async, prompts: List[str], concurrency: int, cached_prefix: str = None) -> list:
+        """
+        generate_async 系のメソッドを同時実行数を制限しながら全プロンプトに適用
+
+        レート制限（HTTP 429）を受けたら同時実行数を半分にし、待ってから再試行する。
+        成功するたびに同時実行数を 0.5 ずつ戻す（上限は concurrency）。
+        """
+        async def run_all():
+            limiter = _AdaptiveLimiter(concurrency)
+
+            async def run_one(prompt):
+                for attempt in range(RATE_LIMIT_RETRIES + 1):
+                    async with limiter.slot() as slot:
+                        try:
+                            return await generate_async(prompt, cached_prefix=cached_prefix)
+                        except Exception as e:
+                            if attempt == RATE_LIMIT_RETRIES or not _is_rate_limit_error(e):
+                                raise
+                            slot.rate_limited = True
+                            delay = _rate_limit_delay(e, attempt)
+                    # 待っている間は枠を空けておく
+                    await asyncio.sleep(delay)
+
+            try:
+                return await asyncio.gather(*(run_one(p) for p in prompts), return_exceptions=True)
+            finally:
+                # このループ用に作った非同期クライアントはループと一緒に捨てる
+                await self._close_async_client()
+
+        return asyncio.run(run_all())
+
+    async def _close_async_client(self):
+        """実行中のイベントループ用に作った非同期クライアントを閉じる（持たないバックエンドは何もしない）"""
+
+    @staticmethod
+    def _join_prompt(prompt: str, cached_prefix: str = None) -> str:
+        """キャッシュ非対応のバックエンド向けに前置きとプロンプトを連結"""
+        if cached_prefix:
+            return f'{cached_prefix}\n\n{prompt}'
+        return prompt
+
+    def generate_json(self, prompt: str, cached_prefix: str = None) -> dict:
         """JSON生成"""
-        text = self.generate(prompt)
-
-        # ```json ``` で囲まれている場合は除去
-        if '```json' in text:
-            start = text.find('```json') + 7
-            end = text.rfind('```')
-            text = text[start:end].strip()
-        elif text.startswith('```'):
-            lines = text.split('\n')
-            text = '\n'.join(lines[1:-1])
+        return self._parse_json(self.generate(prompt, cached_prefix=cached_prefix))
+
+    async def generate_json_async(self, prompt: str, cached_prefix: str = None) -> dict:
+        """非同期JSON生成（JSONモードを持つバックエンドはオーバーライドする）"""
+        return self._parse_json(await self.generate_async(prompt, cached_prefix=cached_prefix))
+
+    def generate_descriptions(
+        self,
+        entities: Dict[str, str],
+        batch_size: int = 30,
+        concurrency: int = 8,
+        cached_prefix: str = None,
+        kinds: Tuple[str, ...] = None,
+    ) -> Dict[str, Union[str, Exception]]:
+        """
+        複数クラスの説明を1プロンプトにまとめて生成
+
+        batch_size 件ずつ1つのプロンプトに詰め、キー -> 説明文 のJSONで返させる。
+        バッチが複数になる場合は generate_many と同様に並列に実行する。
+
+        Args:
+            entities: キー（model_User 等）-> 解析情報テキスト
+            batch_size: 1プロンプトに含める件数
+            concurrency: 同時に実行するリクエスト数の上限
+            cached_prefix: 全バッチ共通の前置き（Few-Shot例など）
+            kinds: プロンプトで説明のフォーマットを示す種別（省略時は Laravel の model/controller/service）
+
+        Returns:
+            キー -> 説明文（取得できなかったキーには例外オブジェクトが入る）
+        """
+        from core.prompt_templates import BATCH_DESCRIPTION_KINDS, generate_batch_description_prompt
+
+        keys = list(entities)
+        batches = [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+        kinds = kinds or BATCH_DESCRIPTION_KINDS
+        prompts = [generate_batch_description_prompt({k: entities[k] for k in batch}, kinds) for batch in batches]
+        results = self._run_many(self.generate_json_async, prompts, concurrency, cached_prefix)
+
+        descriptions = {}
+        for batch, result in zip(batches, results):
+            for key in batch:
+                if isinstance(result, Exception):
+                    descriptions[key] = result
+                    continue
+                value = result.get(key) if isinstance(result, dict) else None
+                if isinstance(value, str) and value.strip():
+                    descriptions[key] = value.strip()
+                else:
+                    descriptions[key] = ValueError('応答に説明が含まれていませんでした')
+        return descriptions
+
+    @staticmethod
+    def _parse_json(text: str):
+        """レスポンス文字列からJSONを取り出して解析"""
+        # ```json ``` で囲まれている場合は除去（開きフェンスの言語指定を読み飛ばし、閉じフェンスの手前までを本文とする）
+        head, fence, rest = text.partition('```')
+        if fence and (rest.startswith('json') or not head.strip()):
+            if rest.startswith('json'):
+                rest = rest[4:]
+            else:
+                _, _, rest = rest.partition('\n')
+            body, _, _ = rest.rpartition('```')
+            text = (body or rest).strip()
 
         try:
-            return json.loads(text)
-        except json.JSONDecodeError as e:
+            # orjson は bytes を直接受け取れる（標準jsonも bytes 入力に対応）
+            return _json.loads(text.encode('utf-8') if isinstance(text, str) else text)
+        except ValueError as e:
             raise ValueError(f'JSON解析エラー: {e}\nレスポンス: {text[:500]}...')
 
 
+# Claude の JSON モード用ツール定義（tool_choice で強制し、入力をそのまま結果として使う）
+JSON_TOOL = {
+    "name": "emit_json",
+    "description": "回答のJSONオブジェクトを返す",
+    "input_schema": {"type": "object"},
+}
+
+
 class ClaudeBackend(AIBackend):
     """Claude API バックエンド"""
 
@@ -55,24 +258,90 @@ class ClaudeBackend(AIBackend):
                 'pip install anthropic を実行してください。'
             )
 
+        self._anthropic = anthropic
+        self._api_key = api_key
         self.client = anthropic.Anthropic(api_key=api_key)
         self.model = model
-
-    def generate(self, prompt: str) -> str:
+        # 非同期クライアントはイベントループごとに作り直す（asyncio.run のたびにループが変わるため）
+        self._async_client = None
+        self._async_loop = None
+
+    def _build_messages(self, prompt: str, cached_prefix: str = None) -> list:
+        if cached_prefix:
+            # 共通の前置きに cache_control を付け、2回目以降はプロンプトキャッシュを利用する
+            content = [
+                {"type": "text", "text": cached_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt},
+            ]
+        else:
+            content = prompt
+        return [{"role": "user", "content": content}]
+
+    def _get_async_client(self):
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_client = self._anthropic.AsyncAnthropic(api_key=self._api_key)
+            self._async_loop = loop
+        return self._async_client
+
+    async def _close_async_client(self):
+        if self._async_client is not None and self._async_loop is asyncio.get_running_loop():
+            client, self._async_client, self._async_loop = self._async_client, None, None
+            await client.close()
+
+    def generate(self, prompt: str, cached_prefix: str = None) -> str:
         response = self.client.messages.create(
             model=self.model,
             max_tokens=8000,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
+            messages=self._build_messages(prompt, cached_prefix)
         )
         return response.content[0].text
 
+    async def generate_async(self, prompt: str, cached_prefix: str = None) -> str:
+        response = await self._get_async_client().messages.create(
+            model=self.model,
+            max_tokens=8000,
+            messages=self._build_messages(prompt, cached_prefix)
+        )
+        return response.content[0].text
+
+    def generate_json(self, prompt: str, cached_prefix: str = None) -> dict:
+        """JSON生成（ツール呼び出しを強制し、入力として構造化済みのJSONを受け取る）"""
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=8000,
+            messages=self._build_messages(prompt, cached_prefix),
+            tools=[JSON_TOOL],
+            tool_choice={"type": "tool", "name": JSON_TOOL['name']},
+        )
+        return self._tool_input(response)
+
+    async def generate_json_async(self, prompt: str, cached_prefix: str = None) -> dict:
+        response = await self._get_async_client().messages.create(
+            model=self.model,
+            max_tokens=8000,
+            messages=self._build_messages(prompt, cached_prefix),
+            tools=[JSON_TOOL],
+            tool_choice={"type": "tool", "name": JSON_TOOL['name']},
+        )
+        return self._tool_input(response)
+
+    @staticmethod
+    def _tool_input(response) -> dict:
+        """レスポンスから tool_use ブロックの入力を取り出す"""
+        for block in response.content:
+            if block.type == 'tool_use':
+                return block.input
+        raise ValueError('JSON解析エラー: tool_use ブロックが返されませんでした')
+
 
 class ClaudeCodeBackend(AIBackend):
     """Claude Code CLI バックエンド (ローカル環境)"""
 
-    def __init__(self, cli_path=None):
+    # 常駐セッションは会話履歴が蓄積するため、この回数ごとにプロセスを起動し直す
+    MAX_SESSION_TURNS = 20
+
+    def __init__(self, cli_path=None, persistent=None):
         # 環境変数 CLAUDE_CLI_PATH があればそれを使用、なければ 'claude' コマンドを使用
         if cli_path is None:
             cli_path = os.getenv('CLAUDE_CLI_PATH', 'claude')
@@ -83,32 +352,176 @@ class ClaudeCodeBackend(AIBackend):
         if '/' in cli_path and not os.path.exists(cli_path):
             raise ValueError(f'Claude CLI が見つかりません: {cli_path}')
 
-    def generate(self, prompt: str) -> str:
-        """Claude Code CLI を使ってテキスト生成"""
+        # CLIに渡す環境変数（CLIは独自の認証を持つため、誤った外部APIキーを渡さない）
+        self._env = {k: v for k, v in os.environ.items() if k != 'ANTHROPIC_API_KEY'}
+
+        # 常駐モード: CLIを1回だけ起動し、stream-json で複数プロンプトをやり取りする
+        # （環境変数 CLAUDE_CLI_PERSISTENT=1 でも有効化できる）
+        # stream-json の入力は1つの会話として続き、CLIには会話だけをリセットする手段がないため、
+        # 以前のプロンプトと回答が次の回答に影響しうる。そのため常駐セッションは generate（テキスト生成）
+        # にだけ使い、クラスごとの説明を返させる generate_json 系は毎回CLIを起動して独立に実行する
+        if persistent is None:
+            persistent = os.getenv('CLAUDE_CLI_PERSISTENT', '').lower() in ('1', 'true', 'yes')
+        self.persistent = persistent
+        self._process = None
+        self._session_turns = 0
+        self._lock = threading.Lock()
+        if persistent:
+            atexit.register(self.close)
+
+    def close(self):
+        """常駐セッションのプロセスを終了"""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        with contextlib.suppress(OSError):
+            process.stdin.close()
         try:
-            env = os.environ.copy()
-            # CLIは独自の認証を持つため、誤った外部APIキーを渡さない
-            env.pop('ANTHROPIC_API_KEY', None)
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+
+    def _ensure_session(self) -> subprocess.Popen:
+        """常駐セッションを取得（終了済み・ターン上限到達時は起動し直す）"""
+        if (
+            self._process is None
+            or self._process.poll() is not None
+            or self._session_turns >= self.MAX_SESSION_TURNS
+        ):
+            self.close()
+            self._process = subprocess.Popen(
+                [
+                    self.cli_path, '--print', '--verbose',
+                    '--input-format', 'stream-json',
+                    '--output-format', 'stream-json',
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=self._env
+            )
+            self._session_turns = 0
+        return self._process
+
+    def _generate_in_session(self, prompt: str) -> str:
+        """常駐セッションに1メッセージ送り、result フレームまで読み取る"""
+        with self._lock:
+            process = self._ensure_session()
+            message = {
+                "type": "user",
+                "message": {"role": "user", "content": [{"type": "text", "text": prompt}]},
+            }
+            payload = _json.dumps(message)
+            if isinstance(payload, str):
+                payload = payload.encode('utf-8')
+
+            # readline はタイムアウトできないため、時間切れでプロセスごと終了させる
+            timer = threading.Timer(120, process.kill)
+            timer.start()
+            try:
+                process.stdin.write(payload + b'\n')
+                process.stdin.flush()
+                self._session_turns += 1
+
+                while True:
+                    line = process.stdout.readline()
+                    if not line:
+                        # 終了したプロセスを回収し、パイプも閉じる
+                        self.close()
+                        if not timer.is_alive():
+                            raise RuntimeError('Claude CLI がタイムアウトしました (120秒)')
+                        raise RuntimeError('Claude CLI セッションが予期せず終了しました')
+                    if not line.strip():
+                        continue
+                    frame = _json.loads(line)
+                    if frame.get('type') != 'result':
+                        continue
+                    if frame.get('is_error'):
+                        raise RuntimeError(f'Claude CLI エラー: {str(frame.get("result"))[:500]}')
+                    return (frame.get('result') or '').strip()
+            finally:
+                timer.cancel()
+
+    @staticmethod
+    def _check_output(returncode: int, stdout: bytes, stderr: bytes) -> str:
+        """CLIの終了コードを確認し、標準出力をデコードして返す"""
+        if returncode != 0:
+            raise RuntimeError(
+                f'Claude CLI エラー (code {returncode}): '
+                f'stdout={stdout.decode("utf-8", errors="replace").strip()[:500]} '
+                f'stderr={stderr.decode("utf-8", errors="replace").strip()[:500]}'
+            )
+        return stdout.decode('utf-8', errors='replace').strip()
 
+    def generate(self, prompt: str, cached_prefix: str = None) -> str:
+        """Claude Code CLI を使ってテキスト生成"""
+        prompt = self._join_prompt(prompt, cached_prefix)
+        if self.persistent:
+            try:
+                return self._generate_in_session(prompt)
+            except (OSError, ValueError) as e:
+                self.close()
+                raise RuntimeError(f'Claude CLI 実行エラー: {e}')
+        return self._generate_once(prompt)
+
+    def _generate_once(self, prompt: str) -> str:
+        """CLIを1回起動してプロンプトを送り、応答を返す（前後のプロンプトと会話を共有しない）"""
+        try:
             # claude --print でプロンプトを送信（非対話モード）
+            # 出力はバイト列のまま受け取り、最後に1回だけデコードする
             result = subprocess.run(
                 [self.cli_path, '--print', '--output-format', 'text'],
-                input=prompt,
+                input=prompt.encode('utf-8'),
                 capture_output=True,
-                text=True,
                 timeout=120,
-                env=env
+                env=self._env
             )
 
-            if result.returncode != 0:
-                raise RuntimeError(
-                    f'Claude CLI エラー (code {result.returncode}): '
-                    f'stdout={result.stdout.strip()[:500]} stderr={result.stderr.strip()[:500]}'
+            return self._check_output(result.returncode, result.stdout, result.stderr)
+
+        except subprocess.TimeoutExpired:
+            raise RuntimeError('Claude CLI がタイムアウトしました (120秒)')
+        except Exception as e:
+            raise RuntimeError(f'Claude CLI 実行エラー: {e}')
+
+    async def generate_async(self, prompt: str, cached_prefix: str = None) -> str:
+        """Claude Code CLI を非同期サブプロセスとして実行"""
+        if self.persistent:
+            # 常駐セッションは1本のパイプを共有するため、スレッド経由で順番に処理する
+            return await super().generate_async(prompt, cached_prefix)
+        return await self._generate_once_async(self._join_prompt(prompt, cached_prefix))
+
+    def generate_json(self, prompt: str, cached_prefix: str = None) -> dict:
+        # 回答がクラスごとに独立している必要があるため、常駐モードでも会話を共有しない
+        return self._parse_json(self._generate_once(self._join_prompt(prompt, cached_prefix)))
+
+    async def generate_json_async(self, prompt: str, cached_prefix: str = None) -> dict:
+        return self._parse_json(await self._generate_once_async(self._join_prompt(prompt, cached_prefix)))
+
+    async def _generate_once_async(self, prompt: str) -> str:
+        """_generate_once の非同期版"""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self.cli_path, '--print', '--output-format', 'text',
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=self._env
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(prompt.encode('utf-8')), timeout=120
                 )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
 
-            return result.stdout.strip()
+            return self._check_output(process.returncode, stdout, stderr)
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             raise RuntimeError('Claude CLI がタイムアウトしました (120秒)')
         except Exception as e:
             raise RuntimeError(f'Claude CLI 実行エラー: {e}')
@@ -117,6 +530,11 @@ class ClaudeCodeBackend(AIBackend):
 class GeminiBackend(AIBackend):
     """Gemini API バックエンド"""
 
+    # コンテキストキャッシュの有効期間（1回の実行を十分カバーする長さ）
+    CACHE_TTL_MINUTES = 10
+    # 期限切れ直前のキャッシュを使わないよう、この秒数を残した時点で作り直す
+    CACHE_REFRESH_MARGIN_SECONDS = 30
+
     def __init__(self, model='gemini-2.0-flash-exp'):
         api_key = os.getenv('GEMINI_API_KEY')
         if not api_key:
@@ -131,11 +549,213 @@ class GeminiBackend(AIBackend):
             )
 
         genai.configure(api_key=api_key)
+        self._genai = genai
         self.model = genai.GenerativeModel(model)
+        # 前置き -> (CachedContent を使うモデル（作成できなかった場合は None）, 作り直す時刻（time.monotonic）)
+        self._cached_models = {}
+        self._cached_models_lock = threading.Lock()
+        # 直近レスポンスのトークン使用量（cached_content_token_count でキャッシュヒットを確認できる）
+        self.last_usage = None
+
+    # JSONモード（レスポンスを application/json に固定し、フェンスや前置きを出させない）
+    JSON_GENERATION_CONFIG = {'response_mime_type': 'application/json'}
+
+    def generate(self, prompt: str, cached_prefix: str = None) -> str:
+        return self._generate_content(prompt, cached_prefix).text.strip()
+
+    async def generate_async(self, prompt: str, cached_prefix: str = None) -> str:
+        return (await self._generate_content_async(prompt, cached_prefix)).text.strip()
+
+    def generate_json(self, prompt: str, cached_prefix: str = None) -> dict:
+        response = self._generate_content(prompt, cached_prefix, self.JSON_GENERATION_CONFIG)
+        return self._parse_json(response.text)
+
+    async def generate_json_async(self, prompt: str, cached_prefix: str = None) -> dict:
+        response = await self._generate_content_async(prompt, cached_prefix, self.JSON_GENERATION_CONFIG)
+        return self._parse_json(response.text)
+
+    def _generate_content(self, prompt: str, cached_prefix: str = None, generation_config: dict = None):
+        cached_model = self._get_cached_model(cached_prefix) if cached_prefix else None
+        response = None
+        if cached_model is not None:
+            try:
+                response = cached_model.generate_content(prompt, generation_config=generation_config)
+            except Exception as e:
+                if not _is_not_found_error(e):
+                    raise
+                # キャッシュがサーバー側で消えていたら、次回作り直すことにして今回は通常の呼び出しにする
+                self._drop_cached_model(cached_prefix)
+        if response is None:
+            response = self.model.generate_content(
+                self._join_prompt(prompt, cached_prefix), generation_config=generation_config
+            )
+        self.last_usage = getattr(response, 'usage_metadata', None)
+        return response
+
+    async def _generate_content_async(self, prompt: str, cached_prefix: str = None, generation_config: dict = None):
+        cached_model = None
+        if cached_prefix:
+            cached_model = self._lookup_cached_model(cached_prefix)
+            if cached_model is False:
+                # キャッシュの作成は同期のネットワーク呼び出しなので、イベントループを止めないようスレッドで行う
+                cached_model = await asyncio.to_thread(self._get_cached_model, cached_prefix)
+        response = None
+        if cached_model is not None:
+            try:
+                response = await cached_model.generate_content_async(prompt, generation_config=generation_config)
+            except Exception as e:
+                if not _is_not_found_error(e):
+                    raise
+                self._drop_cached_model(cached_prefix)
+        if response is None:
+            response = await self.model.generate_content_async(
+                self._join_prompt(prompt, cached_prefix), generation_config=generation_config
+            )
+        self.last_usage = getattr(response, 'usage_metadata', None)
+        return response
+
+    def _lookup_cached_model(self, cached_prefix: str):
+        """有効期限内のキャッシュ済みモデルを返す（未作成・期限切れなら False）"""
+        entry = self._cached_models.get(cached_prefix)
+        if entry is None or time.monotonic() >= entry[1]:
+            return False
+        return entry[0]
+
+    def _drop_cached_model(self, cached_prefix: str):
+        with self._cached_models_lock:
+            self._cached_models.pop(cached_prefix, None)
+
+    def _get_cached_model(self, cached_prefix: str):
+        """前置きごとにコンテキストキャッシュを作成し、それを参照するモデルを返す（期限が近づいたら作り直す）"""
+        cached_model = self._lookup_cached_model(cached_prefix)
+        if cached_model is not False:
+            return cached_model
+        with self._cached_models_lock:
+            # 待っている間に他のスレッドが作成していればそれを使う
+            cached_model = self._lookup_cached_model(cached_prefix)
+            if cached_model is not False:
+                return cached_model
+            ttl = datetime.timedelta(minutes=self.CACHE_TTL_MINUTES)
+            try:
+                cache = self._genai.caching.CachedContent.create(
+                    model=self.model.model_name,
+                    contents=[cached_prefix],
+                    ttl=ttl,
+                )
+                cached_model = self._genai.GenerativeModel.from_cached_content(cache)
+            except Exception:
+                # 最小トークン数に満たない・モデルが非対応などの場合は通常の呼び出しにフォールバック
+                cached_model = None
+            refresh_at = time.monotonic() + ttl.total_seconds() - self.CACHE_REFRESH_MARGIN_SECONDS
+            self._cached_models[cached_prefix] = (cached_model, refresh_at)
+            return cached_model
 
-    def generate(self, prompt: str) -> str:
-        response = self.model.generate_content(prompt)
-        return response.text.strip()
+
+# AI応答キャッシュの置き場所
+AI_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'ai-spec-gen' / 'ai'
+
+
+class CachedBackend(AIBackend):
+    """
+    AI応答をプロンプトのハッシュでディスクにキャッシュするラッパー
+
+    同じバックエンド・モデル・前置き・プロンプトの組み合わせなら前回の応答を返し、APIを呼ばない。
+    失敗（例外）はキャッシュしない。
+    """
+
+    def __init__(self, backend: AIBackend, cache_dir: Path = AI_CACHE_DIR):
+        """
+        初期化
+
+        Args:
+            backend: 実際に生成を行うバックエンド
+            cache_dir: キャッシュの置き場所
+        """
+        self.backend = backend
+        self.cache_dir = Path(cache_dir)
+        model = getattr(backend, 'model', None)
+        # GeminiBackend の model は GenerativeModel なのでモデル名を使う
+        model_name = getattr(model, 'model_name', model)
+        self._identity = f'{type(backend).__name__}\0{model_name}'
+
+    def __getattr__(self, name):
+        # close() や last_usage などバックエンド固有の属性はそのまま委譲する
+        return getattr(self.backend, name)
+
+    # モード -> キャッシュファイルの拡張子（以前の pickle 形式のキャッシュとはファイル名を分ける）
+    _SUFFIXES = {'text': '.txt', 'json': '.json'}
+
+    def _cache_path(self, mode: str, prompt: str, cached_prefix: str = None) -> Path:
+        digest = hashlib.sha256()
+        for part in (self._identity, mode, cached_prefix or '', prompt):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        key = digest.hexdigest()
+        return self.cache_dir / key[:2] / (key + self._SUFFIXES[mode])
+
+    @staticmethod
+    def _load_text(cache_path: Path):
+        try:
+            return cache_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            # キャッシュがない・壊れている場合は生成し直す
+            return None
+
+    @staticmethod
+    def _load_json(cache_path: Path):
+        try:
+            return _json.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _store(cache_path: Path, data: Union[str, bytes]) -> None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            # 並列に書き込んでも壊れないよう、一時ファイルに書いてから置き換える
+            with tempfile.NamedTemporaryFile('wb', dir=cache_path.parent, delete=False) as f:
+                f.write(data)
+            os.replace(f.name, cache_path)
+        except OSError:
+            pass
+
+    async def _close_async_client(self):
+        await self.backend._close_async_client()
+
+    def generate(self, prompt: str, cached_prefix: str = None) -> str:
+        cache_path = self._cache_path('text', prompt, cached_prefix)
+        result = self._load_text(cache_path)
+        if result is None:
+            result = self.backend.generate(prompt, cached_prefix=cached_prefix)
+            self._store(cache_path, result)
+        return result
+
+    async def generate_async(self, prompt: str, cached_prefix: str = None) -> str:
+        # ファイルの読み書きはイベントループを止めないようスレッドで行う
+        cache_path = self._cache_path('text', prompt, cached_prefix)
+        result = await asyncio.to_thread(self._load_text, cache_path)
+        if result is None:
+            result = await self.backend.generate_async(prompt, cached_prefix=cached_prefix)
+            await asyncio.to_thread(self._store, cache_path, result)
+        return result
+
+    def generate_json(self, prompt: str, cached_prefix: str = None) -> dict:
+        cache_path = self._cache_path('json', prompt, cached_prefix)
+        result = self._load_json(cache_path)
+        if result is None:
+            result = self.backend.generate_json(prompt, cached_prefix=cached_prefix)
+            self._store(cache_path, _json.dumps(result))
+        return result
+
+    async def generate_json_async(self, prompt: str, cached_prefix: str = None) -> dict:
+        cache_path = self._cache_path('json', prompt, cached_prefix)
+        result = await asyncio.to_thread(self._load_json, cache_path)
+        if result is None:
+            result = await self.backend.generate_json_async(prompt, cached_prefix=cached_prefix)
+            await asyncio.to_thread(self._store, cache_path, _json.dumps(result))
+        return result
 
 
 def get_ai_backend(backend_name: str = None) -> AIBackend:
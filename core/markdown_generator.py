@@ -2,15 +2,79 @@
 Markdown Generator - 解析結果からMarkdownを生成
 """
 
-from typing import Dict, Any, List
+import functools
+import io
+from typing import Dict, Any, Iterator, List
+
+# Laravel標準のフレームワーク補助テーブル（DBパートでは概要のみ出す）
+_FRAMEWORK_TABLES = frozenset({
+    'cache', 'cache_locks', 'jobs', 'job_batches', 'failed_jobs',
+    'sessions', 'password_reset_tokens', 'personal_access_tokens',
+})
+
+
+@functools.cache
+def _pluralize(word: str) -> str:
+    """簡易的な複数形変換"""
+    if word.endswith('y'):
+        return word[:-1] + 'ies'
+    elif word.endswith('s'):
+        return word + 'es'
+    else:
+        return word + 's'
+
+
+def _preview_lines(content: str, limit: int) -> str:
+    """先頭 limit 行のプレビュー（全体を splitlines せず、limit 個目の改行までだけを分割する）"""
+    end = -1
+    for _ in range(limit):
+        end = content.find('\n', end + 1)
+        if end == -1:
+            break
+    head = content if end == -1 else content[:end + 1]
+    head_lines = head.splitlines()
+    preview = '\n'.join(head_lines[:limit])
+    if len(head_lines) > limit or len(head) < len(content):
+        preview += "\n... (truncated)"
+    return preview
 
 
 class MarkdownGenerator:
     """Markdown生成器"""
 
+    __slots__ = ('plugin_type', 'ai_descriptions', '_buf')
+
+    # Laravel: (解析データのキー, セクション生成メソッド名) を出力順に並べた表
+    _SECTIONS = (
+        ('migrations', '_generate_migrations_section'),
+        ('models', '_generate_models_section'),
+        ('controllers', '_generate_controllers_section'),
+        ('routes', '_generate_routes_section'),
+        ('services', '_generate_services_section'),
+        ('middleware', '_generate_middleware_section'),
+        ('requests', '_generate_requests_section'),
+        ('policies', '_generate_policies_section'),
+        ('jobs', '_generate_jobs_section'),
+        ('events', '_generate_events_section'),
+        ('listeners', '_generate_listeners_section'),
+        ('graphql_schemas', '_generate_graphql_section'),
+        ('graphql_resolvers', '_generate_resolvers_section'),
+    )
+
+    # Java/Spring Boot: 同上
+    _JAVA_SECTIONS = (
+        ('rest_endpoints', '_generate_java_rest_endpoints_section'),  # 最初に配置
+        ('entities', '_generate_java_entities_section'),
+        ('repositories', '_generate_java_repositories_section'),
+        ('controllers', '_generate_java_controllers_section'),
+        ('services', '_generate_java_services_section'),
+        ('dtos', '_generate_java_dtos_section'),
+        ('configs', '_generate_java_configs_section'),
+    )
+
     def __init__(self, plugin_type='laravel'):
         self.plugin_type = plugin_type
-        self.lines = []
+        self._buf = io.StringIO()
         self.ai_descriptions = {}
 
     def generate(self, data: Dict[str, Any], ai_descriptions: Dict[str, str] = None) -> str:
@@ -24,16 +88,40 @@ class MarkdownGenerator:
         Returns:
             Markdown形式の文字列
         """
-        self.lines = []
+        return ''.join(self.iter_markdown(data, ai_descriptions))
+
+    def iter_markdown(self, data: Dict[str, Any], ai_descriptions: Dict[str, str] = None) -> Iterator[str]:
+        """
+        解析データからMarkdownをセクション単位で逐次生成
+
+        Args:
+            data: 解析結果のデータ
+            ai_descriptions: AIが生成した説明文の辞書
+
+        Returns:
+            Markdown文字列のチャンクを返すイテレータ（連結すると generate() の結果と一致）
+        """
+        self._buf = io.StringIO()
         self.ai_descriptions = ai_descriptions or {}
 
         # プラグインタイプによって分岐
         if self.plugin_type == 'java':
-            return self._generate_java(data)
+            chunks = self._iter_java(data)
         else:
-            return self._generate_laravel(data)
-
-    def _generate_laravel(self, data: Dict[str, Any]) -> str:
+            chunks = self._iter_laravel(data)
+
+        # 最後のチャンクだけ末尾の改行を落とすため1つ遅らせて返す
+        pending = None
+        for chunk in chunks:
+            if not chunk:
+                continue
+            if pending:
+                yield pending
+            pending = chunk
+        if pending:
+            yield pending[:-1]
+
+    def _iter_laravel(self, data: Dict[str, Any]) -> Iterator[str]:
         """Laravel用のMarkdown生成"""
         # タイトル
         self.add_header("Laravel プロジェクト仕様書", level=1)
@@ -45,65 +133,19 @@ class MarkdownGenerator:
             self.add_line()
             self.add_line("---")
             self.add_line()
+        yield self._flush()
 
-        # Database Schema (Migrations)
-        if data.get('migrations'):
-            self._generate_migrations_section(data['migrations'])
-
-        # Models
-        if data.get('models'):
-            self._generate_models_section(data['models'])
-
-        # Controllers
-        if data.get('controllers'):
-            self._generate_controllers_section(data['controllers'])
-
-        # Routes
-        if data.get('routes'):
-            self._generate_routes_section(data['routes'])
-
-        # Services
-        if data.get('services'):
-            self._generate_services_section(data['services'])
-
-        # Middleware
-        if data.get('middleware'):
-            self._generate_middleware_section(data['middleware'])
-
-        # Form Requests (Validation)
-        if data.get('requests'):
-            self._generate_requests_section(data['requests'])
-
-        # Policies
-        if data.get('policies'):
-            self._generate_policies_section(data['policies'])
-
-        # Jobs
-        if data.get('jobs'):
-            self._generate_jobs_section(data['jobs'])
-
-        # Events
-        if data.get('events'):
-            self._generate_events_section(data['events'])
-
-        # Listeners
-        if data.get('listeners'):
-            self._generate_listeners_section(data['listeners'])
-
-        # GraphQL Schemas
-        if data.get('graphql_schemas'):
-            self._generate_graphql_section(data['graphql_schemas'])
-
-        # GraphQL Resolvers
-        if data.get('graphql_resolvers'):
-            self._generate_resolvers_section(data['graphql_resolvers'])
-
-        return '\n'.join(self.lines)
+        for key, method_name in self._SECTIONS:
+            value = data.get(key)
+            if value:
+                getattr(self, method_name)(value)
+                yield self._flush()
 
     def generate_parts(self, data: Dict[str, Any], ai_descriptions: Dict[str, str] = None) -> Dict[str, str]:
         """
         複数Markdownパートを生成（Notion階層や分割出力用）
         Returns: {'overview': str, 'db': str, 'api': str, 'security': str, 'graphql': str}
+                 （解析結果が空のパートは含まない）
         """
         parts: Dict[str, List[str]] = {
             'overview': [],
@@ -118,481 +160,528 @@ class MarkdownGenerator:
         # --- Overview ---
         def add_overview():
             lines = parts['overview']
-            lines.append("# プロジェクト概要")
-            lines.append("")
+            lines.extend(("# プロジェクト概要", ""))
             if self.ai_descriptions.get('project_summary'):
-                lines.append(self.ai_descriptions['project_summary'])
-                lines.append("")
+                lines.extend((self.ai_descriptions['project_summary'], ""))
         add_overview()
 
         # --- DB ---
         def add_db():
+            if not data.get('migrations'):
+                return
             lines = parts['db']
-            lines.append("# Database Schema")
-            lines.append("")
-            if data.get('migrations'):
-                framework_tables = {'cache', 'cache_locks', 'jobs', 'job_batches', 'failed_jobs', 'sessions', 'password_reset_tokens', 'personal_access_tokens'}
-                business = []
-                framework = []
-                for migration in data['migrations']:
-                    name = migration.get('table_name')
-                    if not name:
-                        continue
-                    if name in framework_tables:
-                        framework.append(migration)
-                    else:
-                        business.append(migration)
-
-                # 業務テーブルのみ詳細
-                for migration in business:
-                    lines.append(f"## テーブル: {migration['table_name']}")
-                    if migration.get('files'):
-                        lines.append(f"- マイグレーション: {', '.join(f'`{f}`' for f in migration['files'])}")
-                    if migration.get('columns'):
-                        lines.append("- テーブル定義:")
-                        for col in migration['columns']:
-                            lines.append(f"  - `{col['name']}` ({col['type']})")
-                    if migration.get('indexes'):
-                        lines.append("- インデックス/ユニーク:")
-                        for idx in migration['indexes']:
-                            lines.append(f"  - `{idx['column']}` ({idx['type']})")
-                    if migration.get('foreign_keys'):
-                        lines.append("- 外部キー:")
-                        for fk in migration['foreign_keys']:
-                            ref = f"{fk.get('references')} on {fk.get('on')}" if fk.get('references') and fk.get('on') else ""
-                            ondelete = f" onDelete={fk.get('on_delete')}" if fk.get('on_delete') else ""
-                            onupdate = f" onUpdate={fk.get('on_update')}" if fk.get('on_update') else ""
-                            lines.append(f"  - `{fk['column']}` -> {ref}{ondelete}{onupdate}".strip())
-                    lines.append("")
-
-                # フレームワーク系は一覧だけ
-                if framework:
-                    lines.append("## フレームワーク補助テーブル（概要のみ）")
-                    for mig in framework:
-                        lines.append(f"- {mig['table_name']} (migrations: {', '.join(mig.get('files', []))})")
-                    lines.append("")
+            append, extend = lines.append, lines.extend
+            format_foreign_key = self._format_foreign_key
+            append("# Database Schema")
+            append("")
+            business, framework = [], []
+            append_business, append_framework = business.append, framework.append
+            for migration in data['migrations']:
+                name = migration.get('table_name')
+                if not name:
+                    continue
+                if name in _FRAMEWORK_TABLES:
+                    append_framework(migration)
+                else:
+                    append_business(migration)
+
+            # 業務テーブルのみ詳細
+            for migration in business:
+                files = migration.get('files')
+                columns = migration.get('columns')
+                indexes = migration.get('indexes')
+                foreign_keys = migration.get('foreign_keys')
+                append(f"## テーブル: {migration['table_name']}")
+                if files:
+                    append(f"- マイグレーション: {', '.join(f'`{f}`' for f in files)}")
+                if columns:
+                    append("- テーブル定義:")
+                    extend([f"  - `{col['name']}` ({col['type']})" for col in columns])
+                if indexes:
+                    append("- インデックス/ユニーク:")
+                    extend([f"  - `{idx['column']}` ({idx['type']})" for idx in indexes])
+                if foreign_keys:
+                    append("- 外部キー:")
+                    extend([format_foreign_key(fk) for fk in foreign_keys])
+                append("")
+
+            # フレームワーク系は一覧だけ
+            if framework:
+                append("## フレームワーク補助テーブル（概要のみ）")
+                extend([
+                    f"- {mig['table_name']} (migrations: {', '.join(mig.get('files', []))})"
+                    for mig in framework
+                ])
+                append("")
         add_db()
 
         # --- API (REST/Services) ---
         def add_api():
+            if not any(data.get(k) for k in ('routes', 'controllers', 'services')):
+                return
             lines = parts['api']
-            lines.append("# API (Routes / Controllers / Services)")
-            lines.append("")
+            append, extend = lines.append, lines.extend
+            ai_get = self.ai_descriptions.get
+            format_signature = self._format_signature
+            format_route = self._format_route
+            append("# API (Routes / Controllers / Services)")
+            append("")
             # Routes
-            if data.get('routes'):
-                lines.append("## Routes")
-                total_routes = sum(len(lst) for lst in data['routes'].values())
+            routes = data.get('routes')
+            if routes:
+                append("## Routes")
+                total_routes = sum(len(lst) for lst in routes.values())
                 if total_routes == 0:
-                    lines.append("- ルートは検出されませんでした（GraphQL中心の可能性）")
-                for route_type, route_list in data['routes'].items():
+                    append("- ルートは検出されませんでした（GraphQL中心の可能性）")
+                for route_type, route_list in routes.items():
+                    append(f"### {route_type}.php")
                     if route_list:
-                        lines.append(f"### {route_type}.php")
-                        for route in route_list:
-                            mw = route.get('middleware') or []
-                            mw_text = f" (middleware: {', '.join(mw)})" if mw else ""
-                            lines.append(f"- **{route['method']}** `{route['uri']}` → `{route['action']}`{mw_text}")
-                        lines.append("")
+                        extend([format_route(route) for route in route_list])
                     else:
-                        lines.append(f"### {route_type}.php")
-                        lines.append("- ルート定義が見つかりませんでした")
-                        lines.append("")
+                        append("- ルート定義が見つかりませんでした")
+                    append("")
             # Controllers
-            if data.get('controllers'):
-                lines.append("## Controllers")
-                for controller in data['controllers']:
-                    lines.append(f"### {controller['class_name']}")
-                    lines.append(f"- ファイル: `{controller['file_path']}`")
-                    if controller.get('traits'):
-                        lines.append(f"- トレイト: {', '.join(controller['traits'])}")
-                    desc = self.ai_descriptions.get(f"controller_{controller['class_name']}", "")
+            controllers = data.get('controllers')
+            if controllers:
+                append("## Controllers")
+                for controller in controllers:
+                    class_name = controller['class_name']
+                    traits = controller.get('traits')
+                    methods = controller.get('methods')
+                    validations = controller.get('validations')
+                    trait_text = ', '.join(traits) if traits else ''
+                    extend((f"### {class_name}", f"- ファイル: `{controller['file_path']}`"))
+                    if traits:
+                        append(f"- トレイト: {trait_text}")
+                    desc = ai_get(f"controller_{class_name}", "")
                     if desc:
-                        lines.append(f"- 説明: {desc}")
-                    if controller.get('methods'):
-                        lines.append("- メソッド:")
-                        for method in controller['methods']:
-                            params = method.get('parameters') or ''
-                            sig = f"{method['name']}({params})" if params else f"{method['name']}()"
-                            lines.append(f"  - `{sig}`")
+                        append(f"- 説明: {desc}")
+                    if methods:
+                        append("- メソッド:")
+                        extend([f"  - `{format_signature(method)}`" for method in methods])
                     else:
-                        lines.append("- メソッド: （検出されませんでした。Laravel標準Authコントローラの可能性）")
-                    if controller.get('validations'):
-                        lines.append("- バリデーション (controller内 validate):")
-                        for val in controller['validations']:
-                            lines.append(f"  - `{val['field']}`: {val['rules']}")
-                    if controller.get('traits'):
-                        trait_text = ', '.join(controller['traits'])
-                        lines.append(f"- 備考: トレイト {trait_text} を使用（標準Auth動作の可能性）")
-                    lines.append("")
+                        append("- メソッド: （検出されませんでした。Laravel標準Authコントローラの可能性）")
+                    if validations:
+                        append("- バリデーション (controller内 validate):")
+                        extend([f"  - `{val['field']}`: {val['rules']}" for val in validations])
+                    if traits:
+                        append(f"- 備考: トレイト {trait_text} を使用（標準Auth動作の可能性）")
+                    append("")
             # Services
-            if data.get('services'):
-                lines.append("## Services")
-                for service in data['services']:
-                    lines.append(f"### {service['class_name']}")
-                    lines.append(f"- ファイル: `{service['file_path']}`")
-                    desc = self.ai_descriptions.get(f"service_{service['class_name']}", "")
+            services = data.get('services')
+            if services:
+                append("## Services")
+                for service in services:
+                    class_name = service['class_name']
+                    logic_notes = service.get('logic_notes')
+                    methods = service.get('methods')
+                    extend((f"### {class_name}", f"- ファイル: `{service['file_path']}`"))
+                    desc = ai_get(f"service_{class_name}", "")
                     if desc:
-                        lines.append(f"- 説明: {desc}")
-                    if service.get('logic_notes'):
-                        lines.append("- 振る舞い要約:")
-                        for note in service['logic_notes']:
-                            lines.append(f"  - {note}")
-                    if service.get('methods'):
-                        lines.append("- メソッド:")
-                        for m in service['methods']:
-                            params = m.get('parameters') or ''
-                            sig = f"{m['name']}({params})" if params else f"{m['name']}()"
-                            lines.append(f"  - `{sig}`")
-                    lines.append("")
+                        append(f"- 説明: {desc}")
+                    if logic_notes:
+                        append("- 振る舞い要約:")
+                        extend([f"  - {note}" for note in logic_notes])
+                    if methods:
+                        append("- メソッド:")
+                        extend([f"  - `{format_signature(m)}`" for m in methods])
+                    append("")
         add_api()
 
         # --- Security/Validation ---
         def add_security():
+            if not any(data.get(k) for k in ('middleware', 'kernel', 'requests', 'policies')):
+                return
             lines = parts['security']
             lines.append("# セキュリティ / バリデーション")
             lines.append("")
             # Middleware
-            if data.get('middleware'):
-                lines.append("## Middleware")
-                for mw in data['middleware']:
-                    lines.append(f"- `{mw['class_name']}` ({mw['file_path']})")
-                lines.append("")
+            lines.append("## Middleware")
+            middleware = data.get('middleware')
+            if middleware:
+                lines.extend([f"- `{mw['class_name']}` ({mw['file_path']})" for mw in middleware])
             else:
-                lines.append("## Middleware")
                 lines.append("- 検出されませんでした (GraphQLの@guard等で認証している可能性あり)")
-                lines.append("")
+            lines.append("")
             # Kernel middleware
             kernel = data.get('kernel') or {}
             if kernel:
                 lines.append("## Kernel Middleware")
-                if kernel.get('global'):
+                global_mw = kernel.get('global')
+                groups = kernel.get('groups')
+                route_mw = kernel.get('route')
+                if global_mw:
                     lines.append("- Global:")
-                    for m in kernel['global']:
-                        lines.append(f"  - {m}")
-                if kernel.get('groups'):
+                    lines.extend([f"  - {m}" for m in global_mw])
+                if groups:
                     lines.append("- Groups:")
-                    for name, mids in kernel['groups'].items():
-                        lines.append(f"  - {name}: {', '.join(mids)}")
-                if kernel.get('route'):
+                    lines.extend([f"  - {name}: {', '.join(mids)}" for name, mids in groups.items()])
+                if route_mw:
                     lines.append("- Route Middleware:")
-                    for alias, m in kernel['route'].items():
-                        lines.append(f"  - {alias}: {m}")
+                    lines.extend([f"  - {alias}: {m}" for alias, m in route_mw.items()])
                 lines.append("")
             # Requests
-            if data.get('requests'):
-                lines.append("## Form Requests")
-                for req in data['requests']:
-                    lines.append(f"### {req['class_name']}")
-                    lines.append(f"- ファイル: `{req['file_path']}`")
-                    if req.get('rules'):
+            lines.append("## Form Requests")
+            requests = data.get('requests')
+            if requests:
+                for req in requests:
+                    rules = req.get('rules')
+                    lines.extend((f"### {req['class_name']}", f"- ファイル: `{req['file_path']}`"))
+                    if rules:
                         lines.append("- バリデーションルール:")
-                        for rule in req['rules']:
-                            lines.append(f"  - `{rule['field']}`: {rule['rules']}")
+                        lines.extend([f"  - `{rule['field']}`: {rule['rules']}" for rule in rules])
                     lines.append("")
             else:
-                lines.append("## Form Requests")
                 lines.append("- 専用FormRequestは検出されませんでした (コントローラ内バリデーションの可能性)")
                 lines.append("")
             # Policies
-            if data.get('policies'):
+            policies = data.get('policies')
+            if policies:
                 lines.append("## Policies")
-                for policy in data['policies']:
-                    lines.append(f"### {policy['class_name']}")
-                    lines.append(f"- ファイル: `{policy['file_path']}`")
-                    if policy.get('methods'):
+                for policy in policies:
+                    methods = policy.get('methods')
+                    lines.extend((f"### {policy['class_name']}", f"- ファイル: `{policy['file_path']}`"))
+                    if methods:
                         lines.append("- メソッド:")
-                        for method in policy['methods']:
-                            lines.append(f"  - `{method}()`")
+                        lines.extend([f"  - `{method}()`" for method in methods])
                     lines.append("")
             return
         add_security()
 
         # --- GraphQL ---
         def add_graphql():
+            if not any(data.get(k) for k in ('graphql_endpoint', 'graphql_schemas', 'graphql_operations', 'graphql_resolvers')):
+                return
             lines = parts['graphql']
             lines.append("# GraphQL API")
             lines.append("")
             if data.get('graphql_endpoint'):
                 lines.append(f"- エンドポイント: `{data['graphql_endpoint']}`")
                 lines.append("")
-            if data.get('graphql_schemas'):
+            schemas = data.get('graphql_schemas')
+            if schemas:
                 lines.append("## スキーマファイル一覧")
-                for file_path in sorted(data['graphql_schemas'].keys()):
-                    lines.append(f"- {file_path}")
+                lines.extend([f"- {file_path}" for file_path in sorted(schemas.keys())])
                 lines.append("")
-            if data.get('graphql_operations'):
+            operations = data.get('graphql_operations')
+            if operations:
+                queries = operations.get('queries')
+                mutations = operations.get('mutations')
                 lines.append("## Queries / Mutations 要約")
-                if data['graphql_operations'].get('queries'):
+                if queries:
                     lines.append("### Queries")
-                    for q in data['graphql_operations']['queries']:
-                        arg_text = f"({q['args']})" if q.get('args') else ""
-                        lines.append(f"- `{q['name']}{arg_text}` : {q.get('return')}")
+                    lines.extend([self._format_graphql_operation(q) for q in queries])
                     lines.append("")
-                if data['graphql_operations'].get('mutations'):
+                if mutations:
                     lines.append("### Mutations")
-                    for m in data['graphql_operations']['mutations']:
-                        arg_text = f"({m['args']})" if m.get('args') else ""
-                        lines.append(f"- `{m['name']}{arg_text}` : {m.get('return')}")
+                    lines.extend([self._format_graphql_operation(m) for m in mutations])
                     lines.append("")
-            if data.get('graphql_resolvers'):
+            resolvers = data.get('graphql_resolvers')
+            if resolvers:
+                queries = resolvers.get('queries')
+                mutations = resolvers.get('mutations')
                 lines.append("## Resolvers")
-                if data['graphql_resolvers'].get('queries'):
+                if queries:
                     lines.append("### Queries")
-                    for q in data['graphql_resolvers']['queries']:
-                        lines.append(f"- `{q}`")
+                    lines.extend([f"- `{q}`" for q in queries])
                     lines.append("")
-                if data['graphql_resolvers'].get('mutations'):
+                if mutations:
                     lines.append("### Mutations")
-                    for m in data['graphql_resolvers']['mutations']:
-                        lines.append(f"- `{m}`")
+                    lines.extend([f"- `{m}`" for m in mutations])
                     lines.append("")
         add_graphql()
 
-        return {k: '\n'.join(v).strip() for k, v in parts.items()}
+        # 内容のないパートは返さない（Notionに空ページを作らないため）
+        return {k: '\n'.join(v).strip() for k, v in parts.items() if v}
 
     def _generate_models_section(self, models: List[Dict]):
         """Modelsセクション生成"""
-        self.add_header("Models", level=2)
-        self.add_line()
+        self._write_section_header("Models")
 
+        lines = []
+        append, extend = lines.append, lines.extend
+        ai_get = self.ai_descriptions.get
+        format_relation = self._format_relation
         for model in models:
             class_name = model['class_name']
-            self.add_header(f"{class_name} モデル", level=3)
+            append(f"### {class_name} モデル")
 
             # AI説明
-            description = self.ai_descriptions.get(f"model_{class_name}", "")
+            description = ai_get(f"model_{class_name}", "")
             if description:
-                self.add_line(f"**説明**: {description}")
-                self.add_line()
+                extend((f"**説明**: {description}", ""))
+
+            fillable = model.get('fillable')
+            relations = model.get('relations')
 
             # テーブル名
-            if model.get('table_name'):
-                self.add_line(f"- **テーブル**: `{model['table_name']}`")
+            table_name = model.get('table_name')
+            if table_name:
+                append(f"- **テーブル**: `{table_name}`")
             else:
                 # デフォルトのテーブル名を推測
-                table_name = self._pluralize(class_name.lower())
-                self.add_line(f"- **テーブル**: `{table_name}` (デフォルト)")
+                table_name = _pluralize(class_name.lower())
+                append(f"- **テーブル**: `{table_name}` (デフォルト)")
 
             # Fillable
-            if model.get('fillable'):
-                self.add_line(f"- **Fillable**: {', '.join(f'`{f}`' for f in model['fillable'])}")
+            if fillable:
+                append(f"- **Fillable**: {', '.join(f'`{f}`' for f in fillable)}")
 
             # リレーション
-            if model.get('relations'):
-                self.add_line("- **リレーション**:")
-                for rel in model['relations']:
-                    rel_desc = self.ai_descriptions.get(f"relation_{class_name}_{rel['method']}", "")
-                    rel_text = f"  - `{rel['method']}()` - {rel['type']} → {rel['related_model']}"
-                    if rel_desc:
-                        rel_text += f" ({rel_desc})"
-                    self.add_line(rel_text)
+            if relations:
+                append("- **リレーション**:")
+                extend([format_relation(class_name, rel) for rel in relations])
 
-            self.add_line()
+            append("")
+        self._write_lines(lines)
 
     def _generate_graphql_section(self, schemas: Dict[str, str]):
         """GraphQLセクション生成"""
-        self.add_header("GraphQL API", level=2)
-        self.add_line()
+        self._write_section_header("GraphQL API")
 
+        lines = []
         for file_path, content in schemas.items():
-            self.add_header(f"📄 {file_path}", level=3)
-            self.add_line()
-            snippet_lines = content.splitlines()
-            preview = '\n'.join(snippet_lines[:20])
-            if len(snippet_lines) > 20:
-                preview += "\n... (truncated)"
-            self.add_code_block(preview, language='graphql')
-            self.add_line()
+            preview = _preview_lines(content, 20)
+            lines.extend((f"### 📄 {file_path}", "", "```graphql", preview, "```", ""))
+        self._write_lines(lines)
 
     def _generate_resolvers_section(self, resolvers: Dict[str, List[str]]):
         """Resolversセクション生成"""
-        self.add_header("GraphQL Resolvers", level=2)
-        self.add_line()
+        self._write_section_header("GraphQL Resolvers")
+
+        queries = resolvers.get('queries')
+        mutations = resolvers.get('mutations')
 
-        if resolvers.get('queries'):
+        if queries:
             self.add_header("Queries", level=3)
-            for query_file in resolvers['queries']:
-                self.add_line(f"- `{query_file}`")
+            self._write_lines([f"- `{query_file}`" for query_file in queries])
             self.add_line()
 
-        if resolvers.get('mutations'):
+        if mutations:
             self.add_header("Mutations", level=3)
-            for mutation_file in resolvers['mutations']:
-                self.add_line(f"- `{mutation_file}`")
+            self._write_lines([f"- `{mutation_file}`" for mutation_file in mutations])
             self.add_line()
 
     def _generate_migrations_section(self, migrations: List[Dict]):
         """Migrationsセクション生成"""
-        self.add_header("Database Schema (Migrations)", level=2)
-        self.add_line()
+        self._write_section_header("Database Schema (Migrations)")
 
+        lines = []
         for migration in migrations:
-            if migration.get('table_name'):
-                self.add_header(f"テーブル: {migration['table_name']}", level=3)
-                if migration.get('files'):
-                    self.add_line(f"**マイグレーション**: {', '.join(f'`{f}`' for f in migration['files'])}")
-                self.add_line()
-
-                if migration.get('columns'):
-                    self.add_line("**最終カラム定義**:")
-                    for col in migration['columns']:
-                        self.add_line(f"- `{col['name']}` ({col['type']})")
-                    self.add_line()
+            table_name = migration.get('table_name')
+            if not table_name:
+                continue
+            files = migration.get('files')
+            columns = migration.get('columns')
+            lines.append(f"### テーブル: {table_name}")
+            if files:
+                lines.append(f"**マイグレーション**: {', '.join(f'`{f}`' for f in files)}")
+            lines.append("")
+
+            if columns:
+                lines.append("**最終カラム定義**:")
+                lines.extend([f"- `{col['name']}` ({col['type']})" for col in columns])
+                lines.append("")
+        self._write_lines(lines)
 
     def _generate_controllers_section(self, controllers: List[Dict]):
         """Controllersセクション生成"""
-        self.add_header("Controllers", level=2)
-        self.add_line()
+        self._write_section_header("Controllers")
 
+        lines = []
+        append, extend = lines.append, lines.extend
+        ai_get = self.ai_descriptions.get
+        format_signature = self._format_signature
         for controller in controllers:
-            self.add_header(controller['class_name'], level=3)
-            self.add_line(f"**ファイル**: `{controller['file_path']}`")
-            self.add_line()
+            class_name = controller['class_name']
+            methods = controller.get('methods')
+            extend((f"### {class_name}", f"**ファイル**: `{controller['file_path']}`", ""))
 
             # AI説明
-            description = self.ai_descriptions.get(f"controller_{controller['class_name']}", "")
+            description = ai_get(f"controller_{class_name}", "")
             if description:
-                self.add_line(f"**説明**: {description}")
-                self.add_line()
-
-            if controller.get('methods'):
-                self.add_line("**メソッド**:")
-                for method in controller['methods']:
-                    params = method.get('parameters', '')
-                    if params:
-                        self.add_line(f"- `{method['name']}({params})`")
-                    else:
-                        self.add_line(f"- `{method['name']}()`")
-                self.add_line()
+                extend((f"**説明**: {description}", ""))
+
+            if methods:
+                append("**メソッド**:")
+                extend([f"- `{format_signature(method)}`" for method in methods])
+                append("")
+        self._write_lines(lines)
 
     def _generate_routes_section(self, routes: Dict[str, List[Dict]]):
         """Routesセクション生成"""
-        self.add_header("Routes", level=2)
-        self.add_line()
+        self._write_section_header("Routes")
 
+        lines = []
         for route_type, route_list in routes.items():
             if route_list:
-                self.add_header(f"{route_type}.php", level=3)
-                self.add_line()
-
+                lines.extend((f"### {route_type}.php", ""))
                 for route in route_list:
-                    self.add_line(f"- **{route['method']}** `{route['uri']}`")
-                    self.add_line(f"  - Action: `{route['action']}`")
-                self.add_line()
+                    lines.extend((f"- **{route['method']}** `{route['uri']}`", f"  - Action: `{route['action']}`"))
+                lines.append("")
+        self._write_lines(lines)
 
     def _generate_services_section(self, services: List[Dict]):
         """Servicesセクション生成"""
-        self.add_header("Services (ビジネスロジック)", level=2)
-        self.add_line()
+        self._write_section_header("Services (ビジネスロジック)")
 
+        lines = []
+        append, extend = lines.append, lines.extend
+        ai_get = self.ai_descriptions.get
         for service in services:
-            self.add_header(service['class_name'], level=3)
-            self.add_line(f"**ファイル**: `{service['file_path']}`")
-            self.add_line()
+            class_name = service['class_name']
+            methods = service.get('methods')
+            extend((f"### {class_name}", f"**ファイル**: `{service['file_path']}`", ""))
 
             # AI説明
-            description = self.ai_descriptions.get(f"service_{service['class_name']}", "")
+            description = ai_get(f"service_{class_name}", "")
             if description:
-                self.add_line(f"**説明**: {description}")
-                self.add_line()
+                extend((f"**説明**: {description}", ""))
 
-            if service.get('methods'):
-                self.add_line("**メソッド**:")
-                for method in service['methods']:
-                    self.add_line(f"- `{method}()`")
-                self.add_line()
+            if methods:
+                append("**メソッド**:")
+                extend([f"- `{method}()`" for method in methods])
+                append("")
+        self._write_lines(lines)
 
     def _generate_middleware_section(self, middleware: List[Dict]):
         """Middlewareセクション生成"""
-        self.add_header("Middleware", level=2)
-        self.add_line()
+        self._write_section_header("Middleware")
 
-        for mw in middleware:
-            self.add_line(f"- **{mw['class_name']}** - `{mw['file_path']}`")
+        self._write_lines([f"- **{mw['class_name']}** - `{mw['file_path']}`" for mw in middleware])
         self.add_line()
 
     def _generate_requests_section(self, requests: List[Dict]):
         """Form Requestsセクション生成"""
-        self.add_header("Form Requests (バリデーション)", level=2)
-        self.add_line()
+        self._write_section_header("Form Requests (バリデーション)")
 
+        lines = []
         for request in requests:
-            self.add_header(request['class_name'], level=3)
-            self.add_line(f"**ファイル**: `{request['file_path']}`")
-            self.add_line()
+            lines.extend((f"### {request['class_name']}", f"**ファイル**: `{request['file_path']}`", ""))
 
-            if request.get('rules'):
-                self.add_line("**バリデーションルール**:")
-                for rule in request['rules']:
-                    self.add_line(f"- `{rule['field']}`: {rule['rules']}")
-                self.add_line()
+            rules = request.get('rules')
+            if rules:
+                lines.append("**バリデーションルール**:")
+                lines.extend([f"- `{rule['field']}`: {rule['rules']}" for rule in rules])
+                lines.append("")
+        self._write_lines(lines)
 
     def _generate_policies_section(self, policies: List[Dict]):
         """Policiesセクション生成"""
-        self.add_header("Policies (認可)", level=2)
-        self.add_line()
+        self._write_section_header("Policies (認可)")
 
+        lines = []
         for policy in policies:
-            self.add_header(policy['class_name'], level=3)
-            self.add_line(f"**ファイル**: `{policy['file_path']}`")
-            self.add_line()
+            lines.extend((f"### {policy['class_name']}", f"**ファイル**: `{policy['file_path']}`", ""))
 
-            if policy.get('methods'):
-                self.add_line("**認可メソッド**:")
-                for method in policy['methods']:
-                    self.add_line(f"- `{method}()`")
-                self.add_line()
+            methods = policy.get('methods')
+            if methods:
+                lines.append("**認可メソッド**:")
+                lines.extend([f"- `{method}()`" for method in methods])
+                lines.append("")
+        self._write_lines(lines)
 
     def _generate_jobs_section(self, jobs: List[Dict]):
         """Jobsセクション生成"""
-        self.add_header("Jobs (非同期処理)", level=2)
-        self.add_line()
+        self._write_section_header("Jobs (非同期処理)")
 
-        for job in jobs:
-            self.add_line(f"- **{job['class_name']}** - `{job['file_path']}`")
+        self._write_lines([f"- **{job['class_name']}** - `{job['file_path']}`" for job in jobs])
         self.add_line()
 
     def _generate_events_section(self, events: List[Dict]):
         """Eventsセクション生成"""
-        self.add_header("Events", level=2)
-        self.add_line()
+        self._write_section_header("Events")
 
-        for event in events:
-            self.add_line(f"- **{event['class_name']}** - `{event['file_path']}`")
+        self._write_lines([f"- **{event['class_name']}** - `{event['file_path']}`" for event in events])
         self.add_line()
 
     def _generate_listeners_section(self, listeners: List[Dict]):
         """Listenersセクション生成"""
-        self.add_header("Listeners", level=2)
-        self.add_line()
+        self._write_section_header("Listeners")
 
-        for listener in listeners:
-            self.add_line(f"- **{listener['class_name']}** - `{listener['file_path']}`")
+        self._write_lines([f"- **{listener['class_name']}** - `{listener['file_path']}`" for listener in listeners])
         self.add_line()
 
     def add_header(self, text: str, level: int = 1):
         """見出し追加"""
-        self.lines.append(f"{'#' * level} {text}")
+        self._buf.write(f"{'#' * level} {text}\n")
 
     def add_line(self, text: str = ""):
         """行追加"""
-        self.lines.append(text)
+        self._buf.write(text)
+        self._buf.write('\n')
 
     def add_code_block(self, code: str, language: str = ""):
         """コードブロック追加"""
-        self.lines.append(f"```{language}")
-        self.lines.append(code)
-        self.lines.append("```")
-
-    def _pluralize(self, word: str) -> str:
-        """簡易的な複数形変換"""
-        if word.endswith('y'):
-            return word[:-1] + 'ies'
-        elif word.endswith('s'):
-            return word + 'es'
-        else:
-            return word + 's'
-
-    def _generate_java(self, data: Dict[str, Any]) -> str:
+        self._buf.write(f"```{language}\n{code}\n```\n")
+
+    def _write_section_header(self, title: str):
+        """セクション見出し（## title と空行）を1回の書き込みで追加"""
+        self._buf.write(f"## {title}\n\n")
+
+    def _write_lines(self, lines):
+        """セクション単位でまとめた行をバッファへ書き込み"""
+        if lines:
+            self._buf.write('\n'.join(lines))
+            self._buf.write('\n')
+
+    def _flush(self) -> str:
+        """バッファに溜まったチャンクを取り出して空にする"""
+        chunk = self._buf.getvalue()
+        self._buf.seek(0)
+        self._buf.truncate()
+        return chunk
+
+    def _format_signature(self, method: Dict) -> str:
+        """メソッドのシグネチャ表記 name(params)"""
+        params = method.get('parameters') or ''
+        return f"{method['name']}({params})"
+
+    def _format_relation(self, class_name: str, rel: Dict) -> str:
+        """リレーション1行分"""
+        rel_text = f"  - `{rel['method']}()` - {rel['type']} → {rel['related_model']}"
+        rel_desc = self.ai_descriptions.get(f"relation_{class_name}_{rel['method']}", "")
+        if rel_desc:
+            rel_text += f" ({rel_desc})"
+        return rel_text
+
+    def _format_route(self, route: Dict) -> str:
+        """ルート1行分（ミドルウェア併記）"""
+        mw = route.get('middleware') or []
+        mw_text = f" (middleware: {', '.join(mw)})" if mw else ""
+        return f"- **{route['method']}** `{route['uri']}` → `{route['action']}`{mw_text}"
+
+    def _format_foreign_key(self, fk: Dict) -> str:
+        """外部キー1行分"""
+        references = fk.get('references')
+        on = fk.get('on')
+        on_delete = fk.get('on_delete')
+        on_update = fk.get('on_update')
+        ref = f"{references} on {on}" if references and on else ""
+        ondelete = f" onDelete={on_delete}" if on_delete else ""
+        onupdate = f" onUpdate={on_update}" if on_update else ""
+        return f"  - `{fk['column']}` -> {ref}{ondelete}{onupdate}".strip()
+
+    def _format_graphql_operation(self, op: Dict) -> str:
+        """GraphQL Query/Mutation 1行分"""
+        args = op.get('args')
+        arg_text = f"({args})" if args else ""
+        return f"- `{op['name']}{arg_text}` : {op.get('return')}"
+
+    def _format_java_field(self, field: Dict) -> str:
+        """Entityフィールド1行分（アノテーション併記）"""
+        annotations = ', '.join(f"@{a}" for a in field.get('annotations', []))
+        return f"- `{field['name']}` ({field['type']}) {annotations}"
+
+    def _format_java_method(self, method: Dict) -> str:
+        """Service/Repositoryメソッド1行分"""
+        return f"- `{method['name']}({method['parameters']})` → `{method['return_type']}`"
+
+    def _format_endpoint_row(self, endpoint: Dict) -> str:
+        """REST Endpoints表の1行分"""
+        return f"| {endpoint['method']} | `{endpoint['path']}` | {endpoint['controller']} | `{endpoint['handler']}()` |"
+
+    def _iter_java(self, data: Dict[str, Any]) -> Iterator[str]:
         """Java/Spring Boot用のMarkdown生成"""
         # タイトル
         self.add_header("Java プロジェクト仕様書", level=1)
@@ -604,189 +693,171 @@ class MarkdownGenerator:
             self.add_line()
             self.add_line("---")
             self.add_line()
+        yield self._flush()
 
-        # REST Endpoints（最初に配置）
-        if data.get('rest_endpoints'):
-            self._generate_java_rest_endpoints_section(data['rest_endpoints'])
-
-        # Database Schema (Entities)
-        if data.get('entities'):
-            self._generate_java_entities_section(data['entities'])
-
-        # Repositories
-        if data.get('repositories'):
-            self._generate_java_repositories_section(data['repositories'])
-
-        # Controllers
-        if data.get('controllers'):
-            self._generate_java_controllers_section(data['controllers'])
-
-        # Services
-        if data.get('services'):
-            self._generate_java_services_section(data['services'])
-
-        # DTOs
-        if data.get('dtos'):
-            self._generate_java_dtos_section(data['dtos'])
-
-        # Configs
-        if data.get('configs'):
-            self._generate_java_configs_section(data['configs'])
-
-        return '\n'.join(self.lines)
+        for key, method_name in self._JAVA_SECTIONS:
+            value = data.get(key)
+            if value:
+                getattr(self, method_name)(value)
+                yield self._flush()
 
     def _generate_java_entities_section(self, entities: List[Dict]):
         """Java Entitiesセクションを生成"""
-        self.add_header("Database Schema (Entities)", level=2)
-        self.add_line()
+        self._write_section_header("Database Schema (Entities)")
 
+        lines = []
+        append, extend = lines.append, lines.extend
+        ai_get = self.ai_descriptions.get
+        format_java_field = self._format_java_field
         for entity in entities:
-            self.add_header(f"Entity: {entity['name']}", level=3)
-            self.add_line(f"**テーブル**: `{entity['table']}`")
-            self.add_line(f"**ファイル**: `{entity['file']}`")
-            self.add_line()
+            extend((
+                f"### Entity: {entity['name']}",
+                f"**テーブル**: `{entity['table']}`",
+                f"**ファイル**: `{entity['file']}`",
+                "",
+            ))
 
             # AI生成の説明
-            description = self.ai_descriptions.get(f"entity_{entity['name']}")
+            description = ai_get(f"entity_{entity['name']}")
             if description:
-                self.add_line(f"**説明**: {description}")
-                self.add_line()
+                extend((f"**説明**: {description}", ""))
 
-            if entity.get('fields'):
-                self.add_line("**フィールド**:")
-                for field in entity['fields']:
-                    annotations = ', '.join(f"@{a}" for a in field.get('annotations', []))
-                    self.add_line(f"- `{field['name']}` ({field['type']}) {annotations}")
-                self.add_line()
+            fields = entity.get('fields')
+            if fields:
+                append("**フィールド**:")
+                extend([format_java_field(field) for field in fields])
+                append("")
 
-        self.add_line()
+        append("")
+        self._write_lines(lines)
 
     def _generate_java_controllers_section(self, controllers: List[Dict]):
         """Java Controllersセクションを生成"""
-        self.add_header("Controllers", level=2)
-        self.add_line()
+        self._write_section_header("Controllers")
 
+        lines = []
+        append, extend = lines.append, lines.extend
+        ai_get = self.ai_descriptions.get
         for controller in controllers:
-            self.add_header(f"Controller: {controller['name']}", level=3)
-            self.add_line(f"**ファイル**: `{controller['file']}`")
-            self.add_line(f"**ベースパス**: `{controller.get('base_path', '/')}`")
-            self.add_line()
+            extend((
+                f"### Controller: {controller['name']}",
+                f"**ファイル**: `{controller['file']}`",
+                f"**ベースパス**: `{controller.get('base_path', '/')}`",
+                "",
+            ))
 
             # AI生成の説明
-            description = self.ai_descriptions.get(f"controller_{controller['name']}")
+            description = ai_get(f"controller_{controller['name']}")
             if description:
-                self.add_line(f"**説明**: {description}")
-                self.add_line()
+                extend((f"**説明**: {description}", ""))
 
-            if controller.get('endpoints'):
-                self.add_line("**エンドポイント**:")
-                for endpoint in controller['endpoints']:
-                    self.add_line(f"- `{endpoint['method']} {endpoint['path']}` → `{endpoint['handler']}()`")
-                self.add_line()
+            endpoints = controller.get('endpoints')
+            if endpoints:
+                append("**エンドポイント**:")
+                extend([
+                    f"- `{endpoint['method']} {endpoint['path']}` → `{endpoint['handler']}()`"
+                    for endpoint in endpoints
+                ])
+                append("")
 
-        self.add_line()
+        append("")
+        self._write_lines(lines)
 
     def _generate_java_services_section(self, services: List[Dict]):
         """Java Servicesセクションを生成"""
-        self.add_header("Services (ビジネスロジック)", level=2)
-        self.add_line()
+        self._write_section_header("Services (ビジネスロジック)")
 
+        lines = []
+        append, extend = lines.append, lines.extend
+        ai_get = self.ai_descriptions.get
+        format_java_method = self._format_java_method
         for service in services:
-            self.add_header(f"Service: {service['name']}", level=3)
-            self.add_line(f"**ファイル**: `{service['file']}`")
-            self.add_line()
+            extend((f"### Service: {service['name']}", f"**ファイル**: `{service['file']}`", ""))
 
             # AI生成の説明
-            description = self.ai_descriptions.get(f"service_{service['name']}")
+            description = ai_get(f"service_{service['name']}")
             if description:
-                self.add_line(f"**説明**: {description}")
-                self.add_line()
+                extend((f"**説明**: {description}", ""))
 
-            if service.get('methods'):
-                self.add_line("**メソッド**:")
-                for method in service['methods']:
-                    self.add_line(f"- `{method['name']}({method['parameters']})` → `{method['return_type']}`")
-                self.add_line()
+            methods = service.get('methods')
+            if methods:
+                append("**メソッド**:")
+                extend([format_java_method(method) for method in methods])
+                append("")
 
-        self.add_line()
+        append("")
+        self._write_lines(lines)
 
     def _generate_java_repositories_section(self, repositories: List[Dict]):
         """Java Repositoriesセクションを生成"""
-        self.add_header("Repositories (データアクセス層)", level=2)
-        self.add_line()
+        self._write_section_header("Repositories (データアクセス層)")
 
+        lines = []
         for repo in repositories:
-            self.add_header(f"Repository: {repo['name']}", level=3)
-            self.add_line(f"**ファイル**: `{repo['file']}`")
-            self.add_line(f"**Entity**: `{repo.get('entity', 'Unknown')}<{repo.get('id_type', 'ID')}>`")
-            self.add_line()
-
-            if repo.get('custom_methods'):
-                self.add_line("**カスタムメソッド**:")
-                for method in repo['custom_methods']:
-                    self.add_line(f"- `{method['name']}({method['parameters']})` → `{method['return_type']}`")
-                self.add_line()
+            lines.extend((
+                f"### Repository: {repo['name']}",
+                f"**ファイル**: `{repo['file']}`",
+                f"**Entity**: `{repo.get('entity', 'Unknown')}<{repo.get('id_type', 'ID')}>`",
+                "",
+            ))
+
+            custom_methods = repo.get('custom_methods')
+            if custom_methods:
+                lines.append("**カスタムメソッド**:")
+                lines.extend([self._format_java_method(method) for method in custom_methods])
+                lines.append("")
 
-        self.add_line()
+        lines.append("")
+        self._write_lines(lines)
 
     def _generate_java_rest_endpoints_section(self, endpoints: List[Dict]):
         """Java REST Endpointsセクションを生成"""
-        self.add_header("REST API Endpoints", level=2)
-        self.add_line()
-
-        self.add_line("| Method | Path | Controller | Handler |")
-        self.add_line("|--------|------|------------|---------|")
-
-        for endpoint in endpoints:
-            self.add_line(
-                f"| {endpoint['method']} | `{endpoint['path']}` | {endpoint['controller']} | `{endpoint['handler']}()` |"
-            )
+        self._write_section_header("REST API Endpoints")
 
+        self._write_lines(("| Method | Path | Controller | Handler |", "|--------|------|------------|---------|"))
+        self._write_lines([self._format_endpoint_row(endpoint) for endpoint in endpoints])
         self.add_line()
 
     def _generate_java_dtos_section(self, dtos: List[Dict]):
         """Java DTOsセクションを生成"""
-        self.add_header("DTOs (Data Transfer Objects)", level=2)
-        self.add_line()
+        self._write_section_header("DTOs (Data Transfer Objects)")
 
+        lines = []
         for dto in dtos:
-            self.add_header(f"DTO: {dto['name']}", level=3)
-            self.add_line(f"**ファイル**: `{dto['file']}`")
-            self.add_line()
+            lines.extend((f"### DTO: {dto['name']}", f"**ファイル**: `{dto['file']}`", ""))
 
-            if dto.get('fields'):
-                self.add_line("**フィールド**:")
-                for field in dto['fields']:
-                    self.add_line(f"- `{field['name']}`: `{field['type']}`")
-                self.add_line()
+            fields = dto.get('fields')
+            if fields:
+                lines.append("**フィールド**:")
+                lines.extend([f"- `{field['name']}`: `{field['type']}`" for field in fields])
+                lines.append("")
 
-        self.add_line()
+        lines.append("")
+        self._write_lines(lines)
 
     def _generate_java_configs_section(self, configs: List[Dict]):
         """Java Configsセクションを生成"""
-        self.add_header("設定ファイル", level=2)
-        self.add_line()
+        self._write_section_header("設定ファイル")
 
+        lines = []
         for config in configs:
-            self.add_header(f"Config: {config['file']}", level=3)
-            self.add_line(f"**タイプ**: {config['type']}")
-            self.add_line()
+            lines.extend((f"### Config: {config['file']}", f"**タイプ**: {config['type']}", ""))
 
             if config['type'] == 'properties' and config.get('content'):
-                self.add_line("**設定内容**:")
-                for key, value in config['content'].items():
-                    self.add_line(f"- `{key}`: `{value}`")
-                self.add_line()
+                lines.append("**設定内容**:")
+                lines.extend([f"- `{key}`: `{value}`" for key, value in config['content'].items()])
+                lines.append("")
             elif config.get('content'):
-                self.add_code_block(config['content'][:500], 'yaml')
-                self.add_line()
+                lines.extend(("```yaml", config['content'][:500], "```", ""))
 
-        self.add_line()
+        lines.append("")
+        self._write_lines(lines)
 
     def generate_java_parts(self, data: Dict[str, Any], ai_descriptions: Dict[str, str] = None) -> Dict[str, str]:
         """
         Java/Spring Boot用の複数Markdownパートを生成（Notion階層出力用）
         Returns: {'overview': str, 'entities': str, 'api': str, 'services': str}
+                 （解析結果が空のパートは含まない）
         """
         parts: Dict[str, List[str]] = {
             'overview': [],
@@ -809,91 +880,93 @@ class MarkdownGenerator:
 
         # --- Entities ---
         def add_entities():
+            if not data.get('entities'):
+                return
             lines = parts['entities']
-            lines.append("# Entities (JPA)")
-            lines.append("")
+            lines.extend(("# Entities (JPA)", ""))
             for entity in data.get('entities', []):
-                lines.append(f"## Entity: {entity['name']}")
-                lines.append(f"**テーブル**: `{entity['table']}`")
-                lines.append(f"**ファイル**: `{entity['file']}`")
-                lines.append("")
+                lines.extend((
+                    f"## Entity: {entity['name']}",
+                    f"**テーブル**: `{entity['table']}`",
+                    f"**ファイル**: `{entity['file']}`",
+                    "",
+                ))
 
                 # AI生成の説明
                 description = self.ai_descriptions.get(f"entity_{entity['name']}")
                 if description:
-                    lines.append(f"**説明**: {description}")
-                    lines.append("")
+                    lines.extend((f"**説明**: {description}", ""))
 
-                if entity.get('fields'):
+                fields = entity.get('fields')
+                if fields:
                     lines.append("**フィールド**:")
-                    for field in entity['fields']:
-                        annotations = ', '.join(f"@{a}" for a in field.get('annotations', []))
-                        lines.append(f"- `{field['name']}` ({field['type']}) {annotations}")
+                    lines.extend([self._format_java_field(field) for field in fields])
                     lines.append("")
         add_entities()
 
         # --- API (Controllers + REST Endpoints) ---
         def add_api():
+            if not data.get('controllers') and not data.get('rest_endpoints'):
+                return
             lines = parts['api']
-            lines.append("# API (Controllers / Endpoints)")
-            lines.append("")
+            lines.extend(("# API (Controllers / Endpoints)", ""))
 
             # Controllers
-            lines.append("## Controllers")
-            lines.append("")
+            lines.extend(("## Controllers", ""))
             for controller in data.get('controllers', []):
-                lines.append(f"### {controller['name']}")
-                lines.append(f"**ファイル**: `{controller['file']}`")
-                lines.append(f"**ベースパス**: `{controller.get('base_path', '/')}`")
-                lines.append("")
+                lines.extend((
+                    f"### {controller['name']}",
+                    f"**ファイル**: `{controller['file']}`",
+                    f"**ベースパス**: `{controller.get('base_path', '/')}`",
+                    "",
+                ))
 
                 # AI生成の説明
                 description = self.ai_descriptions.get(f"controller_{controller['name']}")
                 if description:
-                    lines.append(f"**説明**: {description}")
-                    lines.append("")
+                    lines.extend((f"**説明**: {description}", ""))
 
-                if controller.get('endpoints'):
+                endpoints = controller.get('endpoints')
+                if endpoints:
                     lines.append("**エンドポイント**:")
-                    for endpoint in controller['endpoints']:
-                        lines.append(f"- `{endpoint['method']} {endpoint['path']}` → `{endpoint['handler']}()`")
+                    lines.extend([
+                        f"- `{endpoint['method']} {endpoint['path']}` → `{endpoint['handler']}()`"
+                        for endpoint in endpoints
+                    ])
                     lines.append("")
 
             # REST Endpoints一覧
             if data.get('rest_endpoints'):
-                lines.append("## REST API Endpoints 一覧")
-                lines.append("")
-                lines.append("| Method | Path | Controller | Handler |")
-                lines.append("|--------|------|------------|---------|")
-                for endpoint in data['rest_endpoints']:
-                    lines.append(
-                        f"| {endpoint['method']} | `{endpoint['path']}` | {endpoint['controller']} | `{endpoint['handler']}()` |"
-                    )
+                lines.extend((
+                    "## REST API Endpoints 一覧",
+                    "",
+                    "| Method | Path | Controller | Handler |",
+                    "|--------|------|------------|---------|",
+                ))
+                lines.extend([self._format_endpoint_row(endpoint) for endpoint in data['rest_endpoints']])
                 lines.append("")
         add_api()
 
         # --- Services ---
         def add_services():
+            if not data.get('services'):
+                return
             lines = parts['services']
-            lines.append("# Services (ビジネスロジック)")
-            lines.append("")
+            lines.extend(("# Services (ビジネスロジック)", ""))
 
             for service in data.get('services', []):
-                lines.append(f"## Service: {service['name']}")
-                lines.append(f"**ファイル**: `{service['file']}`")
-                lines.append("")
+                lines.extend((f"## Service: {service['name']}", f"**ファイル**: `{service['file']}`", ""))
 
                 # AI生成の説明
                 description = self.ai_descriptions.get(f"service_{service['name']}")
                 if description:
-                    lines.append(f"**説明**: {description}")
-                    lines.append("")
+                    lines.extend((f"**説明**: {description}", ""))
 
-                if service.get('methods'):
+                methods = service.get('methods')
+                if methods:
                     lines.append("**メソッド**:")
-                    for method in service['methods']:
-                        lines.append(f"- `{method['name']}({method['parameters']})` → `{method['return_type']}`")
+                    lines.extend([self._format_java_method(method) for method in methods])
                     lines.append("")
         add_services()
 
-        return {k: '\n'.join(v) for k, v in parts.items()}
+        return {k: '\n'.join(v) for k, v in parts.items() if v}
@@ -6,8 +6,149 @@ Notion Exporter - MarkdownをNotionページとしてアップロード
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import importlib.util
+import inspect
+import itertools
 import os
-from typing import List, Dict
+import re
+import threading
+import time
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Notion APIの平均レート制限（3リクエスト/秒）に合わせた同時実行数
+_APPEND_CONCURRENCY = 3
+
+# 子ページの作成順（Notion上の並び順になる）
+_UPLOAD_ORDER: Tuple[str, ...] = ('overview', 'db', 'api', 'security', 'graphql')
+
+# 429 (rate_limited) を受けたときの再試行回数と、Retry-After がない場合の初回待機秒数
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_BACKOFF = 1.0
+
+# トークンごとに共有する同期クライアント（keep-alive接続を使い回してTLSハンドシェイクを省く）
+_CLIENT_CACHE: Dict[str, object] = {}
+
+# HTTP/2 は h2 パッケージがある場合のみ有効にする（同一ホストへの並行リクエストを1接続に多重化）
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# 行頭の記法 -> Notionブロック種別（記法なしは段落）
+_PREFIX_TYPES = {
+    '# ': 'heading_1',
+    '## ': 'heading_2',
+    '### ': 'heading_3',
+    '- ': 'bulleted_list_item',
+    None: 'paragraph',
+}
+
+# 行頭の記法 -> (ブロック種別, 固定部分のひな形)。行ごとにひな形をコピーして本文だけ差し込む
+_BLOCK_TEMPLATES = {
+    prefix: (block_type, {"object": "block", "type": block_type})
+    for prefix, block_type in _PREFIX_TYPES.items()
+}
+
+# 行頭の記法と本文を1回のマッチで切り出す（記法は _PREFIX_TYPES から生成し、長いものを優先）
+_LINE_RE = re.compile('({})?(.*)'.format('|'.join(
+    re.escape(prefix) for prefix in sorted(filter(None, _PREFIX_TYPES), key=len, reverse=True)
+)))
+
+# iter_blocks で共有するブロックの上限（ストリーミング時にメモリを抱え込みすぎないよう定期的に捨てる）
+_SHARED_BLOCK_LIMIT = 4096
+
+
+def _chunked(iterable, size: int) -> Iterator[List]:
+    """イテラブルを size 件ずつのリストに分けて順に返す"""
+    it = iter(iterable)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+# _use_orjson_body が前提とする notion-client の _build_request の先頭の引数
+_BUILD_REQUEST_PARAMS = ['method', 'path', 'query', 'body']
+
+
+def _use_orjson_body(client):
+    """
+    notion-client のリクエストボディを orjson でエンコードするように差し替える
+
+    数千ブロックを送る場合、標準 json.dumps によるシリアライズがクライアント側の主なCPUコストになるため。
+    orjson がない場合やボディのないリクエスト（GET・ファイル送信）はそのまま notion-client に任せる。
+    _build_request は notion-client の非公開メソッドのため、引数が想定どおり
+    (method, path, query, body, ...) の順で並んでいる場合だけ差し替える。
+    """
+    build_request = getattr(client, '_build_request', None)
+    if orjson is None or build_request is None:
+        return client
+    try:
+        params = list(inspect.signature(build_request).parameters)
+    except (TypeError, ValueError):
+        return client
+    if params[:4] != _BUILD_REQUEST_PARAMS:
+        return client
+
+    def _build_request(method, path, query=None, body=None, *args, **kwargs):
+        request = build_request(method, path, query, None, *args, **kwargs)
+        if body is None or request.content:
+            return request
+        headers = request.headers.copy()
+        headers.pop('Content-Length', None)  # ボディなしで組み立てた際の "0" を捨てる
+        headers['Content-Type'] = 'application/json'
+        return request.__class__(
+            method,
+            request.url,
+            headers=headers,
+            content=orjson.dumps(body),
+            extensions=request.extensions,
+        )
+
+    client._build_request = _build_request
+    return client
+
+
+# 実行中のアップロード（同じ内容の重複実行を1回にまとめる）
+_INFLIGHT: Dict[tuple, concurrent.futures.Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _single_flight(method):
+    """
+    同じトークン・同じ引数のアップロードが実行中なら、新たにページを作らずその結果を待って返す
+
+    リトライや並行実行で同じページが重複作成されるのを防ぐ（完了済みのアップロードは対象外）
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        digest = hashlib.sha1(repr((args, sorted(kwargs.items()))).encode('utf-8')).hexdigest()
+        key = (method.__name__, self._token, digest)
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT.get(key)
+            owner = future is None
+            if owner:
+                future = _INFLIGHT[key] = concurrent.futures.Future()
+        if not owner:
+            return future.result()
+
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with _INFLIGHT_LOCK:
+                del _INFLIGHT[key]
+
+    return wrapper
 
 
 class NotionExporter:
@@ -15,13 +156,121 @@ class NotionExporter:
 
     def __init__(self, token: str):
         try:
-            from notion_client import Client  # type: ignore
+            from notion_client import APIResponseError, AsyncClient, Client  # type: ignore
         except ImportError as e:
             raise ImportError(
                 'notion-client がインストールされていません。pip install notion-client を実行してください。'
             ) from e
 
-        self.client = Client(auth=token)
+        client = _CLIENT_CACHE.get(token)
+        if client is None:
+            client = _CLIENT_CACHE[token] = _use_orjson_body(Client(auth=token))
+        self.client = client
+        self._async_client_cls = AsyncClient
+        self._api_error_cls = APIResponseError
+        self._token = token
+
+    def _async_http_client(self):
+        """
+        非同期クライアント用の httpx.AsyncClient を作る
+
+        イベントループに紐づくため、呼び出し側で async with により閉じること
+        """
+        import httpx  # notion-client の依存としてインストール済み
+
+        return httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            http2=_HTTP2_AVAILABLE,
+        )
+
+    def _rate_limit_delay(self, error: Exception, attempt: int):
+        """
+        APIエラーが再試行可能な429なら待機秒数を返す（それ以外・再試行上限到達時は None）
+
+        Retry-After ヘッダーがあればそれに従い、なければ指数バックオフする
+        """
+        if getattr(error, 'status', None) != 429 or attempt >= _RATE_LIMIT_RETRIES:
+            return None
+        headers = getattr(error, 'headers', None) or {}
+        try:
+            return float(headers.get('retry-after'))
+        except (TypeError, ValueError):
+            return _RATE_LIMIT_BACKOFF * (2 ** attempt)
+
+    def _call(self, func, *args, **kwargs):
+        """Notion APIを呼び出し、429の場合は待機して再試行する"""
+        attempt = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except self._api_error_cls as e:
+                delay = self._rate_limit_delay(e, attempt)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def _call_async(self, semaphore: asyncio.Semaphore, func, *args, **kwargs):
+        """_call の非同期版（待機中は同時実行枠を解放する）"""
+        attempt = 0
+        while True:
+            try:
+                async with semaphore:
+                    return await func(*args, **kwargs)
+            except self._api_error_cls as e:
+                delay = self._rate_limit_delay(e, attempt)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _append_chunks_async(self, client, page_id: str, chunks: List[List[Dict]], semaphore: asyncio.Semaphore):
+        """1ページ分の追記チャンクを順番に送信する（同一ページへの並列追記はブロック順が崩れるため）"""
+        for chunk in chunks:
+            await self._call_async(semaphore, client.blocks.children.append, page_id, children=chunk)
+
+    async def _create_pages_async(self, pages: List[tuple]) -> List[Dict]:
+        """
+        複数ページを作成し、101件目以降のブロックを追記する
+
+        ページは作成順がNotion上の並び順になるため順番に作成し、各ページの追記は
+        後続ページの作成と並行して流す（全体の同時実行数は _APPEND_CONCURRENCY まで）
+
+        Args:
+            pages: (pages.create の引数, 100件ずつの追記チャンク一覧) のリスト
+
+        Returns:
+            pages.create のレスポンス一覧（pages と同じ順）
+        """
+        semaphore = asyncio.Semaphore(_APPEND_CONCURRENCY)
+        responses = []
+        appends = []
+        # 接続プールはこの呼び出しの中で使い回し、ループを抜ける前に閉じる
+        async with self._async_http_client() as http_client:
+            client = _use_orjson_body(self._async_client_cls(auth=self._token, client=http_client))
+            for kwargs, chunks in pages:
+                resp = await self._call_async(semaphore, client.pages.create, **kwargs)
+                responses.append(resp)
+                if chunks:
+                    appends.append(asyncio.create_task(self._append_chunks_async(client, resp["id"], chunks, semaphore)))
+            await asyncio.gather(*appends)
+        return responses
+
+    def _create_pages(self, pages: List[tuple]) -> List[Dict]:
+        """_create_pages_async の同期ラッパー"""
+        if not pages:
+            return []
+        return asyncio.run(self._create_pages_async(pages))
+
+    def _split_blocks(self, markdown: str) -> Tuple[List[Dict], Iterator[List[Dict]]]:
+        """
+        Markdownを100件ずつのブロックチャンクに分ける
+
+        Returns:
+            (ページ作成時に送る最初の100件, 101件目以降のチャンクを順に返すイテレータ)
+        """
+        chunks = _chunked(self.iter_blocks(markdown), 100)  # Notion API制限: 1リクエスト100ブロックまで
+        return next(chunks, []), chunks
 
     def _line_to_block(self, line: str) -> Dict:
         """1行のMarkdownを簡易的にNotionブロックに変換"""
@@ -29,75 +278,68 @@ class NotionExporter:
         if not line:
             return {}
 
-        if line.startswith('### '):
-            return {
-                "object": "block",
-                "type": "heading_3",
-                "heading_3": {"rich_text": [{"text": {"content": line[4:]}}]},
-            }
-        if line.startswith('## '):
-            return {
-                "object": "block",
-                "type": "heading_2",
-                "heading_2": {"rich_text": [{"text": {"content": line[3:]}}]},
-            }
-        if line.startswith('# '):
-            return {
-                "object": "block",
-                "type": "heading_1",
-                "heading_1": {"rich_text": [{"text": {"content": line[2:]}}]},
-            }
-        if line.startswith('- '):
-            return {
-                "object": "block",
-                "type": "bulleted_list_item",
-                "bulleted_list_item": {"rich_text": [{"text": {"content": line[2:]}}]},
-            }
-        return {
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {"rich_text": [{"text": {"content": line}}]},
-        }
+        prefix, content = _LINE_RE.match(line).groups()
+        block_type, template = _BLOCK_TEMPLATES[prefix]
+        block = template.copy()
+        block[block_type] = {"rich_text": [{"text": {"content": content}}]}
+        return block
+
+    def iter_blocks(self, markdown: str) -> Iterator[Dict]:
+        """
+        シンプルなMarkdownをNotionブロックに変換しながら順に返す
+
+        同じ内容の行（区切りや定型文など）は同じブロックdictを共有する。
+        送信時にJSON化されるだけなので、返したブロックは書き換えないこと。
+        """
+        seen: Dict[str, Dict] = {}
+        for line in markdown.splitlines():
+            line = line.rstrip()
+            if not line:
+                continue
+            block = seen.get(line)
+            if block is None:
+                if len(seen) >= _SHARED_BLOCK_LIMIT:
+                    seen.clear()
+                block = seen[line] = self._line_to_block(line)
+            yield block
 
     def markdown_to_blocks(self, markdown: str) -> List[Dict]:
         """シンプルなMarkdownをNotionブロック配列に変換"""
-        blocks: List[Dict] = []
-        for raw_line in markdown.splitlines():
-            block = self._line_to_block(raw_line)
-            if block:
-                blocks.append(block)
-        return blocks
+        return list(self.iter_blocks(markdown))
 
+    @_single_flight
     def upload_markdown(self, markdown: str, parent_page_id: str, title: str = "AI Spec") -> str:
         """Markdown文字列をNotionページとしてアップロードし、ページURLを返す"""
-        blocks = self.markdown_to_blocks(markdown)
+        first, rest = self._split_blocks(markdown)
 
         # ページ作成
-        response = self.client.pages.create(
+        response = self._call(
+            self.client.pages.create,
             parent={"page_id": parent_page_id},
             properties={
                 "title": [{"text": {"content": title}}]
             },
-            children=blocks[:100],  # Notion API制限: 最初の100ブロックをまとめて
+            children=first,  # Notion API制限: 最初の100ブロックをまとめて
         )
 
         page_id = response["id"]
         page_url = response.get("url", "")
 
         # 100件を超える場合は追記
-        for i in range(100, len(blocks), 100):
-            chunk = blocks[i:i + 100]
-            self.client.blocks.children.append(page_id, children=chunk)
+        for chunk in rest:
+            self._call(self.client.blocks.children.append, page_id, children=chunk)
 
         return page_url
 
+    @_single_flight
     def upload_hierarchy(self, parts: Dict[str, str], parent_page_id: str, root_title: str = "AI Spec") -> str:
         """
         複数のMarkdownパートを子ページとしてアップロードし、ルートページURLを返す
         parts: {'overview': str, 'db': str, 'api': str, 'security': str, 'graphql': str}
         """
         # ルートページを作成（本文なし）
-        root = self.client.pages.create(
+        root = self._call(
+            self.client.pages.create,
             parent={"page_id": parent_page_id},
             properties={
                 "title": [{"text": {"content": root_title}}]
@@ -108,28 +350,10 @@ class NotionExporter:
         root_url = root.get("url", "")
 
         # 子ページを作成
-        order = ['overview', 'db', 'api', 'security', 'graphql']
-        for key in order:
-            if key not in parts:
-                continue
-            content = parts[key]
-            blocks = self.markdown_to_blocks(content)
-            self.client.pages.create(
-                parent={"page_id": root_id},
-                properties={
-                    "title": [{"text": {"content": key}}]
-                },
-                children=blocks[:100]
-            )
-            # 100件超は追記
-            if len(blocks) > 100:
-                page_id = self.client.search(filter={"property": "title", "text": {"equals": key}})["results"][0]["id"]
-                for i in range(100, len(blocks), 100):
-                    chunk = blocks[i:i + 100]
-                    self.client.blocks.children.append(page_id, children=chunk)
-
+        self._upload_children(parts, root_id)
         return root_url
 
+    @_single_flight
     def upload_hierarchy_flat(
         self,
         parts: Dict[str, str],
@@ -140,37 +364,46 @@ class NotionExporter:
         """
         複数パートを親ページ直下に子ページとして作成し、key -> url を返す
         """
-        urls = {}
-        order = ['overview', 'db', 'api', 'security', 'graphql']
-        for key in order:
-            if key not in parts:
+        responses = self._upload_children(parts, parent_page_id, emoji_map, title_map)
+        return {key: resp.get("url", "") for key, resp in responses.items()}
+
+    def _upload_children(
+        self,
+        parts: Dict[str, str],
+        parent_id: str,
+        emoji_map: Dict[str, str] = None,
+        title_map: Dict[str, str] = None,
+    ) -> Dict[str, Dict]:
+        """
+        各パートを parent_id 直下の子ページとして作成する
+
+        101件目以降のブロックは、作成レスポンスのページIDに対して追記する
+
+        Returns:
+            key -> pages.create のレスポンス
+        """
+        keys = []
+        pages = []
+        for key in _UPLOAD_ORDER:
+            content = parts.get(key)
+            if content is None:
                 continue
-            content = parts[key]
-            blocks = self.markdown_to_blocks(content)
-            icon = None
-            if emoji_map and key in emoji_map:
-                icon = {"type": "emoji", "emoji": emoji_map[key]}
+            first, rest = self._split_blocks(content)
             title = title_map.get(key, key) if title_map else key
-
-            resp = self.client.pages.create(
-                parent={"page_id": parent_page_id},
-                icon=icon,
+            kwargs = dict(
+                parent={"page_id": parent_id},
                 properties={
                     "title": [{"text": {"content": title}}]
                 },
-                children=blocks[:100]
+                children=first
             )
-            page_url = resp.get("url", "")
-            urls[key] = page_url
+            if emoji_map and key in emoji_map:
+                kwargs["icon"] = {"type": "emoji", "emoji": emoji_map[key]}
 
-            # 100件超は追記
-            page_id = resp["id"]
-            if len(blocks) > 100:
-                for i in range(100, len(blocks), 100):
-                    chunk = blocks[i:i + 100]
-                    self.client.blocks.children.append(page_id, children=chunk)
+            keys.append(key)
+            pages.append((kwargs, list(rest)))
 
-        return urls
+        return dict(zip(keys, self._create_pages(pages)))
 
 
 def get_notion_credentials(cli_token: str | None, cli_page_id: str | None) -> tuple[str, str]:
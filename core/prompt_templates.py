@@ -4,6 +4,8 @@ Prompt Templates - AI生成用のプロンプトテンプレート
 Few-Shot学習と仕様書テンプレートを活用したプロンプトエンジニアリング
 """
 
+from typing import Tuple
+
 # ============================================
 # Few-Shot Examples for Models
 # ============================================
@@ -171,88 +173,68 @@ SPEC_DOCUMENT_TEMPLATE = """
 # Prompt Generator Functions
 # ============================================
 
-def generate_model_prompt(model: dict) -> str:
-    """
-    Eloquent Modelの説明を生成するためのプロンプト
+# 解析項目が空の場合の解析情報テキスト（よくある空ケースは join を通さず組み立てる）
+_EMPTY_MODEL_DETAILS = "モデル名: {}\nテーブル名: {}\nFillable: \nリレーション: "
+_EMPTY_SERVICE_DETAILS = "クラス名: {}\nメソッド: "
 
-    Few-Shot学習を活用し、一貫性のある説明を生成
-    """
+
+def format_model_details(model: dict) -> str:
+    """Eloquent Modelの解析情報をプロンプト用の複数行テキストにする"""
     class_name = model['class_name']
     table_name = model.get('table_name', 'N/A')
-    fillable = ', '.join(model.get('fillable', []))
-    relations = ', '.join([f"{r['method']} ({r['type']} → {r['related_model']})"
-                          for r in model.get('relations', [])])
-
-    prompt = f"""
-{MODEL_DESCRIPTION_EXAMPLES}
-
-### 新しいモデルの説明を生成
-
-モデル名: {class_name}
+    if not model.get('fillable') and not model.get('relations'):
+        # 項目のないモデルは結合処理を省く
+        return _EMPTY_MODEL_DETAILS.format(class_name, table_name)
+    fillable = ', '.join(model.get('fillable', ()))
+    relations = ', '.join(f"{r['method']} ({r['type']} → {r['related_model']})"
+                          for r in model.get('relations', ()))
+    return f"""モデル名: {class_name}
 テーブル名: {table_name}
 Fillable: {fillable}
-リレーション: {relations}
-
-上記のFew-Shot例に倣って、このモデルの役割を**1文**で簡潔に日本語で説明してください。
-
-説明のフォーマット:
-「〜を管理し、〜の機能を提供する」
-
-回答は説明文のみを返してください（前置きや補足は不要）。
-"""
-    return prompt.strip()
+リレーション: {relations}"""
 
 
-def generate_controller_prompt(controller: dict) -> str:
-    """Controllerの説明を生成するためのプロンプト"""
+def format_controller_details(controller: dict) -> str:
+    """Controllerの解析情報をプロンプト用の複数行テキストにする"""
     class_name = controller['class_name']
-    methods = ', '.join([m['name'] + '()' for m in controller.get('methods', [])])
-
-    prompt = f"""
-{CONTROLLER_DESCRIPTION_EXAMPLES}
-
-### 新しいコントローラーの説明を生成
-
-クラス名: {class_name}
-メソッド: {methods}
-
-上記のFew-Shot例に倣って、このコントローラーの責務を**1文**で簡潔に日本語で説明してください。
+    methods = ', '.join(m['name'] + '()' for m in controller.get('methods', ()))
+    return f"""クラス名: {class_name}
+メソッド: {methods}"""
 
-説明のフォーマット:
-「〜を担当し、〜の操作を提供する」
-
-回答は説明文のみを返してください（前置きや補足は不要）。
-"""
-    return prompt.strip()
 
-
-def generate_service_prompt(service: dict) -> str:
-    """Serviceの説明を生成するためのプロンプト"""
+def format_service_details(service: dict) -> str:
+    """Serviceの解析情報をプロンプト用の複数行テキストにする"""
     class_name = service['class_name']
     method_items = service.get('methods', [])
+    if not method_items:
+        return _EMPTY_SERVICE_DETAILS.format(class_name)
     method_names = []
     if method_items and isinstance(method_items[0], dict):
         method_names = [m.get('name') for m in method_items if m.get('name')]
     else:
         method_names = method_items
-    methods = ', '.join([m for m in method_names if m])
+    methods = ', '.join(m for m in method_names if m)
+    return f"""クラス名: {class_name}
+メソッド: {methods}"""
 
-    prompt = f"""
-{SERVICE_DESCRIPTION_EXAMPLES}
 
-### 新しいサービスの説明を生成
+def generate_model_prompt(model: dict) -> str:
+    """
+    Eloquent Modelの説明を生成するためのプロンプト
 
-クラス名: {class_name}
-メソッド: {methods}
+    Few-Shot学習を活用し、一貫性のある説明を生成
+    """
+    return '\n\n'.join(generate_description_prompt_parts('model', model))
 
-上記のFew-Shot例に倣って、このサービスの責務を**1文**で簡潔に日本語で説明してください。
 
-説明のフォーマット:
-「〜を担当し、〜の処理を行う」
+def generate_controller_prompt(controller: dict) -> str:
+    """Controllerの説明を生成するためのプロンプト"""
+    return '\n\n'.join(generate_description_prompt_parts('controller', controller))
 
-回答は説明文のみを返してください（前置きや補足は不要）。
-"""
-    return prompt.strip()
+
+def generate_service_prompt(service: dict) -> str:
+    """Serviceの説明を生成するためのプロンプト"""
+    return '\n\n'.join(generate_description_prompt_parts('service', service))
 
 
 def generate_project_summary_prompt(data: dict) -> str:
@@ -263,12 +245,12 @@ def generate_project_summary_prompt(data: dict) -> str:
     """
     models_count = len(data.get('models', []))
     controllers_count = len(data.get('controllers', []))
-    routes_count = sum(len(routes) for routes in data.get('routes', {}).values())
+    routes_count = sum(map(len, data.get('routes', {}).values()))
     migrations_count = len(data.get('migrations', []))
     services_count = len(data.get('services', []))
     has_graphql = len(data.get('graphql_schemas', {})) > 0
 
-    models_list = ', '.join([m['class_name'] for m in data.get('models', [])])
+    models_list = ', '.join(m['class_name'] for m in data.get('models', ()))
 
     # GraphQL情報
     graphql_queries = len(data.get('graphql_resolvers', {}).get('queries', []))
@@ -426,83 +408,60 @@ Service名: NotificationService
 # Java用のPrompt Generator Functions
 # ============================================
 
-def generate_java_entity_prompt(entity: dict) -> str:
-    """JPA Entityの説明を生成するためのプロンプト"""
+_EMPTY_JAVA_ENTITY_DETAILS = "Entity名: {}\nテーブル名: {}\nフィールド: \nアノテーション: "
+
+
+def format_java_entity_details(entity: dict) -> str:
+    """JPA Entityの解析情報をプロンプト用の複数行テキストにする"""
     entity_name = entity['name']
     table_name = entity.get('table', 'N/A')
-    fields = ', '.join([f['name'] for f in entity.get('fields', [])])
+    entity_fields = entity.get('fields', ())
+    if not entity_fields:
+        # フィールドのないEntityはアノテーション集計も含めて省く
+        return _EMPTY_JAVA_ENTITY_DETAILS.format(entity_name, table_name)
+    fields = ', '.join(f['name'] for f in entity_fields)
     annotations = set()
-    for field in entity.get('fields', []):
-        annotations.update(field.get('annotations', []))
-    annotation_str = ', '.join([f'@{a}' for a in annotations])
-
-    prompt = f"""
-{JAVA_ENTITY_DESCRIPTION_EXAMPLES}
-
-### 新しいEntityの説明を生成
-
-Entity名: {entity_name}
+    for field in entity_fields:
+        annotations.update(field.get('annotations', ()))
+    annotation_str = ', '.join(f'@{a}' for a in annotations)
+    return f"""Entity名: {entity_name}
 テーブル名: {table_name}
 フィールド: {fields}
-アノテーション: {annotation_str}
-
-上記のFew-Shot例に倣って、このEntityの役割を**1文**で簡潔に日本語で説明してください。
-
-説明のフォーマット:
-「〜を永続化し、〜を担う」または「〜を管理し、〜を記録する」
+アノテーション: {annotation_str}"""
 
-回答は説明文のみを返してください（前置きや補足は不要）。
-"""
-    return prompt.strip()
 
-
-def generate_java_controller_prompt(controller: dict) -> str:
-    """REST Controllerの説明を生成するためのプロンプト"""
+def format_java_controller_details(controller: dict) -> str:
+    """REST Controllerの解析情報をプロンプト用の複数行テキストにする"""
     controller_name = controller['name']
     base_path = controller.get('base_path', '/')
     endpoints = controller.get('endpoints', [])
-    endpoint_summary = ', '.join([f"{e['method']} {e['path']}" for e in endpoints[:5]])
-
-    prompt = f"""
-{JAVA_CONTROLLER_DESCRIPTION_EXAMPLES}
-
-### 新しいControllerの説明を生成
-
-Controller名: {controller_name}
+    endpoint_summary = ', '.join(f"{e['method']} {e['path']}" for e in endpoints[:5])
+    return f"""Controller名: {controller_name}
 ベースパス: {base_path}
-エンドポイント: {endpoint_summary}
-
-上記のFew-Shot例に倣って、このControllerの責務を**1文**で簡潔に日本語で説明してください。
-
-説明のフォーマット:
-「〜を提供し、〜を公開する」または「〜を担当し、〜を提供する」
+エンドポイント: {endpoint_summary}"""
 
-回答は説明文のみを返してください（前置きや補足は不要）。
-"""
-    return prompt.strip()
 
-
-def generate_java_service_prompt(service: dict) -> str:
-    """Serviceの説明を生成するためのプロンプト"""
+def format_java_service_details(service: dict) -> str:
+    """Serviceの解析情報をプロンプト用の複数行テキストにする"""
     service_name = service['name']
-    methods = ', '.join([m['name'] + '()' for m in service.get('methods', [])])
+    methods = ', '.join(m['name'] + '()' for m in service.get('methods', ()))
+    return f"""Service名: {service_name}
+メソッド: {methods}"""
 
-    prompt = f"""
-{JAVA_SERVICE_DESCRIPTION_EXAMPLES}
 
-### 新しいServiceの説明を生成
+def generate_java_entity_prompt(entity: dict) -> str:
+    """JPA Entityの説明を生成するためのプロンプト"""
+    return '\n\n'.join(generate_description_prompt_parts('java_entity', entity))
 
-Service名: {service_name}
-メソッド: {methods}
 
-上記のFew-Shot例に倣って、このServiceの責務を**1文**で簡潔に日本語で説明してください。
+def generate_java_controller_prompt(controller: dict) -> str:
+    """REST Controllerの説明を生成するためのプロンプト"""
+    return '\n\n'.join(generate_description_prompt_parts('java_controller', controller))
 
-説明のフォーマット:
-「〜を担当し、〜を提供する」または「〜を集約し、〜を実装する」
 
-回答は説明文のみを返してください（前置きや補足は不要）。
-"""
-    return prompt.strip()
+def generate_java_service_prompt(service: dict) -> str:
+    """Serviceの説明を生成するためのプロンプト"""
+    return '\n\n'.join(generate_description_prompt_parts('java_service', service))
 
 
 def generate_java_project_summary_prompt(data: dict) -> str:
@@ -512,7 +471,7 @@ def generate_java_project_summary_prompt(data: dict) -> str:
     services_count = len(data.get('services', []))
     endpoints_count = len(data.get('rest_endpoints', []))
 
-    entities_list = ', '.join([e['name'] for e in data.get('entities', [])])
+    entities_list = ', '.join(e['name'] for e in data.get('entities', ()))
 
     prompt = f"""
 あなたはJava/Spring Bootプロジェクトの技術仕様書を作成するテクニカルライターです。
@@ -561,3 +520,131 @@ def generate_java_project_summary_prompt(data: dict) -> str:
 5. 箇条書きは3〜5件に収め、動詞は名詞形で簡潔に
 """
     return prompt.strip()
+
+
+# ============================================
+# 説明生成プロンプトの分割（Few-Shot例を cached_prefix として共有）
+# ============================================
+
+# 種別 -> (Few-Shot例, 対象の呼び名, 説明させる観点, 説明のフォーマット, 解析情報の整形関数)
+DESCRIPTION_PROMPT_KINDS = {
+    'model': (MODEL_DESCRIPTION_EXAMPLES, 'モデル', '役割',
+              '「〜を管理し、〜の機能を提供する」', format_model_details),
+    'controller': (CONTROLLER_DESCRIPTION_EXAMPLES, 'コントローラー', '責務',
+                   '「〜を担当し、〜の操作を提供する」', format_controller_details),
+    'service': (SERVICE_DESCRIPTION_EXAMPLES, 'サービス', '責務',
+                '「〜を担当し、〜の処理を行う」', format_service_details),
+    'java_entity': (JAVA_ENTITY_DESCRIPTION_EXAMPLES, 'Entity', '役割',
+                    '「〜を永続化し、〜を担う」または「〜を管理し、〜を記録する」', format_java_entity_details),
+    'java_controller': (JAVA_CONTROLLER_DESCRIPTION_EXAMPLES, 'Controller', '責務',
+                        '「〜を提供し、〜を公開する」または「〜を担当し、〜を提供する」', format_java_controller_details),
+    'java_service': (JAVA_SERVICE_DESCRIPTION_EXAMPLES, 'Service', '責務',
+                     '「〜を担当し、〜を提供する」または「〜を集約し、〜を実装する」', format_java_service_details),
+}
+
+
+# 単体の説明生成プロンプトの個別部分は「前半 + 解析情報 + 後半」。Few-Shot例は cached_prefix として前に連結する
+DESCRIPTION_PROMPT_HEAD = "### 新しい{noun}の説明を生成\n\n"
+
+DESCRIPTION_PROMPT_TAIL = """
+
+上記のFew-Shot例に倣って、この{noun}の{aspect}を**1文**で簡潔に日本語で説明してください。
+
+説明のフォーマット:
+{answer_format}
+
+回答は説明文のみを返してください（前置きや補足は不要）。"""
+
+# 種別 -> (cached_prefix, 個別部分の前半, 後半)。解析情報以外は種別ごとに固定なので読み込み時に組み立てておく
+_DESCRIPTION_PROMPT_PIECES = {
+    kind: (
+        examples.lstrip(),
+        DESCRIPTION_PROMPT_HEAD.format(noun=noun),
+        DESCRIPTION_PROMPT_TAIL.format(noun=noun, aspect=aspect, answer_format=answer_format),
+    )
+    for kind, (examples, noun, aspect, answer_format, _) in DESCRIPTION_PROMPT_KINDS.items()
+}
+
+
+def _description_prompt(kind: str, details: str) -> str:
+    """説明生成プロンプトの個別部分を組み立てる（種別ごとに固定の前半・後半で解析情報を挟む）"""
+    _, head, tail = _DESCRIPTION_PROMPT_PIECES[kind]
+    return ''.join((head, details, tail))
+
+
+def generate_description_prompt_parts(kind: str, entity: dict) -> Tuple[str, str]:
+    """
+    説明生成プロンプトを、全エンティティ共通のFew-Shot例と個別部分に分けて返す
+
+    Few-Shot例を AIBackend の cached_prefix として渡すと、対応バックエンドではプロンプトキャッシュが効く
+
+    Args:
+        kind: DESCRIPTION_PROMPT_KINDS のキー（'model', 'java_entity' など）
+        entity: パーサーが返した解析情報
+
+    Returns:
+        (cached_prefix, prompt) のタプル。'\n\n' で連結すると generate_*_prompt() と同じ文字列になる
+    """
+    format_details = DESCRIPTION_PROMPT_KINDS[kind][4]
+    return _DESCRIPTION_PROMPT_PIECES[kind][0], _description_prompt(kind, format_details(entity))
+
+
+# ============================================
+# 一括生成（複数クラスの説明を1プロンプトで依頼）
+# ============================================
+
+# 一括生成時に共通で送るFew-Shot例（cached_prefix として渡す想定）
+BATCH_DESCRIPTION_EXAMPLES = '\n'.join([
+    MODEL_DESCRIPTION_EXAMPLES.strip(),
+    CONTROLLER_DESCRIPTION_EXAMPLES.strip(),
+    SERVICE_DESCRIPTION_EXAMPLES.strip(),
+])
+
+JAVA_BATCH_DESCRIPTION_EXAMPLES = '\n'.join([
+    JAVA_ENTITY_DESCRIPTION_EXAMPLES.strip(),
+    JAVA_CONTROLLER_DESCRIPTION_EXAMPLES.strip(),
+    JAVA_SERVICE_DESCRIPTION_EXAMPLES.strip(),
+])
+
+# 一括生成で説明のフォーマットを示す種別（DESCRIPTION_PROMPT_KINDS のキー）
+BATCH_DESCRIPTION_KINDS = ('model', 'controller', 'service')
+JAVA_BATCH_DESCRIPTION_KINDS = ('java_entity', 'java_controller', 'java_service')
+
+# 種別の組 -> 回答例の説明文（Few-Shot例の1件目から取る）
+_BATCH_EXAMPLE_ANSWERS = {
+    BATCH_DESCRIPTION_KINDS: 'ユーザーアカウント情報を管理し、認証とTodoとの関連を持つ',
+    JAVA_BATCH_DESCRIPTION_KINDS: 'ユーザーアカウント情報を永続化し、認証とアプリケーション全体のユーザー管理を担う',
+}
+
+
+def generate_batch_description_prompt(entries: dict, kinds: Tuple[str, ...] = BATCH_DESCRIPTION_KINDS) -> str:
+    """
+    複数クラスの説明をまとめて生成するためのプロンプト
+
+    Args:
+        entries: キー -> format_*_details() の解析情報テキスト
+        kinds: 説明のフォーマットを示す種別（Java なら JAVA_BATCH_DESCRIPTION_KINDS）
+
+    Returns:
+        キーごとの説明文をJSONオブジェクトで返させるプロンプト
+    """
+    items = '\n\n'.join(f"#### {key}\n{details}" for key, details in entries.items())
+    answer_formats = '\n'.join(
+        f"- {DESCRIPTION_PROMPT_KINDS[kind][1]}: {DESCRIPTION_PROMPT_KINDS[kind][3]}" for kind in kinds
+    )
+    example_answer = _BATCH_EXAMPLE_ANSWERS.get(tuple(kinds), _BATCH_EXAMPLE_ANSWERS[BATCH_DESCRIPTION_KINDS])
+
+    prompt = f"""
+### 以下のクラスの説明をまとめて生成
+
+{items}
+
+Few-Shot例に倣って、各クラスの役割・責務をそれぞれ**1文**で簡潔に日本語で説明してください。
+
+説明のフォーマット:
+{answer_formats}
+
+回答は、上記の見出し（#### の後の文字列）をキー、説明文を値とするJSONオブジェクトのみを返してください（前置きや補足は不要）。
+例: {{"{next(iter(entries), 'model_User')}": "{example_answer}"}}
+"""
+    return prompt.strip()
@@ -16,6 +16,57 @@ from pathlib import Path
 import os
 
 
+def generate_descriptions(ai, tasks, batch_tasks=(), examples=None, concurrency=8, kinds=None):
+    """
+    AIで説明文を生成し、key -> 説明文 の辞書を返す
+
+    tasks は (key, label, prompt) のリストで、1件ずつ並列に生成する。
+    batch_tasks は (key, label, 解析情報) のリストで、まとめて1つのプロンプトで生成する
+    （kinds は説明のフォーマットを示す種別。Java なら JAVA_BATCH_DESCRIPTION_KINDS）。
+    同時に実行するリクエストは concurrency 件まで（レート制限を受けると自動で絞る）。
+    失敗した項目は ✗ を表示してスキップする
+    """
+    prompts = [prompt for _, _, prompt in tasks]
+    results = dict(zip([key for key, _, _ in tasks], ai.generate_many(prompts, concurrency=concurrency)))
+    if batch_tasks:
+        entities = {key: details for key, _, details in batch_tasks}
+        results.update(ai.generate_descriptions(
+            entities, concurrency=concurrency, cached_prefix=examples, kinds=kinds
+        ))
+
+    descriptions = {}
+    for key, label, _ in [*tasks, *batch_tasks]:
+        result = results[key]
+        if isinstance(result, Exception):
+            print(f'   ✗ {label}: {result}')
+            continue
+        descriptions[key] = result.strip()
+        print(f'   ✓ {label}')
+    return descriptions
+
+
+def write_markdown(output_path, chunks):
+    """
+    Markdownのチャンクを生成されたそばからファイルへ書き出し、書き込んだ文字数を返す
+    """
+    size = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for chunk in chunks:
+            f.write(chunk)
+            size += len(chunk)
+    return size
+
+
+def iter_parts_markdown(parts):
+    """
+    パートごとのMarkdownを空行区切りで1つの文書として順に返す（連結した文字列は作らない）
+    """
+    for index, content in enumerate(parts.values()):
+        if index:
+            yield '\n\n'
+        yield content
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='AIを使ってプロジェクトの仕様書を自動生成'
@@ -59,6 +110,19 @@ def main():
         help='AI補完を使用せず、正規表現抽出のみで仕様書生成'
     )
 
+    parser.add_argument(
+        '--ai-concurrency',
+        type=int,
+        default=8,
+        help='AIへの同時リクエスト数の上限 (デフォルト: 8、レート制限を受けると自動で減らす)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='キャッシュ（Javaの解析結果・AIの応答）を使わない'
+    )
+
     # 出力オプション
     parser.add_argument(
         '--output',
@@ -104,6 +168,8 @@ def main():
     args = parser.parse_args()
 
     # バリデーション
+    if args.ai_concurrency < 1:
+        parser.error('--ai-concurrency は1以上を指定してください')
     if args.output == 'notion':
         if not (args.notion_token or os.getenv('NOTION_TOKEN') or os.getenv('NOTION_API_KEY')):
             parser.error('--output notion を指定する場合は --notion-token または環境変数 NOTION_TOKEN/NOTION_API_KEY が必要です')
@@ -148,13 +214,13 @@ def main():
                 print('\n🔍 プロジェクト全体を解析中...')
                 data = parser.parse_all()
             else:
-                # 最初のファイルからプロジェクトルートを推測
+                # 最初のファイルからプロジェクトルートを推測（composer.json のある最も近い祖先、なければ最上位）
                 first_file = Path(args.file[0])
-                project_root = first_file.parent
-                while project_root.parent != project_root:
-                    if (project_root / 'composer.json').exists():
-                        break
-                    project_root = project_root.parent
+                candidates = (first_file.parent, *first_file.parent.parents)
+                project_root = next(
+                    (directory for directory in candidates if (directory / 'composer.json').exists()),
+                    candidates[-1]
+                )
 
                 parser = LaravelParser(project_root)
                 print(f'\n🔍 指定されたファイルを解析中...')
@@ -180,11 +246,13 @@ def main():
             # AI補完（オプション）
             ai_descriptions = {}
             if not args.no_ai:
-                from core.ai_backend import get_ai_backend
+                from core.ai_backend import CachedBackend, get_ai_backend
                 from core.prompt_templates import (
-                    generate_model_prompt,
-                    generate_controller_prompt,
-                    generate_service_prompt,
+                    BATCH_DESCRIPTION_EXAMPLES,
+                    BATCH_DESCRIPTION_KINDS,
+                    format_model_details,
+                    format_controller_details,
+                    format_service_details,
                     generate_project_summary_prompt
                 )
 
@@ -194,50 +262,29 @@ def main():
 
                 try:
                     ai = get_ai_backend(backend_name)
+                    if not args.no_cache:
+                        ai = CachedBackend(ai)
 
-                    # プロジェクト全体のサマリー生成
-                    print(f'   📋 プロジェクト概要を生成中...')
-                    try:
-                        summary_prompt = generate_project_summary_prompt(data)
-                        ai_descriptions['project_summary'] = ai.generate(summary_prompt).strip()
-                        print(f'   ✓ プロジェクト概要')
-                    except Exception as e:
-                        print(f'   ✗ プロジェクト概要: {e}')
-
-                    # Modelsの説明を生成
-                    print(f'   📦 Models説明を生成中...')
+                    # プロジェクト概要は個別に、Models・Controllers・Servicesの説明はまとめて生成
+                    tasks = [('project_summary', 'プロジェクト概要', generate_project_summary_prompt(data))]
+                    batch_tasks = []
                     for model in data.get('models', []):
                         class_name = model['class_name']
-                        try:
-                            prompt = generate_model_prompt(model)
-                            ai_descriptions[f'model_{class_name}'] = ai.generate(prompt).strip()
-                            print(f'   ✓ Model: {class_name}')
-                        except Exception as e:
-                            print(f'   ✗ Model {class_name}: {e}')
-
-                    # Controllersの説明を生成
-                    print(f'   🎮 Controllers説明を生成中...')
+                        batch_tasks.append((f'model_{class_name}', f'Model: {class_name}', format_model_details(model)))
                     for controller in data.get('controllers', []):
                         class_name = controller['class_name']
                         if not controller.get('methods'):
                             continue
-                        try:
-                            prompt = generate_controller_prompt(controller)
-                            ai_descriptions[f'controller_{class_name}'] = ai.generate(prompt).strip()
-                            print(f'   ✓ Controller: {class_name}')
-                        except Exception as e:
-                            print(f'   ✗ Controller {class_name}: {e}')
-
-                    # Servicesの説明を生成
-                    print(f'   ⚙️  Services説明を生成中...')
+                        batch_tasks.append((f'controller_{class_name}', f'Controller: {class_name}', format_controller_details(controller)))
                     for service in data.get('services', []):
                         class_name = service['class_name']
-                        try:
-                            prompt = generate_service_prompt(service)
-                            ai_descriptions[f'service_{class_name}'] = ai.generate(prompt).strip()
-                            print(f'   ✓ Service: {class_name}')
-                        except Exception as e:
-                            print(f'   ✗ Service {class_name}: {e}')
+                        batch_tasks.append((f'service_{class_name}', f'Service: {class_name}', format_service_details(service)))
+
+                    print(f'   📋 {len(tasks) + len(batch_tasks)}件の説明を生成中（クラス説明{len(batch_tasks)}件はまとめて依頼）...')
+                    ai_descriptions.update(generate_descriptions(
+                        ai, tasks, batch_tasks, BATCH_DESCRIPTION_EXAMPLES, args.ai_concurrency,
+                        BATCH_DESCRIPTION_KINDS,
+                    ))
 
                     print(f'\n   ✅ 完了: {len(ai_descriptions)}個の説明を生成')
 
@@ -248,17 +295,15 @@ def main():
             if args.output in ['markdown', 'markdown-multi', 'notion', 'notion-hier']:
                 print(f'\n📝 Markdownを生成中...')
                 generator = MarkdownGenerator()
-                markdown = generator.generate(data, ai_descriptions)
 
                 # 出力ディレクトリ作成
                 output_path = Path(args.output_file)
                 output_path.parent.mkdir(parents=True, exist_ok=True)
 
                 if args.output == 'markdown':
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        f.write(markdown)
+                    size = write_markdown(output_path, generator.iter_markdown(data, ai_descriptions))
                     print(f'✅ 仕様書を生成しました: {output_path}')
-                    print(f'   サイズ: {len(markdown)} 文字')
+                    print(f'   サイズ: {size} 文字')
 
                 elif args.output == 'markdown-multi':
                     parts = generator.generate_parts(data, ai_descriptions)
@@ -270,10 +315,15 @@ def main():
 
                 elif args.output in ['notion', 'notion-hier']:
                     # まずローカル保存（単一/複数でもデバッグ用に残す）
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        f.write(markdown)
+                    # 階層モードはパートを1回だけ生成し、アップロードする内容をそのまま連結して保存する
+                    if args.output == 'notion':
+                        markdown = generator.generate(data, ai_descriptions)
+                        size = write_markdown(output_path, (markdown,))
+                    else:
+                        parts = generator.generate_parts(data, ai_descriptions)
+                        size = write_markdown(output_path, iter_parts_markdown(parts))
                     print(f'✅ 仕様書を生成しました: {output_path}')
-                    print(f'   サイズ: {len(markdown)} 文字')
+                    print(f'   サイズ: {size} 文字')
 
                     from core.notion_exporter import NotionExporter, get_notion_credentials
 
@@ -287,7 +337,6 @@ def main():
                             print(f'✅ Notion にアップロードしました: {page_url}')
                         else:
                             # 階層モード: 複数パートをアップロード
-                            parts = generator.generate_parts(data, ai_descriptions)
                             if args.notion_flat:
                                 emoji_map = {
                                     'overview': '🗂️',
@@ -317,12 +366,12 @@ def main():
                 print(f'\n⚠️  {args.output} 出力は未実装です')
 
         elif args.plugin == 'java':
-            from plugins.java.parser import JavaParser
+            from plugins.java.parser import DEFAULT_CACHE_DIR, JavaParser
             from core.markdown_generator import MarkdownGenerator
 
             # パーサー初期化
             if args.dir:
-                parser = JavaParser(args.dir)
+                parser = JavaParser(args.dir, cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR)
                 print('\n🔍 Javaプロジェクト全体を解析中...')
                 data = parser.parse_all()
             else:
@@ -342,11 +391,13 @@ def main():
             # AI補完（オプション）
             ai_descriptions = {}
             if not args.no_ai:
-                from core.ai_backend import get_ai_backend
+                from core.ai_backend import CachedBackend, get_ai_backend
                 from core.prompt_templates import (
-                    generate_java_entity_prompt,
-                    generate_java_controller_prompt,
-                    generate_java_service_prompt,
+                    JAVA_BATCH_DESCRIPTION_EXAMPLES,
+                    JAVA_BATCH_DESCRIPTION_KINDS,
+                    format_java_entity_details,
+                    format_java_controller_details,
+                    format_java_service_details,
                     generate_java_project_summary_prompt
                 )
 
@@ -356,48 +407,24 @@ def main():
 
                 try:
                     ai = get_ai_backend(backend_name)
+                    if not args.no_cache:
+                        ai = CachedBackend(ai)
+
+                    # プロジェクト概要は個別に、Entities・Controllers・Servicesの説明はまとめて生成
+                    tasks = [('project_summary', 'プロジェクト概要', generate_java_project_summary_prompt(data))]
+                    batch_tasks = []
+                    for entity in data.get('entities', []):
+                        batch_tasks.append((f"entity_{entity['name']}", f"Entity: {entity['name']}", format_java_entity_details(entity)))
+                    for controller in data.get('controllers', []):
+                        batch_tasks.append((f"controller_{controller['name']}", f"Controller: {controller['name']}", format_java_controller_details(controller)))
+                    for service in data.get('services', []):
+                        batch_tasks.append((f"service_{service['name']}", f"Service: {service['name']}", format_java_service_details(service)))
 
-                    # プロジェクト全体のサマリー生成
-                    print(f'   📋 プロジェクト概要を生成中...')
-                    try:
-                        project_summary = ai.generate(generate_java_project_summary_prompt(data))
-                        ai_descriptions['project_summary'] = project_summary
-                        print(f'   ✓ プロジェクト概要')
-                    except Exception as e:
-                        print(f'   ✗ プロジェクト概要: {e}')
-
-                    # Entities説明を生成
-                    if data.get('entities'):
-                        print(f'   🏛️  Entities説明を生成中...')
-                        for entity in data['entities']:
-                            try:
-                                description = ai.generate(generate_java_entity_prompt(entity))
-                                ai_descriptions[f"entity_{entity['name']}"] = description
-                                print(f'   ✓ Entity: {entity["name"]}')
-                            except Exception as e:
-                                print(f'   ✗ Entity {entity["name"]}: {e}')
-
-                    # Controllers説明を生成
-                    if data.get('controllers'):
-                        print(f'   🎮 Controllers説明を生成中...')
-                        for controller in data['controllers']:
-                            try:
-                                description = ai.generate(generate_java_controller_prompt(controller))
-                                ai_descriptions[f"controller_{controller['name']}"] = description
-                                print(f'   ✓ Controller: {controller["name"]}')
-                            except Exception as e:
-                                print(f'   ✗ Controller {controller["name"]}: {e}')
-
-                    # Services説明を生成
-                    if data.get('services'):
-                        print(f'   ⚙️  Services説明を生成中...')
-                        for service in data['services']:
-                            try:
-                                description = ai.generate(generate_java_service_prompt(service))
-                                ai_descriptions[f"service_{service['name']}"] = description
-                                print(f'   ✓ Service: {service["name"]}')
-                            except Exception as e:
-                                print(f'   ✗ Service {service["name"]}: {e}')
+                    print(f'   📋 {len(tasks) + len(batch_tasks)}件の説明を生成中（クラス説明{len(batch_tasks)}件はまとめて依頼）...')
+                    ai_descriptions.update(generate_descriptions(
+                        ai, tasks, batch_tasks, JAVA_BATCH_DESCRIPTION_EXAMPLES, args.ai_concurrency,
+                        JAVA_BATCH_DESCRIPTION_KINDS,
+                    ))
 
                     total_descriptions = len([k for k in ai_descriptions.keys() if k != 'project_summary'])
                     print(f'\n   ✅ 完了: {total_descriptions}個の説明を生成')
@@ -413,21 +440,21 @@ def main():
             output_path = Path(args.output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Markdown生成
-            markdown = generator.generate(data, ai_descriptions)
-
             if args.output == 'markdown':
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown)
+                size = write_markdown(output_path, generator.iter_markdown(data, ai_descriptions))
                 print(f'✅ 仕様書を生成しました: {output_path}')
-                print(f'   サイズ: {len(markdown)} 文字')
+                print(f'   サイズ: {size} 文字')
 
             elif args.output in ['notion', 'notion-hier']:
-                # まずローカル保存
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown)
+                # まずローカル保存（階層モードはパートを1回だけ生成し、連結して保存する）
+                if args.output == 'notion':
+                    markdown = generator.generate(data, ai_descriptions)
+                    size = write_markdown(output_path, (markdown,))
+                else:
+                    parts = generator.generate_java_parts(data, ai_descriptions)
+                    size = write_markdown(output_path, iter_parts_markdown(parts))
                 print(f'✅ 仕様書を生成しました: {output_path}')
-                print(f'   サイズ: {len(markdown)} 文字')
+                print(f'   サイズ: {size} 文字')
 
                 from core.notion_exporter import NotionExporter, get_notion_credentials
 
@@ -441,7 +468,6 @@ def main():
                         print(f'✅ Notion にアップロードしました: {page_url}')
                     else:
                         # 階層モード: 複数パートをアップロード
-                        parts = generator.generate_java_parts(data, ai_descriptions)
                         if args.notion_flat:
                             emoji_map = {
                                 'overview': '🗂️',
@@ -2,22 +2,216 @@
 Java Parser - Java/Spring Boot プロジェクトを解析
 """
 
+import contextlib
+import hashlib
+import mmap
+import os
+import pickle
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Tuple, Union
+
+try:
+    import re2  # google-re2 / pyre2: 線形時間で照合する正規表現エンジン
+except ImportError:
+    re2 = None
+
+
+# .java ファイル解析の並列度（I/O待ちが主なので CPU 数より多めに取る）
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# この大きさ（バイト）以上の .java ファイルは読み込まずに mmap する（小さいファイルは mmap の準備の方が高くつく）
+_MMAP_MIN_SIZE = 8 * 1024
+
+# 解析結果キャッシュのバージョン。抽出ロジックや結果の形を変えたら上げる
+PARSER_VERSION = 4
+
+# ファイル単位の解析結果キャッシュの置き場所
+DEFAULT_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'ai-spec-gen' / 'java'
+
+# re のフラグに対応するインラインフラグ（re2 の各実装でフラグ引数の形式が異なるため、パターン側で指定する）
+_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+
+def _compile(pattern: str, flags: int = 0):
+    """
+    正規表現をコンパイル（re2 があれば re2 を使い、非対応の構文や未インストールなら re にフォールバック）
+
+    Args:
+        pattern: 正規表現
+        flags: re のフラグ（IGNORECASE / MULTILINE / DOTALL）
+
+    Returns:
+        コンパイル済みパターン
+    """
+    if re2 is not None:
+        inline = ''.join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+        try:
+            return re2.compile(f'(?{inline}){pattern}' if inline else pattern)
+        except Exception:
+            # 先読みなど re2 が対応していない構文
+            pass
+    return re.compile(pattern, flags)
+
+
+# クラス名・インターフェース名
+_RE_CLASS = _compile(r'(?:public\s+)?class\s+(\w+)')
+_RE_INTERFACE = _compile(r'(?:public\s+)?interface\s+(\w+)')
+
+# Entity: @Table(name = "...") と、JPAアノテーション付きフィールド
+_RE_TABLE = _compile(r'@Table\s*\(\s*name\s*=\s*"(\w+)"')
+# JPAのフィールドアノテーション（前方一致）
+_ENTITY_FIELD_ANNOTATIONS = (
+    'Id', 'Column', 'OneToMany', 'ManyToOne', 'ManyToMany', 'OneToOne', 'JoinColumn', 'GeneratedValue'
+)
+# アノテーションとフィールド宣言を出現順に1回で拾うトークナイザ
+_RE_ANNOTATION_OR_FIELD = _compile(
+    r'@(\w+)(?:\([^)]*\))?'
+    r'|(?:private|protected|public)\s+(\w+(?:<[\w\s,<>]+>)?)\s+(\w+)\s*;'
+)
+
+# Controller: クラスの @RequestMapping("...") と、メソッドのマッピングアノテーション
+_RE_BASE_PATH = _compile(r'@RequestMapping\s*\(\s*"([^"]+)"')
+# マッピングアノテーションとメソッドシグネチャを出現順に1回で拾う（マッピングの直後のメソッドがハンドラ）
+# 括弧なしの @GetMapping などはパスなしとして扱う
+_RE_MAPPING_OR_HANDLER = _compile(
+    r'@(GetMapping|PostMapping|PutMapping|DeleteMapping|PatchMapping|RequestMapping)'
+    r'(?:\s*\(\s*(?:value\s*=\s*)?(?:"([^"]+)"|path\s*=\s*"([^"]+)")?\s*\)|(?!\s*\())'
+    r'|(?:public|private|protected)\s+\w+(?:<[\w\s,<>]+>)?\s+(\w+)\s*\(',
+    re.MULTILINE
+)
+
+# Service: メソッドシグネチャ
+_RE_SERVICE_METHOD = _compile(
+    r'(?:public|private|protected)\s+(\w+(?:<[\w\s,<>]+>)?)\s+(\w+)\s*\(([^)]*)\)',
+    re.MULTILINE
+)
+
+# Repository: 継承元のジェネリクスと、カスタムメソッド宣言
+_RE_REPOSITORY_TYPES = _compile(r'extends\s+(?:JpaRepository|CrudRepository)<(\w+),\s*(\w+)>')
+_RE_REPOSITORY_METHOD = _compile(r'(\w+(?:<[\w\s,<>]+>)?)\s+(\w+)\s*\(([^)]*)\)\s*;', re.MULTILINE)
+
+# DTO: フィールド宣言
+_RE_DTO_FIELD = _compile(
+    r'(?:private|protected|public)\s+(\w+(?:<[\w\s,<>]+>)?)\s+(\w+)\s*;',
+    re.MULTILINE
+)
+
+# 型本体の切り出し: 文字列リテラル・コメントを読み飛ばしながら波括弧を拾う
+_RE_BRACE_OR_SKIP = _compile(
+    r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|//[^\n]*|/\*.*?\*/|[{}]',
+    re.DOTALL
+)
+
+# 設定ファイル: 値をマスクするセンシティブなキー
+_RE_SENSITIVE = _compile(r'password|secret|key|token', re.IGNORECASE)
+
+
+def _type_body(content: str, declaration: re.Match) -> str:
+    """
+    クラス・インターフェース宣言に続く本体（外側の波括弧の中身）を切り出す
+
+    メンバーの正規表現をファイル全体ではなく本体だけに適用するために使う。
+    括弧の対応が取れない場合は宣言以降をすべて本体とみなす。
+
+    Args:
+        content: ファイル内容
+        declaration: _RE_CLASS / _RE_INTERFACE のマッチ
+
+    Returns:
+        本体の文字列
+    """
+    depth = 0
+    open_end = None
+    for token in _RE_BRACE_OR_SKIP.finditer(content, declaration.end()):
+        brace = token.group()
+        if brace == '{':
+            if depth == 0:
+                open_end = token.end()
+            depth += 1
+        elif brace == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                return content[open_end:token.start()]
+    return content[open_end if open_end is not None else declaration.end():]
+
+
+@contextlib.contextmanager
+def _read_java_bytes(file_path: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    ファイル内容をバイト列として開く
+
+    _MMAP_MIN_SIZE 以上のファイルは読み込まずに mmap し、OSのページを直接参照する
+    （マーカー判定で外れた大きなファイルはコピーせずに済む）。
+
+    Args:
+        file_path: ファイルパス
+
+    Yields:
+        ファイル内容（bytes または読み取り専用の mmap）
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            yield f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
 
 
 class JavaParser:
     """Java/Spring Bootプロジェクトパーサー"""
 
-    def __init__(self, project_root: Path):
+    # 種別 -> (検出マーカー, 解析メソッド名)。いずれかのマーカーを含む .java ファイルを解析する
+    # マーカーはデコード前のバイト列に対して判定する
+    _MARKER_KINDS = {
+        'entities': ((b'@Entity', b'@Table'), '_parse_entity_file'),
+        'controllers': ((b'@RestController', b'@Controller'), '_parse_controller_file'),
+        'services': ((b'@Service',), '_parse_service_file'),
+        'repositories': ((b'@Repository', b'extends JpaRepository', b'extends CrudRepository'), '_parse_repository_file'),
+    }
+
+    # .java ファイルから抽出する種別（DTOはパス名で判定）
+    _JAVA_KINDS = ('entities', 'controllers', 'services', 'repositories', 'dtos')
+
+    # 相対パスにいずれかを含む .java ファイルをDTOとして扱う
+    _DTO_PATH_KEYWORDS = ('dto', 'request', 'response')
+
+    # 設定ファイルの種別（拡張子と同じ。application*.<拡張子> を対象にする）
+    _CONFIG_TYPES = ('properties', 'yml', 'yaml')
+
+    # 走査しないディレクトリ（ビルド成果物・生成物・ツールの作業領域）
+    _SKIP_DIRS = frozenset({'target', 'build', 'out', '.gradle', '.git', 'bin', 'node_modules', '.idea', '.mvn'})
+
+    def __init__(self, project_root: Path, cache_dir: Path = DEFAULT_CACHE_DIR):
         """
         初期化
 
         Args:
             project_root: Javaプロジェクトのルートディレクトリ
+            cache_dir: ファイル単位の解析結果キャッシュの置き場所（None でキャッシュしない）
         """
         self.project_root = Path(project_root)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # os.walk(project_root) が返すパスの共通の接頭辞（相対パスは文字列の切り出しで求める）
+        root = str(self.project_root)
+        self._root_prefix = '' if root == '.' else os.path.join(root, '')
+
+    def _relative_path(self, file_path: Path) -> str:
+        """
+        プロジェクトルートからの相対パス（文字列）
+
+        Args:
+            file_path: プロジェクト内のファイルパス
+
+        Returns:
+            相対パス
+        """
+        path = str(file_path)
+        if path.startswith(self._root_prefix):
+            return path[len(self._root_prefix):]
+        return str(file_path.relative_to(self.project_root))
 
     def parse_all(self) -> Dict[str, Any]:
         """
@@ -26,36 +220,198 @@ class JavaParser:
         Returns:
             解析結果の辞書
         """
+        java_files, config_files = self._scan_files()
+        java = self._parse_java_files(java_files)
         return {
-            'entities': self.parse_entities(),
-            'controllers': self.parse_controllers(),
-            'services': self.parse_services(),
-            'repositories': self.parse_repositories(),
-            'dtos': self.parse_dtos(),
-            'configs': self.parse_configs(),
-            'rest_endpoints': self.parse_rest_endpoints(),
+            'entities': java['entities'],
+            'controllers': java['controllers'],
+            'services': java['services'],
+            'repositories': java['repositories'],
+            'dtos': java['dtos'],
+            'configs': self._parse_config_files(config_files),
+            'rest_endpoints': self.parse_rest_endpoints(java['controllers']),
         }
 
-    def parse_entities(self) -> List[Dict]:
+    def _scan_files(self) -> Tuple[List[Path], Dict[str, List[Path]]]:
         """
-        JPA Entityを解析
+        プロジェクトを1回だけ走査し、.java ファイルと設定ファイルを集める
+
+        _SKIP_DIRS に含まれるディレクトリの中には降りない。
 
         Returns:
-            Entity情報のリスト
+            (.java ファイルのリスト, 設定ファイルの種別 -> ファイルのリスト)。順序は行きがけ順
+        """
+        java_files = []
+        config_files = {config_type: [] for config_type in self._CONFIG_TYPES}
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            dirnames[:] = [dirname for dirname in dirnames if dirname not in self._SKIP_DIRS]
+            directory = Path(dirpath)
+            for filename in filenames:
+                if filename.endswith('.java'):
+                    java_files.append(directory / filename)
+                elif filename.startswith('application'):
+                    extension = filename.rpartition('.')[2]
+                    if extension in config_files:
+                        config_files[extension].append(directory / filename)
+        return java_files, config_files
+
+    def _parse_java_files(self, java_files: List[Path], kinds: Tuple[str, ...] = _JAVA_KINDS) -> Dict[str, List[Dict]]:
+        """
+        .java ファイルを1回ずつ読み込み、種別ごとの解析メソッドに振り分ける
+
+        Args:
+            java_files: 解析対象の .java ファイル
+            kinds: 抽出する種別（_JAVA_KINDS のサブセット）
+
+        Returns:
+            種別 -> 解析結果のリスト
+        """
+        results = {kind: [] for kind in kinds}
+        marker_kinds = [(kind, *self._MARKER_KINDS[kind]) for kind in kinds if kind in self._MARKER_KINDS]
+        want_dtos = 'dtos' in results
+        if not marker_kinds and not want_dtos:
+            return results
+
+        # ファイルごとの解析は互いに独立なのでスレッドで並列化する。
+        # map は入力順に結果を返すため、結果の並びはファイル順のまま変わらない
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            parsed = executor.map(
+                lambda java_file: self._parse_java_file(java_file, marker_kinds, want_dtos),
+                java_files
+            )
+            for file_results in parsed:
+                for kind, info in file_results:
+                    results[kind].append(info)
+
+        return results
+
+    def _parse_java_file(self, java_file: Path, marker_kinds: List[Tuple[str, Tuple[bytes, ...], str]],
+                         want_dtos: bool) -> List[Tuple[str, Dict]]:
         """
-        entities = []
+        .java ファイル1つを読み込み、該当する種別の解析メソッドを適用する
 
-        # src/main/java 配下の Entity を検索
-        for java_file in self.project_root.rglob('*.java'):
-            content = java_file.read_text(encoding='utf-8', errors='ignore')
+        Args:
+            java_file: 解析対象の .java ファイル
+            marker_kinds: (種別, 検出マーカー, 解析メソッド名) のリスト
+            want_dtos: DTOも抽出するか
 
-            # @Entity アノテーションを持つクラスを検出
-            if '@Entity' in content or '@Table' in content:
-                entity_info = self._parse_entity_file(java_file, content)
-                if entity_info:
-                    entities.append(entity_info)
+        Returns:
+            (種別, 解析結果) のリスト
+        """
+        # dto, request, response パッケージ内のクラスはDTOとして扱う
+        # （判定はプロジェクト内の相対パスで行い、小文字化は1回だけにする）
+        if want_dtos:
+            relative_path = self._relative_path(java_file).lower()
+            is_dto = any(keyword in relative_path for keyword in self._DTO_PATH_KEYWORDS)
+        else:
+            is_dto = False
+        if not marker_kinds and not is_dto:
+            return []
+
+        # マーカーに当たったファイルだけデコードする
+        with _read_java_bytes(java_file) as data:
+            # mmap の in は1バイト単位の判定になるため find で探す
+            hits = [
+                (kind, method_name) for kind, markers, method_name in marker_kinds
+                if any(data.find(marker) != -1 for marker in markers)
+            ]
+            if not hits and not is_dto:
+                return []
+
+            # 内容・パス・対象種別が同じなら前回の解析結果を使う
+            cache_key = None
+            if self.cache_dir:
+                cache_key = self._cache_key(java_file, data, [kind for kind, _ in hits], is_dto)
+                cached = self._load_cache(cache_key)
+                if cached is not None:
+                    return cached
+
+            content = str(data, 'utf-8', 'ignore')
+            # read_text() と同様に改行を LF へ揃える
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+        file_results = []
+        for kind, method_name in hits:
+            info = getattr(self, method_name)(java_file, content)
+            if info:
+                file_results.append((kind, info))
+
+        if is_dto:
+            dto_info = self._parse_dto_file(java_file, content)
+            if dto_info:
+                file_results.append(('dtos', dto_info))
+
+        if cache_key:
+            self._store_cache(cache_key, file_results)
+
+        return file_results
+
+    def _cache_key(self, java_file: Path, data: Union[bytes, mmap.mmap], kinds: List[str], is_dto: bool) -> str:
+        """
+        解析結果キャッシュのキーを計算
+
+        結果にはプロジェクトルートからの相対パスが入るため、内容と合わせてキーに含める。
 
-        return entities
+        Args:
+            java_file: 解析対象の .java ファイル
+            data: ファイル内容（バイト列または mmap）
+            kinds: マーカーに当たった種別
+            is_dto: DTOとして扱うか
+
+        Returns:
+            キー（16進文字列）
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        header = (PARSER_VERSION, self._relative_path(java_file), tuple(kinds), is_dto)
+        digest.update(repr(header).encode('utf-8'))
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _load_cache(self, cache_key: str) -> List[Tuple[str, Dict]]:
+        """
+        キャッシュから解析結果を読み込む
+
+        Args:
+            cache_key: キャッシュキー
+
+        Returns:
+            解析結果（キャッシュがない・読めない場合は None）
+        """
+        cache_path = self.cache_dir / cache_key[:2] / f'{cache_key}.pkl'
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # キャッシュがない・壊れている場合は解析し直す
+            return None
+
+    def _store_cache(self, cache_key: str, file_results: List[Tuple[str, Dict]]) -> None:
+        """
+        解析結果をキャッシュに書き込む（書けない場合は何もしない）
+
+        Args:
+            cache_key: キャッシュキー
+            file_results: 解析結果
+        """
+        cache_path = self.cache_dir / cache_key[:2] / f'{cache_key}.pkl'
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # 並列に書き込んでも壊れないよう、一時ファイルに書いてから置き換える
+            with tempfile.NamedTemporaryFile('wb', dir=cache_path.parent, delete=False) as f:
+                pickle.dump(file_results, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, cache_path)
+        except OSError:
+            pass
+
+    def parse_entities(self) -> List[Dict]:
+        """
+        JPA Entityを解析
+
+        Returns:
+            Entity情報のリスト
+        """
+        return self._parse_java_files(self._scan_files()[0], ('entities',))['entities']
 
     def _parse_entity_file(self, file_path: Path, content: str) -> Dict:
         """
@@ -69,74 +425,67 @@ class JavaParser:
             Entity情報
         """
         # クラス名を取得
-        class_match = re.search(r'(?:public\s+)?class\s+(\w+)', content)
+        class_match = _RE_CLASS.search(content)
         if not class_match:
             return None
 
         class_name = class_match.group(1)
 
         # テーブル名を取得
-        table_match = re.search(r'@Table\s*\(\s*name\s*=\s*"(\w+)"', content)
+        table_match = _RE_TABLE.search(content)
         table_name = table_match.group(1) if table_match else class_name.lower()
 
         # フィールドを解析
-        fields = []
-        field_pattern = re.compile(
-            r'@(?:Id|Column|OneToMany|ManyToOne|ManyToMany|OneToOne|JoinColumn|GeneratedValue)'
-            r'[\s\S]*?'
-            r'(?:private|protected|public)\s+(\w+(?:<[\w\s,<>]+>)?)\s+(\w+)\s*;',
-            re.MULTILINE
-        )
-
-        for match in field_pattern.finditer(content):
-            field_type = match.group(1)
-            field_name = match.group(2)
-
-            # アノテーションを抽出
-            annotations = self._extract_field_annotations(content, field_name)
-
-            fields.append({
-                'name': field_name,
-                'type': field_type,
-                'annotations': annotations,
-            })
+        fields = self._extract_entity_fields(_type_body(content, class_match))
 
         return {
             'name': class_name,
             'table': table_name,
-            'file': str(file_path.relative_to(self.project_root)),
+            'file': self._relative_path(file_path),
             'fields': fields,
         }
 
-    def _extract_field_annotations(self, content: str, field_name: str) -> List[str]:
+    def _extract_entity_fields(self, content: str) -> List[Dict]:
         """
-        フィールドのアノテーションを抽出
+        JPAアノテーション付きのフィールドを、アノテーションと一緒に1回の走査で抽出
+
+        JPAアノテーションが現れた後の最初のフィールド宣言を対象とし、
+        宣言の直前に空白だけを挟んで連続するアノテーションをそのフィールドのものとする。
 
         Args:
             content: ファイル内容
-            field_name: フィールド名
 
         Returns:
-            アノテーションのリスト
+            フィールド情報のリスト
         """
+        fields = []
         annotations = []
+        has_entity_annotation = False
+        last_end = 0
+
+        for match in _RE_ANNOTATION_OR_FIELD.finditer(content):
+            # 空白以外を挟んだらアノテーションの連続は途切れる
+            if content[last_end:match.start()].strip():
+                annotations = []
+            last_end = match.end()
+
+            annotation = match.group(1)
+            if annotation is not None:
+                annotations.append(annotation)
+                if annotation.startswith(_ENTITY_FIELD_ANNOTATIONS):
+                    has_entity_annotation = True
+                continue
 
-        # フィールド定義の前の行からアノテーションを抽出
-        pattern = re.compile(
-            rf'(@\w+(?:\([^)]*\))?)\s*'
-            rf'(?:(?:@\w+(?:\([^)]*\))?)\s*)*'
-            rf'(?:private|protected|public)\s+\w+(?:<[\w\s,<>]+>)?\s+{field_name}\s*;',
-            re.MULTILINE
-        )
-
-        match = pattern.search(content)
-        if match:
-            # すべてのアノテーションを取得
-            anno_pattern = re.compile(r'@(\w+)(?:\([^)]*\))?')
-            for anno_match in anno_pattern.finditer(match.group(0)):
-                annotations.append(anno_match.group(1))
+            if has_entity_annotation:
+                fields.append({
+                    'name': match.group(3),
+                    'type': match.group(2),
+                    'annotations': annotations,
+                })
+                has_entity_annotation = False
+            annotations = []
 
-        return annotations
+        return fields
 
     def parse_controllers(self) -> List[Dict]:
         """
@@ -145,18 +494,7 @@ class JavaParser:
         Returns:
             Controller情報のリスト
         """
-        controllers = []
-
-        for java_file in self.project_root.rglob('*.java'):
-            content = java_file.read_text(encoding='utf-8', errors='ignore')
-
-            # @RestController または @Controller を持つクラスを検出
-            if '@RestController' in content or '@Controller' in content:
-                controller_info = self._parse_controller_file(java_file, content)
-                if controller_info:
-                    controllers.append(controller_info)
-
-        return controllers
+        return self._parse_java_files(self._scan_files()[0], ('controllers',))['controllers']
 
     def _parse_controller_file(self, file_path: Path, content: str) -> Dict:
         """
@@ -170,25 +508,27 @@ class JavaParser:
             Controller情報
         """
         # クラス名を取得
-        class_match = re.search(r'(?:public\s+)?class\s+(\w+)', content)
+        class_match = _RE_CLASS.search(content)
         if not class_match:
             return None
 
         class_name = class_match.group(1)
 
         # ベースパスを取得
-        base_path_match = re.search(r'@RequestMapping\s*\(\s*"([^"]+)"', content)
+        base_path_match = _RE_BASE_PATH.search(content)
         base_path = base_path_match.group(1) if base_path_match else ''
 
         # エンドポイントを解析
         endpoints = []
-        method_pattern = re.compile(
-            r'@(GetMapping|PostMapping|PutMapping|DeleteMapping|PatchMapping|RequestMapping)'
-            r'\s*\(\s*(?:value\s*=\s*)?(?:"([^"]+)"|path\s*=\s*"([^"]+)")?\s*\)',
-            re.MULTILINE
-        )
+        pending = []  # ハンドラのメソッド名がまだ決まっていないエンドポイント
+        for match in _RE_MAPPING_OR_HANDLER.finditer(_type_body(content, class_match)):
+            handler = match.group(4)
+            if handler is not None:
+                for endpoint in pending:
+                    endpoint['handler'] = handler
+                pending = []
+                continue
 
-        for match in method_pattern.finditer(content):
             http_method = match.group(1).replace('Mapping', '').upper()
             if http_method == 'REQUEST':
                 http_method = 'GET'  # デフォルト
@@ -196,22 +536,17 @@ class JavaParser:
             endpoint_path = match.group(2) or match.group(3) or ''
             full_path = f"{base_path}{endpoint_path}"
 
-            # メソッド名を取得
-            method_name_match = re.search(
-                rf'{re.escape(match.group(0))}[\s\S]*?(?:public|private|protected)\s+\w+(?:<[\w\s,<>]+>)?\s+(\w+)\s*\(',
-                content
-            )
-            method_name = method_name_match.group(1) if method_name_match else 'unknown'
-
-            endpoints.append({
+            endpoint = {
                 'method': http_method,
                 'path': full_path,
-                'handler': method_name,
-            })
+                'handler': 'unknown',
+            }
+            endpoints.append(endpoint)
+            pending.append(endpoint)
 
         return {
             'name': class_name,
-            'file': str(file_path.relative_to(self.project_root)),
+            'file': self._relative_path(file_path),
             'base_path': base_path,
             'endpoints': endpoints,
         }
@@ -223,18 +558,7 @@ class JavaParser:
         Returns:
             Service情報のリスト
         """
-        services = []
-
-        for java_file in self.project_root.rglob('*.java'):
-            content = java_file.read_text(encoding='utf-8', errors='ignore')
-
-            # @Service アノテーションを持つクラスを検出
-            if '@Service' in content:
-                service_info = self._parse_service_file(java_file, content)
-                if service_info:
-                    services.append(service_info)
-
-        return services
+        return self._parse_java_files(self._scan_files()[0], ('services',))['services']
 
     def _parse_service_file(self, file_path: Path, content: str) -> Dict:
         """
@@ -248,7 +572,7 @@ class JavaParser:
             Service情報
         """
         # クラス名を取得
-        class_match = re.search(r'(?:public\s+)?class\s+(\w+)', content)
+        class_match = _RE_CLASS.search(content)
         if not class_match:
             return None
 
@@ -256,12 +580,7 @@ class JavaParser:
 
         # メソッドを解析
         methods = []
-        method_pattern = re.compile(
-            r'(?:public|private|protected)\s+(\w+(?:<[\w\s,<>]+>)?)\s+(\w+)\s*\(([^)]*)\)',
-            re.MULTILINE
-        )
-
-        for match in method_pattern.finditer(content):
+        for match in _RE_SERVICE_METHOD.finditer(_type_body(content, class_match)):
             return_type = match.group(1)
             method_name = match.group(2)
             params = match.group(3).strip()
@@ -278,7 +597,7 @@ class JavaParser:
 
         return {
             'name': class_name,
-            'file': str(file_path.relative_to(self.project_root)),
+            'file': self._relative_path(file_path),
             'methods': methods,
         }
 
@@ -289,18 +608,7 @@ class JavaParser:
         Returns:
             Repository情報のリスト
         """
-        repositories = []
-
-        for java_file in self.project_root.rglob('*.java'):
-            content = java_file.read_text(encoding='utf-8', errors='ignore')
-
-            # @Repository または JpaRepository を継承するインターフェースを検出
-            if '@Repository' in content or 'extends JpaRepository' in content or 'extends CrudRepository' in content:
-                repo_info = self._parse_repository_file(java_file, content)
-                if repo_info:
-                    repositories.append(repo_info)
-
-        return repositories
+        return self._parse_java_files(self._scan_files()[0], ('repositories',))['repositories']
 
     def _parse_repository_file(self, file_path: Path, content: str) -> Dict:
         """
@@ -314,22 +622,20 @@ class JavaParser:
             Repository情報
         """
         # インターフェース名を取得
-        interface_match = re.search(r'(?:public\s+)?interface\s+(\w+)', content)
+        interface_match = _RE_INTERFACE.search(content)
         if not interface_match:
             return None
 
         interface_name = interface_match.group(1)
 
         # Entity型を取得
-        entity_match = re.search(r'extends\s+(?:JpaRepository|CrudRepository)<(\w+),\s*(\w+)>', content)
+        entity_match = _RE_REPOSITORY_TYPES.search(content)
         entity_type = entity_match.group(1) if entity_match else 'Unknown'
         id_type = entity_match.group(2) if entity_match else 'Unknown'
 
         # カスタムメソッドを解析
         methods = []
-        method_pattern = re.compile(r'(\w+(?:<[\w\s,<>]+>)?)\s+(\w+)\s*\(([^)]*)\)\s*;', re.MULTILINE)
-
-        for match in method_pattern.finditer(content):
+        for match in _RE_REPOSITORY_METHOD.finditer(_type_body(content, interface_match)):
             return_type = match.group(1)
             method_name = match.group(2)
             params = match.group(3).strip()
@@ -342,7 +648,7 @@ class JavaParser:
 
         return {
             'name': interface_name,
-            'file': str(file_path.relative_to(self.project_root)),
+            'file': self._relative_path(file_path),
             'entity': entity_type,
             'id_type': id_type,
             'custom_methods': methods,
@@ -355,18 +661,7 @@ class JavaParser:
         Returns:
             DTO情報のリスト
         """
-        dtos = []
-
-        for java_file in self.project_root.rglob('*.java'):
-            # dto, request, response パッケージ内のクラスを検索
-            if any(keyword in str(java_file).lower() for keyword in ['dto', 'request', 'response']):
-                content = java_file.read_text(encoding='utf-8', errors='ignore')
-
-                dto_info = self._parse_dto_file(java_file, content)
-                if dto_info:
-                    dtos.append(dto_info)
-
-        return dtos
+        return self._parse_java_files(self._scan_files()[0], ('dtos',))['dtos']
 
     def _parse_dto_file(self, file_path: Path, content: str) -> Dict:
         """
@@ -380,7 +675,7 @@ class JavaParser:
             DTO情報
         """
         # クラス名を取得
-        class_match = re.search(r'(?:public\s+)?class\s+(\w+)', content)
+        class_match = _RE_CLASS.search(content)
         if not class_match:
             return None
 
@@ -388,12 +683,7 @@ class JavaParser:
 
         # フィールドを解析
         fields = []
-        field_pattern = re.compile(
-            r'(?:private|protected|public)\s+(\w+(?:<[\w\s,<>]+>)?)\s+(\w+)\s*;',
-            re.MULTILINE
-        )
-
-        for match in field_pattern.finditer(content):
+        for match in _RE_DTO_FIELD.finditer(_type_body(content, class_match)):
             field_type = match.group(1)
             field_name = match.group(2)
 
@@ -404,7 +694,7 @@ class JavaParser:
 
         return {
             'name': class_name,
-            'file': str(file_path.relative_to(self.project_root)),
+            'file': self._relative_path(file_path),
             'fields': fields,
         }
 
@@ -415,30 +705,34 @@ class JavaParser:
         Returns:
             設定情報のリスト
         """
+        return self._parse_config_files(self._scan_files()[1])
+
+    def _parse_config_files(self, config_files: Dict[str, List[Path]]) -> List[Dict]:
+        """
+        application*.properties / yml / yaml を解析
+
+        Args:
+            config_files: 設定ファイルの種別 -> ファイルのリスト
+
+        Returns:
+            設定情報のリスト（properties, yml, yaml の順）
+        """
         configs = []
 
-        # application.properties を検索
-        for prop_file in self.project_root.rglob('application*.properties'):
+        for prop_file in config_files['properties']:
             configs.append({
-                'file': str(prop_file.relative_to(self.project_root)),
+                'file': self._relative_path(prop_file),
                 'type': 'properties',
                 'content': self._parse_properties_file(prop_file),
             })
 
-        # application.yml を検索
-        for yml_file in self.project_root.rglob('application*.yml'):
-            configs.append({
-                'file': str(yml_file.relative_to(self.project_root)),
-                'type': 'yml',
-                'content': self._parse_yml_file(yml_file),
-            })
-
-        for yaml_file in self.project_root.rglob('application*.yaml'):
-            configs.append({
-                'file': str(yaml_file.relative_to(self.project_root)),
-                'type': 'yaml',
-                'content': self._parse_yml_file(yaml_file),
-            })
+        for config_type in ('yml', 'yaml'):
+            for yml_file in config_files[config_type]:
+                configs.append({
+                    'file': self._relative_path(yml_file),
+                    'type': config_type,
+                    'content': self._parse_yml_file(yml_file),
+                })
 
         return configs
 
@@ -453,17 +747,18 @@ class JavaParser:
             設定情報
         """
         properties = {}
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
 
-        for line in content.split('\n'):
-            line = line.strip()
-            if line and not line.startswith('#'):
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    # センシティブ情報をマスク
-                    if any(keyword in key.lower() for keyword in ['password', 'secret', 'key', 'token']):
-                        value = '***'
-                    properties[key.strip()] = value.strip()
+        # ファイル全体を読み込まず1行ずつ処理する
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    if '=' in line:
+                        key, value = line.split('=', 1)
+                        # センシティブ情報をマスク
+                        if _RE_SENSITIVE.search(key):
+                            value = '***'
+                        properties[key.strip()] = value.strip()
 
         return properties
 
@@ -482,7 +777,7 @@ class JavaParser:
         # センシティブ情報をマスク
         lines = []
         for line in content.split('\n'):
-            if any(keyword in line.lower() for keyword in ['password', 'secret', 'key', 'token']):
+            if _RE_SENSITIVE.search(line):
                 # 値部分をマスク
                 if ':' in line:
                     key_part = line.split(':', 1)[0]
@@ -494,15 +789,19 @@ class JavaParser:
 
         return '\n'.join(lines)
 
-    def parse_rest_endpoints(self) -> List[Dict]:
+    def parse_rest_endpoints(self, controllers: List[Dict] = None) -> List[Dict]:
         """
         REST エンドポイントの一覧を生成
 
+        Args:
+            controllers: 解析済みのController情報（省略時はプロジェクトを解析する）
+
         Returns:
             エンドポイント情報のリスト
         """
         endpoints = []
-        controllers = self.parse_controllers()
+        if controllers is None:
+            controllers = self.parse_controllers()
 
         for controller in controllers:
             for endpoint in controller.get('endpoints', []):
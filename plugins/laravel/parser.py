@@ -2,9 +2,318 @@
 Laravel Parser - Laravel プロジェクトを解析
 """
 
+import contextlib
+import mmap
+import os
 import re
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from sys import intern
 from pathlib import Path
-from typing import Dict, List, Any, Iterable
+from typing import Callable, Dict, Iterator, List, Any, Iterable, Tuple, Union
+
+
+# parse_all でサブパーサーを並行実行するスレッド数（いずれもファイルI/O中心）
+_MAX_WORKERS = 8
+# 各サブパーサー内でファイル単位の解析を並行実行するスレッド数
+_FILE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# このサイズ以上のファイルは読み込まずに mmap する（クラス名だけ拾うパーサー向け）
+_MMAP_MIN_SIZE = 64 * 1024
+# クラス名だけを拾うディレクトリ: 結果のキー -> (app/ からの相対パス, サブディレクトリも辿るか)
+_SIMPLE_CLASS_DIRS = {
+    'middleware': (('Http', 'Middleware'), False),
+    'jobs': (('Jobs',), True),
+    'events': (('Events',), False),
+    'listeners': (('Listeners',), False),
+}
+# クラス宣言は通常ファイル先頭付近にあるため、クラス名だけ拾う場合はまずこの分だけ読む
+_CLASS_PREFIX_SIZE = 4096
+
+# カンマ区切りの名前リスト（'auth', "web", \App\Foo::class, ['a', 'b']）の要素。コメントは読み飛ばす
+_RE_NAME_LIST_ITEM = re.compile(r'//[^\n]*|/\*.*?\*/|[\'"]([^\'"]+)[\'"]|([^\s,\[\]\'"]+)', re.DOTALL)
+
+# Model（大きなファイルは mmap のまま照合するため、デコード前のバイト列に対するパターン）
+_RE_MODEL_CLASS = re.compile(rb'class\s+(\w+)\s+extends\s+Model')
+_RE_MODEL_TABLE = re.compile(rb'protected\s+\$table\s*=\s*[\'"](\w+)[\'"]')
+_RE_MODEL_FILLABLE = re.compile(rb'protected\s+\$fillable\s*=\s*\[(.*?)\]', re.DOTALL)
+# belongsTo, hasMany, hasOne, belongsToMany
+_RE_RELATION = re.compile(
+    rb'public\s+function\s+(\w+)\s*\([^)]*\)\s*:\s*\w+\s*\{\s*return\s+\$this->'
+    rb'(belongsTo|hasMany|hasOne|belongsToMany)\((\w+)::class'
+)
+# _RE_RELATION が一致するために必ず含まれるリテラル（belongsToMany は belongsTo に含まれる）
+_RELATION_KEYWORDS = (b'belongsTo', b'hasMany', b'hasOne')
+
+# GraphQL: extend type Query/Mutation { の開始位置（本体は _brace_span で切り出す）
+_RE_EXTEND_TYPE = re.compile(r'extend\s+type\s+(Query|Mutation)\s*\{')
+# 行頭の定義 name(args): ReturnType / name: ReturnType（# コメント行は \w に一致しないので拾わない）
+_RE_GQL_OP = re.compile(r'^\s*(\w+)(?:\s*\(([^)]*)\))?\s*:\s*([\w\[\]!]+)', re.MULTILINE)
+
+# Controller
+_RE_CONTROLLER_CLASS = re.compile(r'class\s+(\w+)\s+extends\s+Controller')
+_RE_USE = re.compile(r'use\s+([\w\\]+);')
+_RE_PUBLIC_METHOD = re.compile(r'public\s+function\s+(\w+)\s*\(([^)]*)\)')
+# validate([...]) / Validator::make($data, [...])
+_RE_VALIDATE_ANY = re.compile(
+    r'(?:validate\s*\(|Validator::make\s*\([^,]+,)\s*\[\s*(.*?)\s*\]\s*\)',
+    re.DOTALL
+)
+# 'field' => 'required|...'
+_RE_RULE = re.compile(r'[\'"](\w+)[\'"]\s*=>\s*[\'"]([^\'"]+)[\'"]')
+
+# Routes: Route::get(...) + optional ->middleware(...) / Route::middleware(...)->get(...) / グループ
+_RE_ROUTE = re.compile(
+    r'Route::(get|post|put|delete|patch|options|any)\s*\(\s*[\'"]([^\'"]+)[\'"]\s*,\s*([^\);]+)\)'
+    r'\s*(?:->middleware\(([^)]*)\))?'
+)
+_RE_MIDDLEWARE_ROUTE = re.compile(
+    r'Route::middleware\(\s*([^)]+)\s*\)\s*->\s*(get|post|put|delete|patch|options|any)'
+    r'\s*\(\s*[\'"]([^\'"]+)[\'"]\s*,\s*([^\);]+)'
+)
+_RE_ROUTE_GROUP = re.compile(
+    r'Route::(?:middleware\(([^)]*)\)\s*)?(?:prefix\(([^)]*)\)\s*)?group\s*\(\s*function\s*\(\s*\)\s*\{(.*?)\}\s*\);',
+    re.DOTALL
+)
+# ["Controller::class, 'method'"] / 'Controller@method'
+_RE_ACTION_CLASS_CALL = re.compile(r'([\w\\\\]+)::class\s*,\s*[\'"](\w+)[\'"]')
+_RE_ACTION_AT_CALL = re.compile(r'[\'"]?([\w\\\\]+@[\w]+)[\'"]?')
+
+# Migrations: Schema::create / Schema::table ブロックと、その中のカラム操作
+# （ヘッダは 'Schema::' の位置で照合し、クロージャ本体は _brace_span で切り出す）
+_RE_SCHEMA_HEAD = re.compile(
+    r'Schema::(?:create|table)\s*\(\s*[\'"](\w+)[\'"]\s*,\s*function\s*\([^)]*\)\s*\{'
+)
+# up() メソッドの宣言（本体は _brace_span で波括弧の対応を取って切り出す）
+_RE_UP = re.compile(r'function\s+up\s*\([^)]*\)\s*(?::\s*\w+\s*)?\{')
+# 波括弧の対応付け用: 文字列リテラル・コメントは読み飛ばし、{ と } だけを拾う
+_RE_BRACE_OR_SKIP = re.compile(
+    r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|//[^\n]*|#[^\n]*|/\*.*?\*/|[{}]',
+    re.DOTALL
+)
+# Schema ブロック内の操作を1回の走査で拾う（どの名前付きグループで終わったかで種類を判別する）
+#   $table->foreign('col')->references(...)->on(...);  -> fk_col / fk_chain
+#   $table->id() / bigIncrements('id') / increments()   -> id_type / id_name
+#   $table->string('name') / index('col') など          -> col_type / col_name
+#   dropColumn('col') / dropColumn(['a', 'b'])          -> drop / drops
+#   timestamps() / softDeletes()                        -> stamp
+_RE_MIGRATION_OP = re.compile(
+    r'\$table->(?:'
+    r'foreign\s*\(\s*[\'"](?P<fk_col>\w+)[\'"]\s*\)(?P<fk_chain>[^;]+);'
+    r'|(?P<id_type>id|bigIncrements|increments)\s*\(\s*[\'"]?(?P<id_name>\w*)[\'"]?\s*\)'
+    r'|(?!dropColumn\()(?P<col_type>\w+)\s*\(\s*[\'"](?P<col_name>\w+)[\'"]'
+    r')'
+    r'|dropColumn\(\s*(?:[\'"](?P<drop>\w+)[\'"]|\[\s*(?P<drops>[^\]]+)\])\s*\)'
+    r'|(?P<stamp>timestamps|softDeletes)\(\)'
+)
+# 単一カラムの操作として拾わないメソッド（foreign は fk_col/fk_chain 側で扱う）
+_SKIPPED_MIGRATION_TYPES = frozenset({'foreign', 'fullText', 'spatialIndex'})
+_RE_FK_REFERENCES = re.compile(r'references\(\s*[\'"](\w+)[\'"]')
+_RE_FK_ON = re.compile(r'on\(\s*[\'"](\w+)[\'"]')
+_RE_FK_ON_DELETE = re.compile(r'onDelete\(\s*[\'"]?(\w+)[\'"]?\)')
+_RE_FK_ON_UPDATE = re.compile(r'onUpdate\(\s*[\'"]?(\w+)[\'"]?\)')
+_RE_QUOTED_NAME = re.compile(r'[\'"](\w+)[\'"]')
+
+# Kernel / config
+_RE_KERNEL_MIDDLEWARE = re.compile(r'\$middleware\s*=\s*\[(.*?)\];', re.DOTALL)
+_RE_KERNEL_GROUPS = re.compile(r'\$middlewareGroups\s*=\s*\[(.*?)\];', re.DOTALL)
+_RE_KERNEL_GROUP = re.compile(r'[\'"](\w+)[\'"]\s*=>\s*\[(.*?)\]', re.DOTALL)
+_RE_KERNEL_ROUTE_MIDDLEWARE = re.compile(r'\$routeMiddleware\s*=\s*\[(.*?)\];', re.DOTALL)
+_RE_LIGHTHOUSE_ROUTE = re.compile(r'\'route\'\s*=>\s*[\'"]([^\'"]+)[\'"]')
+
+# Service / Middleware / Request / Policy / Job / Event / Listener
+_RE_CLASS = re.compile(r'class\s+(\w+)')
+_RE_SERVICE_METHOD = re.compile(r'public\s+(?:static\s+)?function\s+(\w+)\s*\(([^)]*)\)')
+_RE_REQUEST_CLASS = re.compile(r'class\s+(\w+)\s+extends\s+FormRequest')
+_RE_REQUEST_RULES = re.compile(r'public\s+function\s+rules\s*\(\s*\)\s*:\s*array\s*\{(.*?)\}', re.DOTALL)
+# デコード前のバイト列（mmap を含む）に対して使う版
+_RE_CLASS_BYTES = re.compile(rb'class\s+(\w+)')
+_RE_POLICY_METHOD_BYTES = re.compile(rb'public\s+function\s+(\w+)\s*\(')
+
+
+def _read_source(path: Path) -> str:
+    """
+    ソースファイルを一括で読み込んでデコードする
+
+    テキストモードの逐次デコードを避け、バイト列を1回で読んでから1回だけデコードする。
+    UTF-8として不正なバイトは置換文字にし、改行はテキストモードと同様に LF へ揃える。
+
+    Args:
+        path: 読み込むファイルのパス
+
+    Returns:
+        ファイルの内容
+    """
+    content = path.read_bytes().decode('utf-8', errors='replace')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+@contextlib.contextmanager
+def _read_source_bytes(path: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    ファイル内容をデコードせずにバイト列として開く
+
+    _MMAP_MIN_SIZE 以上のファイルは読み込まずに mmap し、OSのページを直接参照する
+    （大きなファイルでも全体をコピー・デコードせず、一致した部分だけをデコードすればよい）。
+
+    Args:
+        path: ファイルパス
+
+    Yields:
+        ファイル内容（bytes または読み取り専用の mmap）
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            yield f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+
+def _search_class(data: Union[bytes, mmap.mmap]) -> re.Match:
+    """
+    バイト列から最初のクラス宣言を探す
+
+    正規表現の前に bytes.find（C の memchr ベース）で 'class' の位置を探し、
+    無ければ正規表現を走らせず、あればその位置から照合する。
+
+    Args:
+        data: ファイル内容（bytes または mmap）
+
+    Returns:
+        _RE_CLASS_BYTES の一致。無ければ None
+    """
+    start = data.find(b'class')
+    if start == -1:
+        return None
+    return _RE_CLASS_BYTES.search(data, start)
+
+
+def _find_class_name(path: Path) -> str:
+    """
+    PHPファイルの最初のクラス宣言のクラス名を取得
+
+    まず先頭 _CLASS_PREFIX_SIZE バイトだけを読み、見つからない場合
+    （長いライセンスヘッダ等）や名前が読み込み範囲の末尾で途切れている場合のみファイル全体を見る。
+
+    Args:
+        path: PHPファイルのパス
+
+    Returns:
+        クラス名。クラス宣言が無ければ None
+    """
+    with open(path, 'rb') as f:
+        head = f.read(_CLASS_PREFIX_SIZE)
+    class_match = _search_class(head)
+    if len(head) < _CLASS_PREFIX_SIZE or (class_match and class_match.end() < len(head)):
+        return class_match.group(1).decode() if class_match else None
+
+    with _read_source_bytes(path) as data:
+        class_match = _search_class(data)
+        return class_match.group(1).decode() if class_match else None
+
+
+def _split_names(raw: str) -> List[str]:
+    """
+    ミドルウェアや $fillable などのカンマ区切りリストを要素の文字列に分解する
+
+    クォートされた要素はクォートの中身を、クォートの無い要素（Foo::class 等）はそのまま返す。
+
+    Args:
+        raw: リスト部分の文字列
+
+    Returns:
+        要素のリスト
+    """
+    return [intern(m.group(1) or m.group(2)) for m in _RE_NAME_LIST_ITEM.finditer(raw) if m.lastindex]
+
+
+def _summarize_todo_query_builder(content: str) -> List[str]:
+    """
+    TodoQueryBuilder のようなクエリビルダ系のフィルタ/ソートロジックを簡易要約
+    いまはキーワード検出ベースで汎用性は低めだが、仕様書向けの手がかりを出す
+    """
+    notes: List[str] = []
+    if 'deadline_status' in content:
+        notes.append("deadline_status で期限状態をフィルタ（overdue/due_today/due_this_week）")
+    if 'completed' in content:
+        notes.append("completed が null でない場合のみ完了フラグで絞り込み")
+    if 'priority' in content:
+        notes.append("priority が指定されれば優先度で絞り込み（high/medium/low）")
+    if 'category_id' in content:
+        notes.append("category_id が指定されればカテゴリで絞り込み")
+    if 'sort_by' in content or 'sort_direction' in content:
+        notes.append("sort_by/sort_direction に従って並び替え。priorityはカスタム順、deadlineはNULLを末尾")
+    return notes
+
+
+def _brace_span(content: str, open_pos: int) -> Tuple[int, int]:
+    """
+    content[open_pos] の '{' に対応する '}' までの本体（外側の波括弧の中身）の範囲を返す
+
+    文字列リテラル（'...' / "..."）とコメント（//, #, /* */）の中の波括弧は数えない。
+
+    Args:
+        content: ソース全体
+        open_pos: 開き波括弧の位置
+
+    Returns:
+        (本体の開始位置, 本体の終了位置)。対応する閉じ括弧が無ければ None
+    """
+    depth = 0
+    for token in _RE_BRACE_OR_SKIP.finditer(content, open_pos):
+        brace = token.group()
+        if brace == '{':
+            depth += 1
+        elif brace == '}':
+            depth -= 1
+            if depth == 0:
+                return open_pos + 1, token.start()
+    return None
+
+
+class _TableState:
+    """parse_migrations で集約中の1テーブル分のスキーマ状態"""
+
+    __slots__ = ('columns', 'indexes', 'fks', 'files')
+
+    def __init__(self):
+        self.columns: Dict[str, str] = {}
+        self.indexes: List[Dict[str, str]] = []
+        self.fks: List[Dict[str, str]] = []
+        self.files: List[str] = []
+
+
+class _LazyParseResult(Mapping):
+    """
+    parse_all(lazy=True) の戻り値。各セクションは最初に参照されたときに解析してキャッシュする
+
+    一部のセクションしか使わない呼び出し側は、残りのファイルを読まずに済む。
+    """
+
+    def __init__(self, loaders: Dict[str, Callable[[], Any]]):
+        self._loaders = loaders
+        self._values: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        loader = self._loaders[key]
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = loader()
+            return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loaders)
+
+    def __len__(self) -> int:
+        return len(self._loaders)
 
 
 class LaravelParser:
@@ -18,32 +327,199 @@ class LaravelParser:
             project_root: Laravelプロジェクトのルートディレクトリ
         """
         self.project_root = Path(project_root)
+        # project_root 配下のパスの共通の接頭辞（相対パスは文字列の切り出しで求める）
+        root = str(self.project_root)
+        self._root_prefix = '' if root == '.' else os.path.join(root, '')
+        # (ディレクトリ, 拡張子, 再帰するか) -> ファイル一覧
+        self._file_cache: Dict[Tuple[Path, str, bool], List[Path]] = {}
+        # parse_graphql_schemas の結果（parse_all では parse_graphql_operations と並行に呼ばれるためロックで1回に絞る）
+        self._schemas_cache: Dict[str, str] = None
+        self._schemas_lock = threading.Lock()
+        # ファイル単位の解析結果: (解析関数名, パス, mtime_ns, サイズ) -> 結果（内容が変わらなければ再解析しない）
+        self._parse_cache: Dict[Tuple[str, str, int, int], Dict] = {}
+        # parse_all の実行中に全サブパーサーで共有するファイル単位のスレッドプール
+        # （サブパーサーごとにプールを作るとスレッド数が _MAX_WORKERS × _FILE_WORKERS まで膨らむため）
+        self._file_executor: ThreadPoolExecutor = None
+
+    def _relative_path(self, file_path: Path) -> str:
+        """
+        プロジェクトルートからの相対パス（文字列）
+
+        Args:
+            file_path: プロジェクト内のファイルパス
+
+        Returns:
+            相対パス
+        """
+        path = str(file_path)
+        if path.startswith(self._root_prefix):
+            return path[len(self._root_prefix):]
+        return str(file_path.relative_to(self.project_root))
+
+    def _iter_each(
+        self,
+        parse_file: Callable[[Path], Dict],
+        files: List[Path],
+        executor: ThreadPoolExecutor = None,
+    ) -> Iterator[Dict]:
+        """
+        ファイルごとの解析関数をスレッドプールで並行に適用し、結果を1件ずつ返す
 
-    def parse_all(self) -> Dict[str, Any]:
+        ファイル読み込みのI/O待ちを重ねるため。結果は files の順序のまま、None（対象外）を除いて返す。
+        先頭のファイルの解析が終わった時点から返し始めるので、呼び出し側は全件を待たずに処理を進められる。
+        (パス, mtime, サイズ) が前回と同じファイルは解析せずに前回の結果を使う。
+
+        Args:
+            parse_file: 1ファイルを解析する関数（対象外なら None を返す）
+            files: 解析対象のファイル
+            executor: 使い回すスレッドプール（省略時は共有プール、それもなければこの呼び出し用に作る）
+
+        Yields:
+            解析結果
+        """
+        name = parse_file.__name__
+        cache = self._parse_cache
+
+        def parse_cached(path: Path) -> Dict:
+            st = os.stat(path)
+            key = (name, str(path), st.st_mtime_ns, st.st_size)
+            try:
+                return cache[key]
+            except KeyError:
+                result = cache[key] = parse_file(path)
+                return result
+
+        if executor is None:
+            executor = self._file_executor
+        if len(files) <= 1:
+            results = map(parse_cached, files)
+        elif executor is not None:
+            results = executor.map(parse_cached, files)
+        else:
+            with ThreadPoolExecutor(max_workers=min(_FILE_WORKERS, len(files))) as own_executor:
+                for result in own_executor.map(parse_cached, files):
+                    if result:
+                        yield result
+            return
+        for result in results:
+            if result:
+                yield result
+
+    def _parse_each(
+        self,
+        parse_file: Callable[[Path], Dict],
+        files: List[Path],
+        executor: ThreadPoolExecutor = None,
+    ) -> List[Dict]:
+        """_iter_each の結果をリストで返す（件数を数えたり複数回走査したりする呼び出し側向け）"""
+        return list(self._iter_each(parse_file, files, executor))
+
+    @contextlib.contextmanager
+    def _shared_file_executor(self) -> Iterator[ThreadPoolExecutor]:
+        """
+        ファイル単位の解析に使うスレッドプールを共有する（既に共有中ならそれを使う）
+
+        サブパーサーを並行実行するプールとは別にする（同じプールで待ち合わせるとデッドロックしうるため）
+
+        Yields:
+            共有のスレッドプール
+        """
+        if self._file_executor is not None:
+            yield self._file_executor
+            return
+        with ThreadPoolExecutor(max_workers=_FILE_WORKERS) as executor:
+            self._file_executor = executor
+            try:
+                yield executor
+            finally:
+                self._file_executor = None
+
+    def _list_files(self, directory: Path, suffix: str = '.php', recursive: bool = False) -> List[Path]:
+        """
+        ディレクトリ内の指定拡張子のファイル一覧を取得（結果はインスタンス内でキャッシュ）
+
+        os.scandir のエントリ種別（d_type）を使うため、glob/rglob のように
+        エントリごとに stat を発行しない。並び順は glob/rglob と同じで、
+        各ディレクトリのファイルを先に、サブディレクトリは深さ優先の前順で辿る。
+        シンボリックリンクのディレクトリには rglob と同様に入らない。
+
+        Args:
+            directory: 探索するディレクトリ
+            suffix: 対象とする拡張子
+            recursive: サブディレクトリも辿るか（True で rglob 相当）
+
+        Returns:
+            ファイルパスのリスト
+        """
+        key = (directory, suffix, recursive)
+        cached = self._file_cache.get(key)
+        if cached is not None:
+            return cached
+
+        files = []
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.name.endswith(suffix) and entry.is_file():
+                            files.append(Path(entry.path))
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            subdirs.append(Path(entry.path))
+            except OSError:
+                continue
+            stack.extend(reversed(subdirs))
+
+        self._file_cache[key] = files
+        return files
+
+    def parse_all(self, lazy: bool = False) -> Mapping:
         """
         プロジェクト全体を解析
 
+        Args:
+            lazy: True の場合は解析せずに、参照されたセクションだけを解析する Mapping を返す
+
         Returns:
-            解析結果の辞書
+            解析結果の辞書（lazy=True の場合は遅延評価の Mapping）
         """
-        return {
-            'models': self.parse_models(),
-            'controllers': self.parse_controllers(),
-            'routes': self.parse_routes(),
-            'migrations': self.parse_migrations(),
-            'services': self.parse_services(),
-            'middleware': self.parse_middleware(),
-            'requests': self.parse_requests(),
-            'policies': self.parse_policies(),
-            'jobs': self.parse_jobs(),
-            'events': self.parse_events(),
-            'listeners': self.parse_listeners(),
-            'graphql_schemas': self.parse_graphql_schemas(),
-            'graphql_resolvers': self.parse_graphql_resolvers(),
-            'kernel': self.parse_kernel(),
-            'graphql_endpoint': self.parse_graphql_endpoint(),
-            'graphql_operations': self.parse_graphql_operations(),
+        tasks = {
+            'models': self.parse_models,
+            'controllers': self.parse_controllers,
+            'routes': self.parse_routes,
+            'migrations': self.parse_migrations,
+            'services': self.parse_services,
+            'middleware': self.parse_middleware,
+            'requests': self.parse_requests,
+            'policies': self.parse_policies,
+            'jobs': self.parse_jobs,
+            'events': self.parse_events,
+            'listeners': self.parse_listeners,
+            'graphql_schemas': self.parse_graphql_schemas,
+            'graphql_resolvers': self.parse_graphql_resolvers,
+            'kernel': self.parse_kernel,
+            'graphql_endpoint': self.parse_graphql_endpoint,
+            'graphql_operations': self.parse_graphql_operations,
         }
+        if lazy:
+            return _LazyParseResult(tasks)
+
+        # 各サブパーサーは project_root 配下を読むだけで互いに独立しているため、
+        # スレッドプールで並行に走らせてディスクI/O待ちを重ねる
+        # クラス名だけを拾うディレクトリは parse_all_simple で1タスクにまとめる
+        eager_tasks = {key: fn for key, fn in tasks.items() if key not in _SIMPLE_CLASS_DIRS}
+        eager_tasks['simple'] = self.parse_all_simple
+
+        # ファイル単位の解析は全サブパーサーで1つのプールを共有する
+        with self._shared_file_executor(), ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            futures = {key: executor.submit(fn) for key, fn in eager_tasks.items()}
+            simple = futures.pop('simple').result()
+            return {
+                key: simple[key] if key in simple else futures[key].result()
+                for key in tasks
+            }
 
     def parse_models(self) -> List[Dict]:
         """
@@ -56,13 +532,7 @@ class LaravelParser:
         if not models_dir.exists():
             return []
 
-        models = []
-        for php_file in models_dir.glob('*.php'):
-            model_info = self._parse_model_file(php_file)
-            if model_info:
-                models.append(model_info)
-
-        return models
+        return self._parse_each(self._parse_model_file, self._list_files(models_dir))
 
     def _parse_model_file(self, file_path: Path) -> Dict:
         """
@@ -74,59 +544,64 @@ class LaravelParser:
         Returns:
             モデル情報の辞書
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # クラス名抽出
-        class_match = re.search(r'class\s+(\w+)\s+extends\s+Model', content)
-        if not class_match:
-            return None
-
-        class_name = class_match.group(1)
-
-        # テーブル名抽出
-        table_match = re.search(r'protected\s+\$table\s*=\s*[\'"](\w+)[\'"]', content)
-        table_name = table_match.group(1) if table_match else None
-
-        # fillable抽出
-        fillable_match = re.search(r'protected\s+\$fillable\s*=\s*\[(.*?)\]', content, re.DOTALL)
-        fillable = []
-        if fillable_match:
-            fillable_str = fillable_match.group(1)
-            fillable = [f.strip().strip('\'"') for f in fillable_str.split(',') if f.strip()]
-
-        # リレーション抽出
-        relations = self._extract_relations(content)
+        # 大きなファイルは mmap し、一致した部分だけをデコードする
+        with _read_source_bytes(file_path) as data:
+            # `extends\s+Model` は 'Model' を含むので、無ければ正規表現を走らせない
+            # （mmap の in は1バイト単位の判定になるため find で探す）
+            if data.find(b'Model') == -1:
+                return None
+
+            # クラス名抽出
+            class_match = _RE_MODEL_CLASS.search(data)
+            if not class_match:
+                return None
+
+            class_name = class_match.group(1).decode()
+
+            # テーブル名抽出
+            table_match = _RE_MODEL_TABLE.search(data)
+            table_name = table_match.group(1).decode() if table_match else None
+
+            # fillable抽出
+            fillable_match = _RE_MODEL_FILLABLE.search(data)
+            fillable = []
+            if fillable_match:
+                fillable_str = fillable_match.group(1).decode('utf-8', errors='replace')
+                fillable = _split_names(fillable_str)
+
+            # リレーション抽出
+            relations = self._extract_relations(data)
 
         return {
             'class_name': class_name,
-            'file_path': str(file_path.relative_to(self.project_root)),
+            'file_path': self._relative_path(file_path),
             'table_name': table_name,
             'fillable': fillable,
             'relations': relations,
         }
 
-    def _extract_relations(self, content: str) -> List[Dict]:
+    def _extract_relations(self, content: Union[bytes, mmap.mmap]) -> List[Dict]:
         """
         Eloquentリレーションを抽出
 
         Args:
-            content: PHPファイルの内容
+            content: PHPファイルの内容（デコード前のバイト列または mmap）
 
         Returns:
             リレーション情報のリスト
         """
         relations = []
+        if all(content.find(k) == -1 for k in _RELATION_KEYWORDS):
+            return relations
 
         # belongsTo, hasMany, hasOne, belongsToMany を抽出
-        pattern = r'public\s+function\s+(\w+)\s*\([^)]*\)\s*:\s*\w+\s*\{\s*return\s+\$this->(belongsTo|hasMany|hasOne|belongsToMany)\((\w+)::class'
+        relations_append = relations.append
+        for match in _RE_RELATION.finditer(content):
+            method_name = match.group(1).decode()
+            relation_type = intern(match.group(2).decode())
+            related_model = match.group(3).decode()
 
-        for match in re.finditer(pattern, content):
-            method_name = match.group(1)
-            relation_type = match.group(2)
-            related_model = match.group(3)
-
-            relations.append({
+            relations_append({
                 'method': method_name,
                 'type': relation_type,
                 'related_model': related_model,
@@ -141,15 +616,22 @@ class LaravelParser:
         Returns:
             ファイルパス -> 内容 の辞書
         """
+        with self._schemas_lock:
+            if self._schemas_cache is None:
+                self._schemas_cache = self._read_graphql_schemas()
+            return self._schemas_cache
+
+    def _read_graphql_schemas(self) -> Dict[str, str]:
+        """graphql/ 配下の .graphql ファイルを読み込む"""
         graphql_dir = self.project_root / 'graphql'
         if not graphql_dir.exists():
             return {}
 
+        # _list_files のパスは graphql_dir から組み立てているので、接頭辞を切り落とせば相対パスになる
+        prefix_len = len(os.path.join(str(graphql_dir), ''))
         schemas = {}
-        for graphql_file in graphql_dir.rglob('*.graphql'):
-            relative_path = graphql_file.relative_to(graphql_dir)
-            with open(graphql_file, 'r', encoding='utf-8') as f:
-                schemas[str(relative_path)] = f.read()
+        for graphql_file in self._list_files(graphql_dir, '.graphql', recursive=True):
+            schemas[str(graphql_file)[prefix_len:]] = _read_source(graphql_file)
 
         return schemas
 
@@ -160,29 +642,31 @@ class LaravelParser:
         ops = {'queries': [], 'mutations': []}
         schemas = self.parse_graphql_schemas()
 
-        def extract_ops(kind: str, content: str) -> List[Dict[str, str]]:
+        def extract_ops(block: str) -> List[Dict[str, str]]:
             results = []
-            pattern = rf'extend\s+type\s+{kind}\s*\{{(.*?)\}}'
-            for block in re.findall(pattern, content, re.DOTALL):
-                for line in block.splitlines():
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    # name(args): ReturnType
-                    m = re.match(r'(\w+)\s*\(([^)]*)\)\s*:\s*([\w\[\]!]+)', line)
-                    if m:
-                        name, args, ret = m.groups()
-                        results.append({'name': name, 'args': args, 'return': ret})
-                    else:
-                        m = re.match(r'(\w+)\s*:\s*([\w\[\]!]+)', line)
-                        if m:
-                            name, ret = m.groups()
-                            results.append({'name': name, 'args': '', 'return': ret})
+            for m in _RE_GQL_OP.finditer(block):
+                name, args, ret = m.groups()
+                if not args:
+                    args = ''
+                elif '\n' in args:
+                    # 複数行にまたがる引数は1行にまとめる
+                    args = ' '.join(args.split())
+                results.append({'name': name, 'args': args, 'return': ret})
             return results
 
         for content in schemas.values():
-            ops['queries'].extend(extract_ops('Query', content))
-            ops['mutations'].extend(extract_ops('Mutation', content))
+            # extend type Query/Mutation { ... } の本体を波括弧の対応で切り出す（ネストした {} にも対応）
+            pos = 0
+            while True:
+                match = _RE_EXTEND_TYPE.search(content, pos)
+                if not match:
+                    break
+                span = _brace_span(content, match.end() - 1)
+                if not span:
+                    break
+                key = 'queries' if match.group(1) == 'Query' else 'mutations'
+                ops[key].extend(extract_ops(content[span[0]:span[1]]))
+                pos = span[1] + 1
 
         return ops
 
@@ -202,16 +686,16 @@ class LaravelParser:
         queries_dir = self.project_root / 'app' / 'GraphQL' / 'Queries'
         if queries_dir.exists():
             resolvers['queries'] = [
-                str(f.relative_to(self.project_root))
-                for f in queries_dir.glob('*.php')
+                self._relative_path(f)
+                for f in self._list_files(queries_dir)
             ]
 
         # Mutations
         mutations_dir = self.project_root / 'app' / 'GraphQL' / 'Mutations'
         if mutations_dir.exists():
             resolvers['mutations'] = [
-                str(f.relative_to(self.project_root))
-                for f in mutations_dir.glob('*.php')
+                self._relative_path(f)
+                for f in self._list_files(mutations_dir)
             ]
 
         return resolvers
@@ -228,67 +712,61 @@ class LaravelParser:
         # app/Http/Controllers
         controllers_dir = self.project_root / 'app' / 'Http' / 'Controllers'
         if controllers_dir.exists():
-            for php_file in controllers_dir.rglob('*.php'):
-                controller_info = self._parse_controller_file(php_file)
-                if controller_info:
-                    controllers.append(controller_info)
+            controllers = self._parse_each(
+                self._parse_controller_file, self._list_files(controllers_dir, recursive=True)
+            )
 
         return controllers
 
     def _parse_controller_file(self, file_path: Path) -> Dict:
         """単一のControllerファイルを解析"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _read_source(file_path)
+
+        if 'Controller' not in content:
+            return None
 
         # クラス名抽出
-        class_match = re.search(r'class\s+(\w+)\s+extends\s+Controller', content)
+        class_match = _RE_CONTROLLER_CLASS.search(content)
         if not class_match:
             return None
 
         class_name = class_match.group(1)
 
         traits = []
-        for trait_match in re.finditer(r'use\s+([\w\\]+);', content):
+        for trait_match in _RE_USE.finditer(content):
             trait_name = trait_match.group(1).split('\\')[-1]
             traits.append(trait_name)
 
-        # メソッド抽出（public function）
+        # メソッド抽出（public function）。'function' が無ければ正規表現を走らせない
         methods = []
-        method_pattern = r'public\s+function\s+(\w+)\s*\(([^)]*)\)'
-        for match in re.finditer(method_pattern, content):
-            method_name = match.group(1)
-            params = match.group(2).strip()
+        if 'function' in content:
+            for match in _RE_PUBLIC_METHOD.finditer(content):
+                method_name = match.group(1)
+                params = match.group(2).strip()
 
-            # コンストラクタやマジックメソッドは除外
-            if method_name.startswith('__'):
-                continue
+                # コンストラクタやマジックメソッドは除外
+                if method_name.startswith('__'):
+                    continue
 
-            methods.append({
-                'name': method_name,
-                'parameters': params if params else None,
-            })
+                methods.append({
+                    'name': method_name,
+                    'parameters': params if params else None,
+                })
 
         # Authトレイト由来メソッドの補完
         methods = self._augment_auth_methods(traits, methods)
 
-        # Controller内バリデーション validate([...])
+        # Controller内バリデーション validate([...]) / Validator::make([...])
         validations = []
-        validate_pattern = r'validate\s*\(\s*\[\s*(.*?)\s*\]\s*\)'
-        for vm in re.finditer(validate_pattern, content, re.DOTALL):
-            body = vm.group(1)
-            for rule in re.finditer(r'[\'"](\w+)[\'"]\s*=>\s*[\'"]([^\'"]+)[\'"]', body):
-                validations.append({'field': rule.group(1), 'rules': rule.group(2)})
-
-        # Validator::make([...]) パターン
-        validator_pattern = r'Validator::make\s*\(\s*[^,]+,\s*\[\s*(.*?)\s*\]\s*\)'
-        for vm in re.finditer(validator_pattern, content, re.DOTALL):
-            body = vm.group(1)
-            for rule in re.finditer(r'[\'"](\w+)[\'"]\s*=>\s*[\'"]([^\'"]+)[\'"]', body):
-                validations.append({'field': rule.group(1), 'rules': rule.group(2)})
+        if 'validate' in content or 'Validator' in content:
+            validations_append = validations.append
+            for vm in _RE_VALIDATE_ANY.finditer(content):
+                for rule in _RE_RULE.finditer(vm.group(1)):
+                    validations_append({'field': rule.group(1), 'rules': rule.group(2)})
 
         return {
             'class_name': class_name,
-            'file_path': str(file_path.relative_to(self.project_root)),
+            'file_path': self._relative_path(file_path),
             'methods': methods,
             'traits': traits,
             'validations': validations,
@@ -323,37 +801,37 @@ class LaravelParser:
         if not routes_dir.exists():
             return routes
 
-        for route_file in routes_dir.glob('*.php'):
+        for route_file in self._list_files(routes_dir):
             route_type = route_file.stem  # api, web, etc.
-            routes_in_file = []
-            routes_in_file.extend(self._parse_route_file(route_file))
-            # グループ対応
-            with open(route_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_source(route_file)
+            # 単体ルート + グループ対応（同じ内容を使い回し、ファイルは1回だけ読む）
+            routes_in_file = self._parse_route_file(content)
             routes_in_file.extend(self._parse_routes_with_groups(content))
             routes[route_type] = routes_in_file
 
         return routes
 
-    def _parse_route_file(self, file_path: Path) -> List[Dict]:
-        """単一のRouteファイルを解析"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
+    def _parse_route_file(self, content: str) -> List[Dict]:
+        """単一のRouteファイルの内容を解析"""
         routes = []
+        # どのパターンも 'Route::' を含むので、無ければ正規表現を走らせない
+        if 'Route::' not in content:
+            return routes
 
-        # Route::get/post/put/delete/patch など + optional ->middleware(...)
-        route_pattern = r'Route::(get|post|put|delete|patch|options|any)\s*\(\s*[\'"]([^\'"]+)[\'"]\s*,\s*([^\);]+)\)\s*(?:->middleware\(([^)]*)\))?'
+        # ループ内で繰り返し引く属性はローカルに束縛しておく
+        routes_append = routes.append
+        normalize_action = self._normalize_route_action
 
-        for match in re.finditer(route_pattern, content):
-            method = match.group(1).upper()
+        # Route::get/post/put/delete/patch など + optional ->middleware(...)
+        for match in _RE_ROUTE.finditer(content):
+            method = intern(match.group(1).upper())
             uri = match.group(2)
             raw_action = match.group(3).strip()
-            action = self._normalize_route_action(raw_action)
+            action = normalize_action(raw_action)
             mw_raw = match.group(4) or ''
-            middlewares = [m.strip().strip('\'"') for m in mw_raw.split(',') if m.strip()]
+            middlewares = _split_names(mw_raw)
 
-            routes.append({
+            routes_append({
                 'method': method,
                 'uri': uri,
                 'action': action,
@@ -361,15 +839,16 @@ class LaravelParser:
             })
 
         # Route::middleware(...)->get(...)
-        mw_route_pattern = r'Route::middleware\(\s*([^)]+)\s*\)\s*->\s*(get|post|put|delete|patch|options|any)\s*\(\s*[\'"]([^\'"]+)[\'"]\s*,\s*([^\);]+)'
-        for match in re.finditer(mw_route_pattern, content):
+        if 'Route::middleware' not in content:
+            return routes
+        for match in _RE_MIDDLEWARE_ROUTE.finditer(content):
             mw_raw = match.group(1)
-            method = match.group(2).upper()
+            method = intern(match.group(2).upper())
             uri = match.group(3)
             raw_action = match.group(4).strip()
-            action = self._normalize_route_action(raw_action)
-            middlewares = [m.strip().strip('\'"') for m in mw_raw.split(',') if m.strip()]
-            routes.append({
+            action = normalize_action(raw_action)
+            middlewares = _split_names(mw_raw)
+            routes_append({
                 'method': method,
                 'uri': uri,
                 'action': action,
@@ -381,34 +860,34 @@ class LaravelParser:
     def _parse_routes_with_groups(self, content: str) -> List[Dict]:
         """Routeグループ (middleware/prefix) を含めてパース"""
         routes = []
+        if 'Route::' not in content or 'group' not in content:
+            return routes
+
+        routes_append = routes.append
+        normalize_action = self._normalize_route_action
 
         # プレフィックスやミドルウェアを持つグループに対応
-        group_pattern = re.compile(
-            r'Route::(?:middleware\(([^)]*)\)\s*)?(?:prefix\(([^)]*)\)\s*)?group\s*\(\s*function\s*\(\s*\)\s*\{(.*?)\}\s*\);',
-            re.DOTALL
-        )
-        for gm in group_pattern.finditer(content):
+        for gm in _RE_ROUTE_GROUP.finditer(content):
             middleware_raw = gm.group(1) or ''
             prefix_raw = gm.group(2) or ''
             body = gm.group(3)
 
-            middlewares = [m.strip().strip('\'"') for m in middleware_raw.split(',') if m.strip()]
+            middlewares = _split_names(middleware_raw)
             prefix = prefix_raw.strip().strip('\'"')
 
-            route_pattern = r'Route::(get|post|put|delete|patch|options|any)\s*\(\s*[\'"]([^\'"]+)[\'"]\s*,\s*([^\);]+)\)\s*(?:->middleware\(([^)]*)\))?'
-            for match in re.finditer(route_pattern, body):
-                method = match.group(1).upper()
+            for match in _RE_ROUTE.finditer(body):
+                method = intern(match.group(1).upper())
                 uri = match.group(2)
                 if prefix:
                     uri = f"{prefix.rstrip('/')}/{uri.lstrip('/')}"
                 raw_action = match.group(3).strip()
-                action = self._normalize_route_action(raw_action)
+                action = normalize_action(raw_action)
                 mw_raw = match.group(4) or ''
-                extra_mw = [m.strip().strip('\'"') for m in mw_raw.split(',') if m.strip()]
-                all_mw = middlewares.copy()
-                all_mw.extend(extra_mw)
+                extra_mw = _split_names(mw_raw)
+                # 追加ミドルウェアが無ければグループのリストをそのまま共有する（生成後に変更はしない）
+                all_mw = middlewares + extra_mw if extra_mw else middlewares
 
-                routes.append({
+                routes_append({
                     'method': method,
                     'uri': uri,
                     'action': action,
@@ -420,12 +899,12 @@ class LaravelParser:
     def _normalize_route_action(self, action: str) -> str:
         """Routeアクション表記を統一する"""
         # ["Controller::class, 'method'"] を Class@method 形式に
-        class_call = re.search(r'([\w\\\\]+)::class\s*,\s*[\'"](\w+)[\'"]', action)
+        class_call = _RE_ACTION_CLASS_CALL.search(action)
         if class_call:
             return f"{class_call.group(1)}@{class_call.group(2)}"
 
         # 'Controller@method' 形式
-        at_call = re.search(r'[\'"]?([\w\\\\]+@[\w]+)[\'"]?', action)
+        at_call = _RE_ACTION_AT_CALL.search(action)
         if at_call:
             return at_call.group(1)
 
@@ -439,27 +918,26 @@ class LaravelParser:
         Returns:
             マイグレーション情報のリスト（テーブル単位の最終スキーマ）
         """
-        table_schemas: Dict[str, Dict[str, str]] = {}
-        table_indexes: Dict[str, List[Dict[str, str]]] = {}
-        table_fks: Dict[str, List[Dict[str, str]]] = {}
-        table_files: Dict[str, List[str]] = {}
+        tables: Dict[str, _TableState] = {}
 
         migrations_dir = self.project_root / 'database' / 'migrations'
         if not migrations_dir.exists():
             return []
 
-        for migration_file in sorted(migrations_dir.glob('*.php')):
+        for migration_file in sorted(self._list_files(migrations_dir)):
             for table_name, ops in self._parse_migration_file(migration_file):
                 if not table_name:
                     continue
 
-                table_files.setdefault(table_name, [])
-                if migration_file.name not in table_files[table_name]:
-                    table_files[table_name].append(migration_file.name)
+                state = tables.get(table_name)
+                if state is None:
+                    state = tables[table_name] = _TableState()
+                if migration_file.name not in state.files:
+                    state.files.append(migration_file.name)
 
-                schema = table_schemas.setdefault(table_name, {})
-                idxs = table_indexes.setdefault(table_name, [])
-                fks = table_fks.setdefault(table_name, [])
+                schema = state.columns
+                idxs = state.indexes
+                fks = state.fks
                 for op in ops:
                     action = op['action']
                     col = op['name']
@@ -481,14 +959,14 @@ class LaravelParser:
 
         # 整形して返す
         result = []
-        for table, cols in table_schemas.items():
-            columns = [{'name': name, 'type': cols[name]} for name in cols.keys()]
+        for table, state in tables.items():
+            columns = [{'name': name, 'type': col_type} for name, col_type in state.columns.items()]
             result.append({
                 'table_name': table,
                 'columns': columns,
-                'files': table_files.get(table, []),
-                'indexes': table_indexes.get(table, []),
-                'foreign_keys': table_fks.get(table, []),
+                'files': state.files,
+                'indexes': state.indexes,
+                'foreign_keys': state.fks,
             })
 
         # テーブル名でソート
@@ -497,86 +975,72 @@ class LaravelParser:
 
     def _parse_migration_file(self, file_path: Path) -> Iterable[tuple[str, List[Dict[str, str]]]]:
         """単一のMigrationファイルを解析し、(table_name, operations) をyieldする"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _read_source(file_path)
 
-        # up() セクションのみを対象にする（down の dropColumn を無視する）
-        up_start = content.find('function up')
-        down_start = content.find('function down', up_start if up_start != -1 else 0)
-        if up_start != -1 and down_start != -1:
-            content = content[up_start:down_start]
+        # up() の本体のみを対象にする（down の dropColumn を無視する）
+        up_match = _RE_UP.search(content)
+        if up_match:
+            span = _brace_span(content, up_match.end() - 1)
+            if span:
+                content = content[span[0]:span[1]]
 
         # Schema::create / Schema::table ブロックを全て抽出
-        block_pattern = re.compile(
-            r'Schema::(create|table)\s*\(\s*[\'"](\w+)[\'"]\s*,\s*function\s*\([^)]*\)\s*\{(.*?)\}\s*\);',
-            re.DOTALL
-        )
-
-        for match in block_pattern.finditer(content):
-            action_type = match.group(1)
-            table_name = match.group(2)
-            body = match.group(3)
+        pos = content.find('Schema::')
+        while pos != -1:
+            head = _RE_SCHEMA_HEAD.match(content, pos)
+            span = _brace_span(content, head.end() - 1) if head else None
+            if not span:
+                pos = content.find('Schema::', pos + len('Schema::'))
+                continue
+            table_name = head.group(1)
+            body = content[span[0]:span[1]]
+            pos = content.find('Schema::', span[1])
 
             ops: List[Dict[str, str]] = []
-
-            # 追加カラム: $table->string('name')
-            for add in re.finditer(r'\$table->(\w+)\s*\(\s*[\'"](\w+)[\'"]', body):
-                col_type = add.group(1)
-                col_name = add.group(2)
-                if col_type in {'index', 'unique', 'primary', 'foreign', 'fullText', 'spatialIndex'}:
-                    # インデックス系はカラムとして扱わない
-                    continue
-                ops.append({'action': 'add', 'name': col_name, 'type': col_type})
-
-            # id / increments 系
-            for add in re.finditer(r'\$table->(id|bigIncrements|increments)\s*\(\s*[\'"]?(\w*)[\'"]?\s*\)', body):
-                col_type = add.group(1)
-                col_name = add.group(2) or 'id'
-                ops.append({'action': 'add', 'name': col_name, 'type': col_type})
-
-            # timestamps / softDeletes 等
-            if 'timestamps()' in body:
-                ops.append({'action': 'add', 'name': 'created_at', 'type': 'timestamp'})
-                ops.append({'action': 'add', 'name': 'updated_at', 'type': 'timestamp'})
-            if 'softDeletes()' in body:
-                ops.append({'action': 'add', 'name': 'deleted_at', 'type': 'timestamp'})
-
-            # foreignId()->constrained()
-            for add in re.finditer(r'\$table->foreignId\s*\(\s*[\'"](\w+)[\'"]\s*\)(?:->\w+\([^)]*\))*', body):
-                col_name = add.group(1)
-                ops.append({'action': 'add', 'name': col_name, 'type': 'foreignId'})
-
-            # index/unique/primary (単一カラム)
-            for idx in re.finditer(r'\$table->(index|unique|primary)\s*\(\s*[\'"](\w+)[\'"]', body):
-                ops.append({'action': 'add', 'name': idx.group(2), 'type': idx.group(1)})
-
-            # 外部キー詳細 ($table->foreign('user_id')->references('id')->on('users')->onDelete('cascade');)
-            for fk in re.finditer(r'\$table->foreign\s*\(\s*[\'"](\w+)[\'"]\s*\)([^;]+);', body):
-                col = fk.group(1)
-                chain = fk.group(2)
-                ref = re.search(r'references\(\s*[\'"](\w+)[\'"]', chain)
-                on = re.search(r'on\(\s*[\'"](\w+)[\'"]', chain)
-                on_delete = re.search(r'onDelete\(\s*[\'"]?(\w+)[\'"]?\)', chain)
-                on_update = re.search(r'onUpdate\(\s*[\'"]?(\w+)[\'"]?\)', chain)
-                ops.append({
-                    'action': 'add',
-                    'name': col,
-                    'type': 'foreign',
-                    'references': ref.group(1) if ref else None,
-                    'on': on.group(1) if on else None,
-                    'on_delete': on_delete.group(1) if on_delete else None,
-                    'on_update': on_update.group(1) if on_update else None,
-                })
-
-            # dropColumn 単体
-            for drop in re.finditer(r'dropColumn\(\s*[\'"](\w+)[\'"]\s*\)', body):
-                ops.append({'action': 'drop', 'name': drop.group(1), 'type': 'drop'})
-
-            # dropColumn 配列
-            for drop_arr in re.finditer(r'dropColumn\(\s*\[\s*([^\]]+)\]\s*\)', body):
-                names_str = drop_arr.group(1)
-                for name in re.findall(r'[\'"](\w+)[\'"]', names_str):
-                    ops.append({'action': 'drop', 'name': name, 'type': 'drop'})
+            ops_append = ops.append
+
+            # 追加・削除をソース上の記述順に並べる
+            for op in _RE_MIGRATION_OP.finditer(body):
+                group = op.group
+                kind = op.lastgroup
+                if kind == 'col_name':
+                    # 追加カラム $table->string('name') / index/unique/primary (単一カラム)
+                    col_type = intern(group('col_type'))
+                    if col_type not in _SKIPPED_MIGRATION_TYPES:
+                        ops_append({'action': 'add', 'name': group('col_name'), 'type': col_type})
+                elif kind == 'id_name':
+                    # id / increments 系
+                    ops_append({'action': 'add', 'name': group('id_name') or 'id', 'type': intern(group('id_type'))})
+                elif kind == 'stamp':
+                    # timestamps / softDeletes
+                    if group('stamp') == 'timestamps':
+                        ops_append({'action': 'add', 'name': 'created_at', 'type': 'timestamp'})
+                        ops_append({'action': 'add', 'name': 'updated_at', 'type': 'timestamp'})
+                    else:
+                        ops_append({'action': 'add', 'name': 'deleted_at', 'type': 'timestamp'})
+                elif kind == 'fk_chain':
+                    # 外部キー詳細 ($table->foreign('user_id')->references('id')->on('users')->onDelete('cascade');)
+                    chain = group('fk_chain')
+                    ref = _RE_FK_REFERENCES.search(chain)
+                    on = _RE_FK_ON.search(chain)
+                    on_delete = _RE_FK_ON_DELETE.search(chain)
+                    on_update = _RE_FK_ON_UPDATE.search(chain)
+                    ops_append({
+                        'action': 'add',
+                        'name': group('fk_col'),
+                        'type': 'foreign',
+                        'references': ref.group(1) if ref else None,
+                        'on': on.group(1) if on else None,
+                        'on_delete': on_delete.group(1) if on_delete else None,
+                        'on_update': on_update.group(1) if on_update else None,
+                    })
+                elif kind == 'drop':
+                    # dropColumn 単体
+                    ops_append({'action': 'drop', 'name': group('drop'), 'type': 'drop'})
+                else:
+                    # dropColumn 配列
+                    for name in _RE_QUOTED_NAME.findall(group('drops')):
+                        ops_append({'action': 'drop', 'name': name, 'type': 'drop'})
 
             yield table_name, ops
 
@@ -586,27 +1050,27 @@ class LaravelParser:
         if not kernel_file.exists():
             return {}
 
-        content = kernel_file.read_text(encoding='utf-8')
+        content = _read_source(kernel_file)
         result: Dict[str, Any] = {'global': [], 'groups': {}, 'route': {}}
 
         # global middleware
-        global_match = re.search(r'\$middleware\s*=\s*\[(.*?)\];', content, re.DOTALL)
+        global_match = _RE_KERNEL_MIDDLEWARE.search(content)
         if global_match:
-            result['global'] = [m.strip().strip('\'"') for m in global_match.group(1).split(',') if m.strip()]
+            result['global'] = _split_names(global_match.group(1))
 
         # groups
-        groups_match = re.search(r'\$middlewareGroups\s*=\s*\[(.*?)\];', content, re.DOTALL)
+        groups_match = _RE_KERNEL_GROUPS.search(content)
         if groups_match:
             groups_body = groups_match.group(1)
-            for group_match in re.finditer(r'[\'"](\w+)[\'"]\s*=>\s*\[(.*?)\]', groups_body, re.DOTALL):
+            for group_match in _RE_KERNEL_GROUP.finditer(groups_body):
                 name = group_match.group(1)
-                middlewares = [m.strip().strip('\'"') for m in group_match.group(2).split(',') if m.strip()]
+                middlewares = _split_names(group_match.group(2))
                 result['groups'][name] = middlewares
 
         # route middleware
-        route_match = re.search(r'\$routeMiddleware\s*=\s*\[(.*?)\];', content, re.DOTALL)
+        route_match = _RE_KERNEL_ROUTE_MIDDLEWARE.search(content)
         if route_match:
-            for rm in re.finditer(r'[\'"](\w+)[\'"]\s*=>\s*[\'"]([^\'"]+)[\'"]', route_match.group(1)):
+            for rm in _RE_RULE.finditer(route_match.group(1)):
                 result['route'][rm.group(1)] = rm.group(2)
 
         return result
@@ -615,8 +1079,8 @@ class LaravelParser:
         """Lighthouse の GraphQLエンドポイントを config から推測（デフォルト /graphql）"""
         config_file = self.project_root / 'config' / 'lighthouse.php'
         if config_file.exists():
-            content = config_file.read_text(encoding='utf-8')
-            match = re.search(r'\'route\'\s*=>\s*[\'"]([^\'"]+)[\'"]', content)
+            content = _read_source(config_file)
+            match = _RE_LIGHTHOUSE_ROUTE.search(content)
             if match:
                 return match.group(1)
         return '/graphql'
@@ -628,26 +1092,18 @@ class LaravelParser:
         Returns:
             サービス情報のリスト
         """
-        services = []
-
         services_dir = self.project_root / 'app' / 'Services'
         if not services_dir.exists():
-            return services
-
-        for php_file in services_dir.rglob('*.php'):
-            service_info = self._parse_service_file(php_file)
-            if service_info:
-                services.append(service_info)
+            return []
 
-        return services
+        return self._parse_each(self._parse_service_file, self._list_files(services_dir, recursive=True))
 
     def _parse_service_file(self, file_path: Path) -> Dict:
         """単一のServiceファイルを解析"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _read_source(file_path)
 
         # クラス名抽出
-        class_match = re.search(r'class\s+(\w+)', content)
+        class_match = _RE_CLASS.search(content)
         if not class_match:
             return None
 
@@ -655,8 +1111,7 @@ class LaravelParser:
 
         # publicメソッド抽出
         methods = []
-        method_pattern = r'public\s+(?:static\s+)?function\s+(\w+)\s*\(([^)]*)\)'
-        for match in re.finditer(method_pattern, content):
+        for match in _RE_SERVICE_METHOD.finditer(content):
             method_name = match.group(1)
             if not method_name.startswith('__'):
                 params = match.group(2).strip()
@@ -665,76 +1120,36 @@ class LaravelParser:
                     'parameters': params if params else None,
                 })
 
-        logic_notes = self._summarize_todo_query_builder(content, class_name)
+        logic_notes = _summarize_todo_query_builder(content)
 
         return {
             'class_name': class_name,
-            'file_path': str(file_path.relative_to(self.project_root)),
+            'file_path': self._relative_path(file_path),
             'methods': methods,
             'raw_content': content,
             'logic_notes': logic_notes,
         }
 
-    def _summarize_todo_query_builder(self, content: str, class_name: str) -> List[str]:
-        """
-        TodoQueryBuilder のようなクエリビルダ系のフィルタ/ソートロジックを簡易要約
-        いまはキーワード検出ベースで汎用性は低めだが、仕様書向けの手がかりを出す
-        """
-        notes: List[str] = []
-        if 'deadline_status' in content:
-            notes.append("deadline_status で期限状態をフィルタ（overdue/due_today/due_this_week）")
-        if 'completed' in content:
-            notes.append("completed が null でない場合のみ完了フラグで絞り込み")
-        if 'priority' in content:
-            notes.append("priority が指定されれば優先度で絞り込み（high/medium/low）")
-        if 'category_id' in content:
-            notes.append("category_id が指定されればカテゴリで絞り込み")
-        if 'sort_by' in content or 'sort_direction' in content:
-            notes.append("sort_by/sort_direction に従って並び替え。priorityはカスタム順、deadlineはNULLを末尾")
-        return notes
-
     def parse_middleware(self) -> List[Dict]:
         """Middlewareを解析"""
-        middleware = []
-
-        middleware_dir = self.project_root / 'app' / 'Http' / 'Middleware'
-        if not middleware_dir.exists():
-            return middleware
-
-        for php_file in middleware_dir.glob('*.php'):
-            with open(php_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            class_match = re.search(r'class\s+(\w+)', content)
-            if class_match:
-                middleware.append({
-                    'class_name': class_match.group(1),
-                    'file_path': str(php_file.relative_to(self.project_root)),
-                })
-
-        return middleware
+        return self._parse_simple_class_dir('middleware')
 
     def parse_requests(self) -> List[Dict]:
         """Form Requestsを解析"""
-        requests = []
-
         requests_dir = self.project_root / 'app' / 'Http' / 'Requests'
         if not requests_dir.exists():
-            return requests
-
-        for php_file in requests_dir.rglob('*.php'):
-            request_info = self._parse_request_file(php_file)
-            if request_info:
-                requests.append(request_info)
+            return []
 
-        return requests
+        return self._parse_each(self._parse_request_file, self._list_files(requests_dir, recursive=True))
 
     def _parse_request_file(self, file_path: Path) -> Dict:
         """単一のForm Requestファイルを解析"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _read_source(file_path)
+
+        if 'FormRequest' not in content:
+            return None
 
-        class_match = re.search(r'class\s+(\w+)\s+extends\s+FormRequest', content)
+        class_match = _RE_REQUEST_CLASS.search(content)
         if not class_match:
             return None
 
@@ -742,12 +1157,11 @@ class LaravelParser:
 
         # rulesメソッド内のバリデーションルール抽出（簡易版）
         rules = []
-        rules_match = re.search(r'public\s+function\s+rules\s*\(\s*\)\s*:\s*array\s*\{(.*?)\}', content, re.DOTALL)
+        rules_match = _RE_REQUEST_RULES.search(content)
         if rules_match:
             rules_content = rules_match.group(1)
             # 'field' => 'required|...' パターン
-            rule_pattern = r'[\'"](\w+)[\'"]\s*=>\s*[\'"]([^\'"]+)[\'"]'
-            for match in re.finditer(rule_pattern, rules_content):
+            for match in _RE_RULE.finditer(rules_content):
                 field = match.group(1)
                 validation = match.group(2)
                 rules.append({
@@ -757,102 +1171,107 @@ class LaravelParser:
 
         return {
             'class_name': class_name,
-            'file_path': str(file_path.relative_to(self.project_root)),
+            'file_path': self._relative_path(file_path),
             'rules': rules,
         }
 
     def parse_policies(self) -> List[Dict]:
         """Policiesを解析"""
-        policies = []
-
         policies_dir = self.project_root / 'app' / 'Policies'
         if not policies_dir.exists():
-            return policies
-
-        for php_file in policies_dir.glob('*.php'):
-            with open(php_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            class_match = re.search(r'class\s+(\w+)', content)
-            if class_match:
-                # メソッド抽出（view, create, update, delete など）
-                methods = []
-                method_pattern = r'public\s+function\s+(\w+)\s*\('
-                for match in re.finditer(method_pattern, content):
-                    method_name = match.group(1)
-                    if not method_name.startswith('__'):
-                        methods.append(method_name)
-
-                policies.append({
-                    'class_name': class_match.group(1),
-                    'file_path': str(php_file.relative_to(self.project_root)),
-                    'methods': methods,
-                })
+            return []
 
-        return policies
+        return self._parse_each(self._parse_policy_file, self._list_files(policies_dir))
+
+    def _parse_policy_file(self, file_path: Path) -> Dict:
+        """単一のPolicyファイルを解析"""
+        with _read_source_bytes(file_path) as data:
+            class_match = _search_class(data)
+            if not class_match:
+                return None
+            # メソッド抽出（view, create, update, delete など）
+            methods = []
+            for match in _RE_POLICY_METHOD_BYTES.finditer(data):
+                method_name = match.group(1).decode()
+                if not method_name.startswith('__'):
+                    methods.append(method_name)
+            class_name = class_match.group(1).decode()
 
-    def parse_jobs(self) -> List[Dict]:
-        """Jobsを解析"""
-        jobs = []
+        return {
+            'class_name': class_name,
+            'file_path': self._relative_path(file_path),
+            'methods': methods,
+        }
 
-        jobs_dir = self.project_root / 'app' / 'Jobs'
-        if not jobs_dir.exists():
-            return jobs
+    def _simple_class_files(self, key: str) -> List[Path]:
+        """_SIMPLE_CLASS_DIRS[key] のディレクトリ内のPHPファイル一覧（ディレクトリが無ければ空）"""
+        parts, recursive = _SIMPLE_CLASS_DIRS[key]
+        directory = self.project_root.joinpath('app', *parts)
+        if not directory.exists():
+            return []
+        return self._list_files(directory, recursive=recursive)
 
-        for php_file in jobs_dir.rglob('*.php'):
-            with open(php_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+    def _parse_simple_class_dir(self, key: str, executor: ThreadPoolExecutor = None) -> List[Dict]:
+        """
+        クラス名だけを拾うディレクトリ（Middleware/Jobs/Events/Listeners）を解析
 
-            class_match = re.search(r'class\s+(\w+)', content)
-            if class_match:
-                jobs.append({
-                    'class_name': class_match.group(1),
-                    'file_path': str(php_file.relative_to(self.project_root)),
-                })
+        Args:
+            key: _SIMPLE_CLASS_DIRS のキー
+            executor: 使い回すスレッドプール
 
-        return jobs
+        Returns:
+            {'class_name', 'file_path'} のリスト
+        """
+        return self._parse_each(self._scan_class_file, self._simple_class_files(key), executor)
 
-    def parse_events(self) -> List[Dict]:
-        """Eventsを解析"""
-        events = []
+    def iter_simple_classes(self, key: str) -> Iterator[Dict]:
+        """
+        クラス名だけを拾うディレクトリ（Middleware/Jobs/Events/Listeners）の解析結果を1件ずつ返す
 
-        events_dir = self.project_root / 'app' / 'Events'
-        if not events_dir.exists():
-            return events
+        全件をリストに溜めずに順次処理したい呼び出し側向け。parse_jobs などはこれをリストにしたもの。
 
-        for php_file in events_dir.glob('*.php'):
-            with open(php_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+        Args:
+            key: 'middleware' / 'jobs' / 'events' / 'listeners'
 
-            class_match = re.search(r'class\s+(\w+)', content)
-            if class_match:
-                events.append({
-                    'class_name': class_match.group(1),
-                    'file_path': str(php_file.relative_to(self.project_root)),
-                })
+        Yields:
+            {'class_name', 'file_path'}
+        """
+        return self._iter_each(self._scan_class_file, self._simple_class_files(key))
 
-        return events
+    def parse_all_simple(self) -> Dict[str, List[Dict]]:
+        """
+        Middleware/Jobs/Events/Listeners をまとめて解析（1つのスレッドプールを共有する）
 
-    def parse_listeners(self) -> List[Dict]:
-        """Listenersを解析"""
-        listeners = []
+        parse_all の中から呼ばれた場合は parse_all の共有プールを使う
 
-        listeners_dir = self.project_root / 'app' / 'Listeners'
-        if not listeners_dir.exists():
-            return listeners
+        Returns:
+            キー（middleware, jobs, events, listeners） -> クラス情報のリスト
+        """
+        with self._shared_file_executor() as executor:
+            return {key: self._parse_simple_class_dir(key, executor) for key in _SIMPLE_CLASS_DIRS}
 
-        for php_file in listeners_dir.glob('*.php'):
-            with open(php_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+    def _scan_class_file(self, file_path: Path) -> Dict:
+        """単一のPHPファイルからクラス名だけを抽出"""
+        class_name = _find_class_name(file_path)
+        if not class_name:
+            return None
 
-            class_match = re.search(r'class\s+(\w+)', content)
-            if class_match:
-                listeners.append({
-                    'class_name': class_match.group(1),
-                    'file_path': str(php_file.relative_to(self.project_root)),
-                })
+        return {
+            'class_name': class_name,
+            'file_path': self._relative_path(file_path),
+        }
+
+    def parse_jobs(self) -> List[Dict]:
+        """Jobsを解析"""
+        return self._parse_simple_class_dir('jobs')
+
+    def parse_events(self) -> List[Dict]:
+        """Eventsを解析"""
+        return self._parse_simple_class_dir('events')
 
-        return listeners
+    def parse_listeners(self) -> List[Dict]:
+        """Listenersを解析"""
+        return self._parse_simple_class_dir('listeners')
 
     def parse_files(self, file_paths: List[str]) -> Dict[str, Any]:
         """
@@ -864,31 +1283,26 @@ class LaravelParser:
         Returns:
             解析結果の辞書
         """
-        result = {
-            'models': [],
-            'graphql_schemas': {},
-            'graphql_resolvers': {'queries': [], 'mutations': []},
-        }
-
+        # 入力を1回だけ走査して種類ごとに振り分ける（入力文字列のまま判定し、Path は振り分け後に作る）
+        # ディレクトリ名は末尾の / まで含めて照合し、app/ModelsBackup のような別ディレクトリを拾わない
+        model_files: List[Path] = []
+        schema_files: List[Path] = []
+        queries: List[str] = []
+        mutations: List[str] = []
         for file_path_str in file_paths:
-            file_path = Path(file_path_str)
-
-            # Modelファイル
-            if 'app/Models' in str(file_path) and file_path.suffix == '.php':
-                model_info = self._parse_model_file(file_path)
-                if model_info:
-                    result['models'].append(model_info)
-
-            # GraphQLスキーマ
-            elif file_path.suffix == '.graphql':
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    result['graphql_schemas'][str(file_path)] = f.read()
-
-            # GraphQL Resolver
-            elif 'app/GraphQL' in str(file_path) and file_path.suffix == '.php':
-                if 'Queries' in str(file_path):
-                    result['graphql_resolvers']['queries'].append(str(file_path))
-                elif 'Mutations' in str(file_path):
-                    result['graphql_resolvers']['mutations'].append(str(file_path))
+            path_str = str(file_path_str)
+            if path_str.endswith('.graphql'):
+                schema_files.append(Path(path_str))
+            elif path_str.endswith('.php'):
+                if 'app/Models/' in path_str:
+                    model_files.append(Path(path_str))
+                elif 'app/GraphQL/Queries/' in path_str:
+                    queries.append(str(Path(path_str)))
+                elif 'app/GraphQL/Mutations/' in path_str:
+                    mutations.append(str(Path(path_str)))
 
-        return result
+        return {
+            'models': self._parse_each(self._parse_model_file, model_files),
+            'graphql_schemas': {str(path): _read_source(path) for path in schema_files},
+            'graphql_resolvers': {'queries': queries, 'mutations': mutations},
+        }